@@ -0,0 +1,95 @@
+"""JSON sözlük ile ikili SSTable biçiminin yükleme süresi ve bellek (RSS) karşılaştırması.
+
+Her ölçüm ayrı bir süreçte yapılır, böylece RSS değerleri birbirini etkilemez.
+
+    python benchmarks/bench_binary_format.py
+    python benchmarks/bench_binary_format.py --sizes 10000,100000 --lookups 5000
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from common import rss_mb, synthetic_entries
+
+from dictionary_core import SSTable, fold_word, write_sstable
+from dictionary_core.storage import atomic_write_json
+
+
+def child(mode, path, lookups):
+    """Bir biçimi yükle, rastgele kelimeler ara ve sonuçları JSON olarak yazdır"""
+    base_rss = rss_mb()
+    started = time.perf_counter()
+    if mode == "json":
+        with open(path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+        index = {}
+        for entry in entries:
+            index.setdefault(fold_word(entry['word'], 'en'), entry['meaning'])
+        words = [entry['word'] for entry in entries]
+        lookup = lambda word: index.get(fold_word(word, 'en'))  # noqa: E731
+    else:
+        table = SSTable(path)
+        words = None
+        lookup = table.get
+    load_time = time.perf_counter() - started
+    load_rss = rss_mb() - base_rss
+
+    if words is None:
+        words = [entry['word'] for entry in _sample(table, lookups)]
+    rng = random.Random(1)
+    queries = [rng.choice(words) for _ in range(lookups)]
+    started = time.perf_counter()
+    for word in queries:
+        if lookup(word) is None:
+            raise SystemExit(f"bulunamadı: {word}")
+    lookup_time = time.perf_counter() - started
+    print(json.dumps({'load_s': load_time, 'load_rss_mb': load_rss, 'lookup_us': lookup_time / lookups * 1e6,
+                      'total_rss_mb': rss_mb() - base_rss}))
+
+
+def _sample(table, count):
+    """SSTable'dan (hepsini çözmeden) rastgele kayıtlar seç"""
+    rng = random.Random(2)
+    return [table._record_at(rng.randrange(len(table))) for _ in range(min(count, len(table)))]
+
+
+def run_child(mode, path, lookups):
+    output = subprocess.run([sys.executable, __file__, "--child", mode, path, "--lookups", str(lookups)],
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--lookups", type=int, default=1000)
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.child[0], args.child[1], args.lookups)
+        return
+
+    print(f"{'kayıt':>9} {'biçim':>6} {'boyut MB':>9} {'yükleme ms':>11} {'RSS MB':>8} {'arama µs':>9} {'toplam RSS MB':>14}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in (int(size) for size in args.sizes.split(",")):
+            entries = synthetic_entries(size)
+            json_path = os.path.join(directory, f"dict_{size}.json")
+            sst_path = os.path.join(directory, f"dict_{size}.sst")
+            atomic_write_json(json_path, entries)
+            write_sstable(sst_path, entries, 'en')
+            del entries
+            for mode, path in (("json", json_path), ("sst", sst_path)):
+                result = run_child(mode, path, args.lookups)
+                print(f"{size:>9} {mode:>6} {os.path.getsize(path) / 1e6:>9.1f} {result['load_s'] * 1000:>11.1f} "
+                      f"{result['load_rss_mb']:>8.1f} {result['lookup_us']:>9.2f} {result['total_rss_mb']:>14.1f}",
+                      flush=True)
+
+
+if __name__ == "__main__":
+    main()
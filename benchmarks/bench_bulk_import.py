@@ -0,0 +1,109 @@
+"""Toplu içe aktarmanın biçim başına hızı (satır/sn): ayrıştırma, tekilleştirme ve tek atomik yazma.
+
+Mevcut bir sözlüğün üzerine, bir kısmı sözlükte zaten olan (yarısı farklı anlamla, yani
+çakışan) ve bir kısmı dosyada tekrar eden satırlardan oluşan CSV, JSONL ve Anki dosyaları
+üretilir. Karşılaştırma için satır satır upsert (açılır penceredeki Save'in yaptığı) de
+küçük bir örnekle ölçülür.
+
+    python benchmarks/bench_bulk_import.py
+    python benchmarks/bench_bulk_import.py --rows 3000000 --existing 200000 --formats csv
+"""
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from common import rss_mb, synthetic_entries, synthetic_word
+
+from dictionary_core import LocalDictionary, dict_path
+from dictionary_core.bulk import export_rows, import_rows, iter_file
+from dictionary_core.storage import atomic_write_json
+
+EXTENSIONS = {'csv': ".csv", 'tsv': ".tsv", 'jsonl': ".jsonl", 'anki': ".txt"}
+
+
+def import_file_rows(entries, count, seed=0):
+    """count satırlık içe aktarma verisi: %10 mevcut kelime (yarısı farklı anlamla), %5 dosya içi tekrar"""
+    rng = random.Random(seed)
+    prefixes = [synthetic_word(rng, 'en', 3, 6) for _ in range(5000)]
+    produced = []
+    for i in range(count):
+        roll = rng.random()
+        if roll < 0.10 and entries:
+            entry = rng.choice(entries)
+            meaning = entry['meaning'] if roll < 0.05 else entry['meaning'] + " ب"
+            row = (entry['word'], meaning)
+        elif roll < 0.15 and produced:
+            row = rng.choice(produced)
+        else:
+            row = (f"{rng.choice(prefixes)}{i:x}", "كلمة جديدة")
+            if len(produced) < 10000:
+                produced.append(row)
+        yield row
+
+
+def prepare_store(template, directory):
+    """Şablon sözlüğün kopyasıyla boş günlüklü yeni bir LocalDictionary döndür"""
+    path = dict_path('en', directory)
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory)
+    shutil.copyfile(template, path)
+    store = LocalDictionary('en', path)
+    store.load()
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000, help="içe aktarma dosyasındaki satır sayısı")
+    parser.add_argument("--existing", type=int, default=100000, help="sözlükte önceden bulunan kayıt sayısı")
+    parser.add_argument("--formats", default="csv,jsonl,anki")
+    parser.add_argument("--naive", type=int, default=2000, help="satır satır upsert ile ölçülecek satır sayısı")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        entries = synthetic_entries(args.existing)
+        template = os.path.join(directory, "template.json")
+        atomic_write_json(template, entries)
+
+        print(f"{'biçim':>6} {'satır':>9} {'MB':>7} {'ayrıştırma sn':>14} {'satır/sn':>10} "
+              f"{'içe aktarma sn':>15} {'satır/sn':>10} {'sıkıştırma sn':>14} {'RSS MB':>7}  rapor")
+        for fmt in args.formats.split(","):
+            source = os.path.join(directory, f"import{EXTENSIONS[fmt]}")
+            export_rows(import_file_rows(entries, args.rows), source, fmt)
+
+            started = time.perf_counter()
+            parsed = sum(1 for _ in iter_file(source, fmt))
+            parse_time = time.perf_counter() - started
+
+            store = prepare_store(template, os.path.join(directory, "data"))
+            base_rss = rss_mb()
+            report = import_rows(store, iter_file(source, fmt))
+            rss = rss_mb() - base_rss
+            started = time.perf_counter()
+            store.compact()
+            compact_time = time.perf_counter() - started
+            assert len(store) == args.existing + report.added
+            print(f"{fmt:>6} {parsed:>9} {os.path.getsize(source) / 1e6:>7.1f} {parse_time:>14.2f} "
+                  f"{parsed / parse_time:>10,.0f} {report.seconds:>15.2f} {report.rows_per_second:>10,.0f} "
+                  f"{compact_time:>14.2f} {rss:>7.0f}  {report.summary()}", flush=True)
+            del store, report
+            os.remove(source)
+
+        if args.naive:
+            store = prepare_store(template, os.path.join(directory, "data"))
+            rows = list(import_file_rows(entries, args.naive, seed=1))
+            started = time.perf_counter()
+            for word, meaning in rows:
+                if store.lookup(word) is None:
+                    store.upsert(word, meaning)
+            elapsed = time.perf_counter() - started
+            print(f"\nsatır satır upsert: {args.naive} satır {elapsed:.2f} sn, {args.naive / elapsed:,.0f} satır/sn "
+                  f"({args.rows} satır için tahmini {args.rows / args.naive * elapsed:,.0f} sn)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Ölçüm betikleri için ortak yardımcılar: sentetik sözlükler, zamanlama ve bellek ölçümü"""
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+_LETTERS = {
+    'en': "abcdefghijklmnopqrstuvwxyz",
+    'tr': "abcçdefgğhıijklmnoöprsştuüvyz",
+}
+_ARABIC = "ابتثجحخدذرزسشصضطظعغفقكلمنهويةءأإآى"
+_HARAKAT = "َُِّْ"
+
+
+def arabic_phrase(rng):
+    """Bir-üç kelimelik, ara sıra harekeli Arapça anlam üret"""
+    words = []
+    for _ in range(rng.randint(1, 3)):
+        word = "".join(rng.choice(_ARABIC) for _ in range(rng.randint(3, 7)))
+        if rng.random() < 0.2:
+            word = word[0] + rng.choice(_HARAKAT) + word[1:]
+        words.append(word)
+    return " ".join(words)
+
+
+def synthetic_word(rng, language='en', min_len=4, max_len=12):
+    return "".join(rng.choice(_LETTERS[language]) for _ in range(rng.randint(min_len, max_len))).capitalize()
+
+
+def synthetic_entries(count, language='en', seed=0):
+    """Benzersiz kelimeli {'word', 'meaning'} kayıtları üret (aynı seed aynı veriyi verir).
+
+    Kayıtların küçük bir kısmının anlamı Latin harfli veya boştur; böylece karışık yazı
+    ve eksik anlam yolları da ölçülür.
+    """
+    rng = random.Random(f"{language}:{seed}")
+    seen = set()
+    entries = []
+    while len(entries) < count:
+        word = synthetic_word(rng, language)
+        if word.lower() in seen:
+            continue
+        seen.add(word.lower())
+        roll = rng.random()
+        if roll < 0.02:
+            meaning = ""
+        elif roll < 0.05:
+            meaning = synthetic_word(rng, language) + " " + arabic_phrase(rng)
+        else:
+            meaning = arabic_phrase(rng)
+        entries.append({'word': word, 'meaning': meaning})
+    return entries
+
+
+def write_dictionaries(data_dir, size, languages=('en', 'tr')):
+    """data_dir içine dict_{dil}.json dosyalarını yaz; {dil: kayıtlar} döndür"""
+    from dictionary_core.storage import atomic_write_json, dict_path
+
+    generated = {}
+    for language in languages:
+        entries = synthetic_entries(size, language)
+        atomic_write_json(dict_path(language, data_dir), entries)
+        generated[language] = entries
+    return generated
+
+
+def use_data_dir(data_dir):
+    """Çekirdeğin varsayılan veri klasörünü değiştir (GUI kodu varsayılanı kullanır)"""
+    import dictionary_core.storage
+    dictionary_core.storage.DATA_DIR = data_dir
+
+
+def rss_mb():
+    """Sürecin şu anki RSS'i (MB); Linux dışında en yüksek RSS kullanılır"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except (OSError, ValueError, AttributeError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1e6 if sys.platform == "darwin" else peak / 1e3
+
+
+def measure(run, setup=None, repeat=3):
+    """run()'ı repeat kez zamanla, ardından bir kez tracemalloc altında çalıştır.
+
+    setup verilirse her çalıştırmadan önce çağrılır ve dönüşü run'a verilir (zamana
+    katılmaz). Dönen sözlük: en iyi/ortalama süre (s) ve en yüksek Python bellek
+    kullanımı (MB, tracemalloc; C uzantılarının ayırdıkları dahil değildir).
+    """
+    times = []
+    for _ in range(repeat):
+        state = setup() if setup else None
+        started = time.perf_counter()
+        run(state) if setup else run()
+        times.append(time.perf_counter() - started)
+
+    state = setup() if setup else None
+    tracemalloc.start()
+    try:
+        run(state) if setup else run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {'best_s': min(times), 'mean_s': sum(times) / len(times), 'peak_mb': peak / 1e6}
@@ -0,0 +1,323 @@
+"""Sıcak yollar için tekrarlanabilir ölçüm takımı.
+
+Sentetik EN/TR sözlükleri (Arapça anlamlı) farklı boyutlarda üretir, Qt'yi ekransız
+(offscreen) çalıştırır ve ağ yerine gecikmesi ayarlanabilen sahte çevirmen kullanır.
+Her işlem için en iyi/ortalama süreyi ve en yüksek Python bellek kullanımını raporlar.
+
+    python benchmarks/run_benchmarks.py --sizes 1000,10000
+    python benchmarks/run_benchmarks.py --save-baseline laptop
+    python benchmarks/run_benchmarks.py --compare laptop --threshold 0.2
+
+Sonuçlar benchmarks/baselines/<ad>.json olarak saklanır; --compare, süresi eşiğin
+üzerinde artan işlemleri REGRESYON olarak işaretler ve çıkış kodu 1 döndürür.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from common import ROOT, measure, rss_mb, synthetic_word, use_data_dir, write_dictionaries  # noqa: E402
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+LOOKUPS = 1000  # lookup.local için sorgu sayısı
+REMOTE_WORDS = 10  # lookup.remote için ağdan istenecek kelime sayısı
+SAVES = 100  # save_to_json için kaydedilecek kelime sayısı
+
+
+def wait_for(signal, timeout_ms=10000):
+    """Sinyal gelene (veya süre dolana) kadar Qt olay döngüsünü çalıştır"""
+    from PySide6.QtCore import QEventLoop, QTimer
+
+    loop = QEventLoop()
+    signal.connect(loop.quit)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec()
+    signal.disconnect(loop.quit)
+
+
+def spin_until(condition, timeout_s=60):
+    """condition() doğru olana kadar olay döngüsünü kısa turlarla çalıştır"""
+    from PySide6.QtCore import QEventLoop, QTimer
+
+    deadline = time.monotonic() + timeout_s
+    while not condition() and time.monotonic() < deadline:
+        loop = QEventLoop()
+        QTimer.singleShot(1, loop.quit)
+        loop.exec()
+
+
+class Bench:
+    """Tek bir boyut için veri klasörünü, uygulama penceresini ve işlemleri hazırlar"""
+
+    def __init__(self, app, size, latency, data_dir):
+        import final
+        from dictionary_core import FakeTranslatorBackend
+
+        self.final = final
+        self.size = size
+        self.data_dir = data_dir
+        self.entries = write_dictionaries(data_dir, size)
+        use_data_dir(data_dir)
+        self.window = final.DictionaryApp()
+        backend = FakeTranslatorBackend(latency=latency)
+        self.window.lookup_service.backend = backend
+        self.window.translation_service.backend = backend
+        self.rng = random.Random(size)
+
+    def close(self):
+        from PySide6.QtCore import QCoreApplication, QEvent
+
+        self.window.prefetcher.shutdown()
+        self.window.translation_service.pool.waitForDone()
+        self.window.lookup_service.cache.close()
+        self.window.deleteLater()
+        # Silinmeyi bekleyen pencereler yorumlayıcı kapanırken değil, burada yok edilsin
+        QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+    # --- İşlemler: her biri (run, setup) veya yalnızca run döndürür ---
+
+    def op_lookup_local(self):
+        service = self.window.lookup_service
+        words = [self.rng.choice(self.entries['en'])['word'] for _ in range(LOOKUPS)]
+        service.lookup_local(words[0], 'en')  # Sözlüğü yükle
+
+        def run():
+            for word in words:
+                service.lookup_local(word, 'en')
+        return run, None
+
+    def op_lookup_remote(self):
+        window = self.window
+
+        def setup():
+            return [synthetic_word(self.rng, 'en', 14, 16) for _ in range(REMOTE_WORDS)]
+
+        def run(words):
+            for word in words:
+                window.translation_service.request(word, 'en')
+                wait_for(window.translation_service.translated)
+        return run, setup
+
+    def op_fuzzy_build(self):
+        store = self.window.local_dictionary('en')
+
+        def setup():
+            store._fuzzy = None  # Bir sonraki suggest indeksi baştan kursun
+
+        def run(_):
+            store.suggest("")
+        return run, setup
+
+    def op_save_to_json(self):
+        from PySide6.QtWidgets import QMessageBox
+
+        window = self.window
+        window.local_dictionary('en').suggest("")  # Öneri indeksi ısınma sırasında kurulur
+
+        def setup():
+            return [(synthetic_word(self.rng, 'en', 13, 16), "كلمة") for _ in range(SAVES)]
+
+        def run(pairs):
+            # Benzer kelime uyarısı ölçümü bloklamasın (yalnızca bu işlem süresince)
+            with mock.patch.object(QMessageBox, 'question', return_value=QMessageBox.Yes):
+                for word, meaning in pairs:
+                    window.english_entry.setText(word)
+                    window.translation_entry.setText(meaning)
+                    window.save_to_json()
+            window.timer.stop()
+        return run, setup
+
+    def op_editor_load(self):
+        windows = []
+
+        def setup():
+            for editor in windows:
+                editor.deleteLater()
+            windows.clear()
+
+        def run(_):
+            windows.append(self.final.TableEditorWindow(self.window, 'en'))
+        return run, setup
+
+    def op_editor_index(self):
+        windows = []
+
+        def setup():
+            for editor in windows:
+                editor.deleteLater()
+            windows.clear()
+            windows.append(self.final.TableEditorWindow(self.window, 'en'))
+            return windows[0].model
+
+        def run(model):
+            spin_until(lambda: model._indexed_upto >= model._index_target)
+        return run, setup
+
+    def op_prepare_arabic_text(self):
+        from dictionary_core.pdf_export import REPORTLAB_AVAILABLE, ArabicShaper
+
+        if not REPORTLAB_AVAILABLE:
+            return None
+        meanings = [entry['meaning'] for entry in self.entries['en']]
+
+        def setup():
+            return ArabicShaper()  # Soğuk önbellek
+
+        def run(shaper):
+            try:
+                shaper.shape_batch(meanings)
+            finally:
+                shaper.shutdown_pool()
+        return run, setup
+
+    def op_export_pdf(self):
+        from dictionary_core.pdf_export import AMIRI_FONT_FILE, REPORTLAB_AVAILABLE, build_dictionary_pdf, register_arabic_font
+
+        if not REPORTLAB_AVAILABLE:
+            return None
+        font_name, _ = register_arabic_font(os.path.join(ROOT, AMIRI_FONT_FILE))
+        rows = [(entry['word'], entry['meaning']) for entry in self.entries['en']]
+        output = os.path.join(self.data_dir, "bench.pdf")
+
+        def run():
+            build_dictionary_pdf(output, 'en', iter(rows), font_name)
+        return run, None
+
+
+OPERATIONS = {
+    'lookup.local': (Bench.op_lookup_local, None),
+    'lookup.remote': (Bench.op_lookup_remote, None),
+    'fuzzy.build': (Bench.op_fuzzy_build, None),
+    'save_to_json': (Bench.op_save_to_json, None),
+    'editor.load': (Bench.op_editor_load, None),
+    'editor.index': (Bench.op_editor_index, None),
+    'prepare_arabic_text': (Bench.op_prepare_arabic_text, None),
+    'export_pdf': (Bench.op_export_pdf, 'pdf_max'),  # Büyük boyutlarda çok yavaş, sınırlı
+}
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_all(args):
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance() or QApplication([sys.argv[0]])
+    results = {}
+    for size in args.sizes:
+        data_dir = tempfile.mkdtemp(prefix=f"dict_bench_{size}_")
+        bench = Bench(app, size, args.latency, data_dir)
+        try:
+            for name, (factory, limit) in OPERATIONS.items():
+                if args.only and not any(pattern in name for pattern in args.only):
+                    continue
+                if limit and size > getattr(args, limit):
+                    continue
+                prepared = factory(bench)
+                if prepared is None:
+                    print(f"{name:<22} {size:>8}  atlandı (bağımlılık yok)")
+                    continue
+                run, setup = prepared
+                result = measure(run, setup, repeat=args.repeat)
+                result['rss_mb'] = rss_mb()
+                results[f"{name}@{size}"] = result
+                print(f"{name:<22} {size:>8}  {result['best_s'] * 1000:>10.2f} ms  "
+                      f"(ort. {result['mean_s'] * 1000:.2f} ms)  tepe {result['peak_mb']:.1f} MB", flush=True)
+        finally:
+            bench.close()
+            shutil.rmtree(data_dir, ignore_errors=True)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Sonuçları temel ölçümle karşılaştır; regresyon sayısını döndür"""
+    print(f"\nTemel ölçüm: {baseline.get('commit')} ({baseline.get('created')})")
+    regressions = 0
+    for key, result in results.items():
+        previous = baseline['results'].get(key)
+        if previous is None:
+            continue
+        ratio = result['best_s'] / previous['best_s'] if previous['best_s'] else 1.0
+        mark = ""
+        if ratio > 1 + threshold:
+            mark = "REGRESYON"
+            regressions += 1
+        elif ratio < 1 - threshold:
+            mark = "iyileşme"
+        print(f"{key:<32} {previous['best_s'] * 1000:>10.2f} -> {result['best_s'] * 1000:>10.2f} ms  "
+              f"{(ratio - 1) * 100:+6.1f}%  {mark}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000",
+                        type=lambda text: [int(size) for size in text.split(",")])
+    parser.add_argument("--latency", type=float, default=0.05, help="sahte çevirmen gecikmesi (s)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--pdf-max", type=int, default=10000, help="PDF dışa aktarmanın ölçüleceği en büyük boyut")
+    parser.add_argument("--only", action="append", help="yalnızca adı bu metni içeren işlemler (tekrarlanabilir)")
+    parser.add_argument("--save-baseline", metavar="AD", help="sonuçları baselines/AD.json olarak kaydet")
+    parser.add_argument("--compare", metavar="AD", help="sonuçları baselines/AD.json ile karşılaştır")
+    parser.add_argument("--threshold", type=float, default=0.2, help="regresyon eşiği (0.2 = %%20 yavaşlama)")
+    args = parser.parse_args()
+
+    results = run_all(args)
+    report = {
+        'commit': git_commit(),
+        'created': time.strftime("%Y-%m-%d %H:%M:%S"),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'settings': {'latency': args.latency, 'repeat': args.repeat},
+        'results': results,
+    }
+    if args.save_baseline:
+        from dictionary_core.storage import atomic_write_json
+        path = os.path.join(BASELINE_DIR, f"{args.save_baseline}.json")
+        atomic_write_json(path, report)
+        print(f"\nTemel ölçüm kaydedildi: {path}")
+    if args.compare:
+        with open(os.path.join(BASELINE_DIR, f"{args.compare}.json"), 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+def exit_status(run):
+    """run()'ı çalıştırıp çıkış kodunu döndür; hata ve sys.exit de koda çevrilir"""
+    try:
+        return run()
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    except BaseException:
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    status = exit_status(main)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    # PySide6 bazı sürümlerde yorumlayıcı kapanırken (GC sırasında) çöküyor; bu yüzden
+    # kapanış adımları atlanır, ama başarısız ölçümler dahil gerçek çıkış kodu döndürülür
+    os._exit(status)
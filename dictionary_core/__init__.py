@@ -0,0 +1,20 @@
+"""Sözlük uygulamasının Qt'den bağımsız çekirdeği: depolama, arama, çeviri ve PDF dışa aktarma.
+
+GUI (final.py) ve komut satırı (python -m dictionary_core) bu paketi kullanır.
+"""
+
+from .cadence import TypingCadence
+from .fuzzy import FuzzyIndex, edit_distance
+from .lexicon import Lexicon, arabic_terms
+from .lookup import LookupService
+from .metrics import Histogram, Metrics, metrics
+from .prefetch import SpeculativePrefetcher
+from .review import ReviewScheduler, ReviewState, ReviewStore, sm2
+from .search import SearchIndex
+from .sstable import SSTable, SSTableError, json_to_sstable, sstable_to_json, write_sstable
+from .storage import (APP_DIR, DATA_DIR, FileLock, LocalDictionary, atomic_write_bytes, atomic_write_json,
+                      data_path, dict_path)
+from .text import (Script, capitalize_word, classify_column, classify_script, fold_word,
+                   is_arabic_text, normalize_arabic, normalize_search_text)
+from .translation import (BatchCancelled, BatchTranslator, FakeTranslatorBackend, GoogleTranslateBackend,
+                          RateLimiter, TranslationCache, TranslatorBackend, remote_translate)
@@ -0,0 +1,305 @@
+"""Dosyalardan toplu kelime içe aktarma ve dosyalara dışa aktarma (CSV, TSV, JSONL, Anki)"""
+
+import csv
+import html
+import io
+import json
+import os
+import re
+import time
+from collections import namedtuple
+
+from .storage import atomic_write_bytes
+from .text import fold_word, is_arabic_text
+
+IMPORT_CHUNK = 10000  # Okuma, sözlükle karşılaştırma ve ilerleme bildirimi bu kadar satırlık gruplarla yapılır
+FORMATS = ('csv', 'tsv', 'jsonl', 'anki')
+CONFLICT_POLICIES = ('skip', 'replace')
+
+_EXTENSIONS = {'.csv': 'csv', '.tsv': 'tsv', '.tab': 'tsv', '.jsonl': 'jsonl', '.ndjson': 'jsonl', '.txt': 'anki'}
+_ANKI_SEPARATORS = {'tab': "\t", 'comma': ",", 'semicolon': ";", 'space': " ", 'pipe': "|", 'colon': ":"}
+_ANKI_META_COLUMNS = ('guid', 'notetype', 'deck', 'tags')
+_ANKI_HEADERS = ('separator', 'html') + _ANKI_META_COLUMNS
+_HTML_BREAK = re.compile(r"<br\s*/?>|</div>", re.IGNORECASE)
+_HTML_TAG = re.compile(r"<[^>]+>")
+_SOUND = re.compile(r"\[sound:[^\]]*\]")
+
+
+class ImportCancelled(Exception):
+    """İçe aktarma kullanıcı tarafından iptal edildi (sözlüğe hiçbir şey yazılmadı)"""
+
+
+# source: 'dictionary' (sözlükteki kayıtla) veya 'file' (dosyadaki önceki satırla) çakışma
+Conflict = namedtuple('Conflict', 'word current incoming source')
+
+
+def detect_format(path):
+    """Dosya uzantısından biçimi tahmin et (Anki düz metin dışa aktarımları .txt'dir)"""
+    return _EXTENSIONS.get(os.path.splitext(path)[1].lower(), 'csv')
+
+
+def iter_delimited(path, delimiter=None):
+    """CSV/TSV dosyasını satır satır okuyup (word, meaning) üret.
+
+    delimiter verilmezse .tsv/.tab uzantısı için sekme, diğerleri için virgül kullanılır.
+    İlk satır "word,meaning" başlığıysa atlanır.
+    """
+    if delimiter is None:
+        delimiter = "\t" if detect_format(path) == 'tsv' else ","
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        for line_no, row in enumerate(csv.reader(f, delimiter=delimiter)):
+            if not row:
+                continue
+            word = row[0].strip()
+            meaning = row[1].strip() if len(row) > 1 else ""
+            if line_no == 0 and word.lower() == "word" and meaning.lower() == "meaning":
+                continue
+            if word:
+                yield word, meaning
+
+
+def iter_jsonl(path):
+    """Her satırı {"word": ..., "meaning": ...} nesnesi veya [word, meaning] olan dosyayı oku"""
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                if isinstance(record, dict):
+                    word, meaning = record['word'], record.get('meaning', '')
+                else:
+                    word, meaning = record[0], record[1] if len(record) > 1 else ''
+                word, meaning = str(word).strip(), str(meaning or '').strip()
+            except (ValueError, KeyError, IndexError, TypeError) as e:
+                raise ValueError(f"{path}:{line_no}: geçersiz satır ({e})") from None
+            if word:
+                yield word, meaning
+
+
+def _anki_text(field, is_html):
+    if is_html:
+        field = _HTML_TAG.sub("", _HTML_BREAK.sub(" ", field))
+        field = html.unescape(field)
+    return " ".join(_SOUND.sub("", field).split())
+
+
+def iter_anki(path):
+    """Anki "Notes/Cards in Plain Text" dışa aktarımını oku.
+
+    Baştaki #separator, #html ve #guid/#notetype/#deck/#tags column başlıkları dikkate
+    alınır; kalan ilk iki alan kelime ve anlamdır. HTML ve [sound:...] etiketleri atılır.
+    Ön yüzü Arapça olan destelerde alanlar yer değiştirir.
+    """
+    delimiter, is_html, meta = "\t", True, set()
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        line_no = 0
+        while True:
+            position = f.tell()
+            line = f.readline()
+            name, colon, value = line[1:].rstrip("\r\n").partition(":")
+            if not (line.startswith("#") and colon and (name in _ANKI_HEADERS or name.endswith(' column'))):
+                f.seek(position)
+                break
+            line_no += 1
+            if name == 'separator':
+                delimiter = _ANKI_SEPARATORS.get(value.lower(), value[:1] or "\t")
+            elif name == 'html':
+                is_html = value.lower() == 'true'
+            elif name.endswith(' column') and name[:-len(' column')] in _ANKI_META_COLUMNS:
+                try:
+                    column = int(value)
+                except ValueError:
+                    column = 0
+                if column < 1:
+                    raise ValueError(f"{path}:{line_no}: geçersiz başlık ({line.strip()})")
+                meta.add(column - 1)
+        for row in csv.reader(f, delimiter=delimiter):
+            fields = [_anki_text(field, is_html) for i, field in enumerate(row) if i not in meta]
+            if not fields or not fields[0]:
+                continue
+            word, meaning = fields[0], fields[1] if len(fields) > 1 else ""
+            if is_arabic_text(word) and meaning and not is_arabic_text(meaning):
+                word, meaning = meaning, word
+            yield word, meaning
+
+
+def iter_file(path, fmt=None, delimiter=None):
+    """Biçime (verilmezse uzantıya) göre (word, meaning) satırlarını akış halinde üret"""
+    fmt = fmt or detect_format(path)
+    if fmt in ('csv', 'tsv'):
+        return iter_delimited(path, delimiter or ("\t" if fmt == 'tsv' else ","))
+    if fmt == 'jsonl':
+        return iter_jsonl(path)
+    if fmt == 'anki':
+        return iter_anki(path)
+    raise ValueError(f"Bilinmeyen biçim: {fmt}")
+
+
+def iter_chunks(rows, size=IMPORT_CHUNK):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class ImportReport:
+    """İçe aktarmanın sonucu: sayaçlar ve çakışma listesi"""
+
+    def __init__(self):
+        self.rows = 0  # Okunan satır
+        self.added = 0
+        self.updated = 0  # Anlamı değişen veya boş anlamı doldurulan kayıt
+        self.unchanged = 0  # Sözlükte aynısı olan kayıt
+        self.duplicates = 0  # Dosyada aynı anlamla tekrar eden satır
+        self.skipped = 0  # Dosyadaki anlamı yazılmayan çakışma (skip)
+        self.conflicts = []  # Conflict
+        self.seconds = 0.0
+
+    @property
+    def written(self):
+        return self.added + self.updated
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def accept_conflicts(self):
+        """skip ile atlanan sözlük çakışmalarında dosyadaki anlamı seç; yazılacak (kelime, anlam) listesini döndür"""
+        accepted = [(conflict.word, conflict.incoming) for conflict in self.conflicts
+                    if conflict.source == 'dictionary']
+        self.updated += len(accepted)
+        self.unchanged -= len(accepted)
+        self.skipped -= len(accepted)
+        return accepted
+
+    def summary(self):
+        return (f"{self.rows} satır okundu: {self.added} yeni, {self.updated} güncellenen, "
+                f"{self.unchanged} değişmeyen, {self.duplicates} tekrar, {len(self.conflicts)} çakışma "
+                f"({self.skipped} atlandı); {self.rows_per_second:,.0f} satır/sn")
+
+
+def plan_import(store, rows, on_conflict='skip', chunk_size=IMPORT_CHUNK, progress=None, is_cancelled=None):
+    """Satırları sözlükle tek geçişte karşılaştır; (yazılacak upsert'ler, ImportReport) döndür.
+
+    Satırlar chunk_size'lık gruplarla okunur ve her grup sözlüğün katlanmış kelime
+    indeksinde tek kilit alımıyla aranır. Aynı kelime dosyada birden çok kez geçerse
+    ilki (on_conflict='replace' ise sonuncusu) kullanılır. Sözlükte farklı anlamla kayıtlı
+    kelime için tek bir 'dictionary' çakışması, dosyadaki son farklı anlamla raporlanır;
+    'file' çakışmaları sözlükte olmayan kelimelerin dosya içi tekrarlarıdır. Boş anlam
+    mevcut anlamı silmez; sözlükteki boş anlam ise çakışma sayılmadan doldurulur.
+    progress(satır) ve is_cancelled() her gruptan sonra çağrılır; iptalde ImportCancelled
+    fırlatılır.
+    """
+    if on_conflict not in CONFLICT_POLICIES:
+        raise ValueError(f"Bilinmeyen çakışma politikası: {on_conflict}")
+    replace = on_conflict == 'replace'
+    language = store.language
+    report = ImportReport()
+    chosen = {}  # katlanmış kelime -> [kelime, anlam, sözlükteki anlam veya None, son çakışmanın sırası]
+    for chunk in iter_chunks(rows, chunk_size):
+        for (word, meaning), saved in zip(chunk, store.get_many(word for word, _ in chunk)):
+            key = fold_word(word, language)
+            current = chosen.get(key)
+            if current is not None and (not meaning or meaning == current[1] or (
+                    current[3] is not None and meaning == report.conflicts[current[3]].incoming)):
+                report.duplicates += 1
+                continue
+            if current is None:
+                if saved is None:
+                    chosen[key] = [word, meaning, None, None]
+                    continue
+                chosen[key] = current = [saved[0], saved[1], saved[1], None]
+                if not meaning or meaning == saved[1]:
+                    continue
+            if current[2]:
+                if meaning == current[2]:
+                    # replace: dosyadaki son anlam yine sözlüktekiyle aynı, çakışma kalmadı
+                    report.conflicts[current[3]] = None
+                    current[1], current[3] = meaning, None
+                    continue
+                # Sözlükte anlamı olan kelime için tek çakışma tutulur; dosyadaki daha yeni satır öncekinin yerini alır
+                conflict = Conflict(current[0], current[2], meaning, 'dictionary')
+                if current[3] is None:
+                    current[3] = len(report.conflicts)
+                    report.conflicts.append(conflict)
+                else:
+                    report.conflicts[current[3]] = conflict
+                if replace:
+                    current[1] = meaning
+                continue
+            if current[1]:
+                current[3] = len(report.conflicts)
+                report.conflicts.append(Conflict(word, current[1], meaning, 'file'))
+                if not replace:
+                    continue
+            current[1] = meaning
+        report.rows += len(chunk)
+        if progress is not None:
+            progress(report.rows)
+        if is_cancelled is not None and is_cancelled():
+            raise ImportCancelled()
+
+    report.conflicts = [conflict for conflict in report.conflicts if conflict is not None]
+    if not replace:
+        report.skipped = len(report.conflicts)  # Kelime başına tek sözlük çakışması, accept_conflicts ile tutarlı
+    upserts = []
+    for word, meaning, saved, _ in chosen.values():
+        if saved is None:
+            report.added += 1
+        elif meaning == saved:
+            report.unchanged += 1
+            continue
+        else:
+            report.updated += 1
+        upserts.append((word, meaning))
+    return upserts, report
+
+
+def import_rows(store, rows, on_conflict='skip', chunk_size=IMPORT_CHUNK, progress=None, dry_run=False,
+                is_cancelled=None):
+    """Satırları tekilleştirip sözlüğe tek atomik günlük satırıyla yaz; ImportReport döndür.
+
+    Yazma hep birlikte ya da hiç yapılır: yarıda kalan bir içe aktarma sözlükte iz bırakmaz.
+    dry_run yalnızca raporu üretir.
+    """
+    started = time.perf_counter()
+    upserts, report = plan_import(store, rows, on_conflict, chunk_size, progress, is_cancelled)
+    if upserts and not dry_run:
+        store.apply(upserts)
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def export_rows(rows, path, fmt=None):
+    """(word, meaning) satırlarını biçime göre dosyaya akış halinde, atomik olarak yaz; satır sayısını döndür"""
+    fmt = fmt or detect_format(path)
+    if fmt not in FORMATS:
+        raise ValueError(f"Bilinmeyen biçim: {fmt}")
+    count = 0
+
+    def write(f):
+        nonlocal count
+        text = io.TextIOWrapper(f, encoding='utf-8', newline='')
+        if fmt == 'jsonl':
+            for word, meaning in rows:
+                text.write(json.dumps({'word': word, 'meaning': meaning}, ensure_ascii=False) + "\n")
+                count += 1
+        else:
+            if fmt == 'anki':
+                text.write("#separator:tab\n#html:false\n")
+            writer = csv.writer(text, delimiter="," if fmt == 'csv' else "\t", lineterminator="\n")
+            if fmt != 'anki':
+                writer.writerow(("word", "meaning"))
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+        text.flush()
+        text.detach()  # Dosyayı kapatmak atomic_write_bytes'a kalır
+
+    atomic_write_bytes(path, write)
+    return count
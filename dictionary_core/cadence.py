@@ -0,0 +1,69 @@
+"""Kullanıcının yazma temposuna göre ayarlanan arama gecikmesi (debounce)"""
+
+import json
+
+from .storage import atomic_write_json
+
+
+class TypingCadence:
+    """Tuş vuruşları arasındaki süreleri üstel hareketli ortalamayla (EWMA) öğrenir.
+
+    Gecikme, TCP'nin yeniden iletim süresi gibi ortalama + K * sapma olarak hesaplanır ve
+    [MIN_DELAY, MAX_DELAY] aralığına sıkıştırılır: hızlı ve düzenli yazan kullanıcı için
+    arama daha erken başlar, düzensiz yazanlarda kelimenin ortasında başlamaz. PAUSE'dan
+    uzun aralar düşünme molasıdır ve tempoya katılmaz. Süreler saniyedir.
+    """
+
+    ALPHA = 0.2  # Ortalamanın öğrenme hızı
+    BETA = 0.25  # Sapmanın öğrenme hızı
+    K = 3.0
+    MIN_DELAY = 0.15
+    MAX_DELAY = 0.5  # Eski sabit gecikme
+    PAUSE = 1.0
+    DEFAULT_INTERVAL = 0.2
+
+    def __init__(self, mean=None, deviation=None):
+        self.mean = mean if mean is not None else self.DEFAULT_INTERVAL
+        self.deviation = deviation if deviation is not None else self.DEFAULT_INTERVAL / 2
+        self.samples = 0
+        self._last = None
+
+    def keystroke(self, now):
+        """Bir tuş vuruşunu kaydet (now: time.perf_counter() gibi monoton saat)"""
+        if self._last is not None:
+            interval = now - self._last
+            if 0 < interval < self.PAUSE:
+                self.deviation += self.BETA * (abs(interval - self.mean) - self.deviation)
+                self.mean += self.ALPHA * (interval - self.mean)
+                self.samples += 1
+        self._last = now
+
+    def interrupt(self):
+        """Yazım dizisini kes: sonraki tuş vuruşu aralık ölçmeden yeni bir dizi başlatır"""
+        self._last = None
+
+    def delay(self):
+        """Son tuştan aramaya kadar beklenecek süre"""
+        return min(self.MAX_DELAY, max(self.MIN_DELAY, self.mean + self.K * self.deviation))
+
+    def speculation_delay(self):
+        """Tahmini çevirinin başlaması için gereken kısa duraksama (olağan aralıktan biraz uzun)"""
+        return min(self.delay(), max(0.05, self.mean * 1.5))
+
+    def to_dict(self):
+        return {'mean': self.mean, 'deviation': self.deviation, 'samples': self.samples}
+
+    @classmethod
+    def load(cls, path):
+        """Kaydedilmiş tempoyu oku; dosya yoksa veya bozuksa varsayılanlarla başla"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            cadence = cls(float(data['mean']), float(data['deviation']))
+            cadence.samples = int(data.get('samples', 0))
+            return cadence
+        except (OSError, ValueError, KeyError, TypeError):
+            return cls()
+
+    def save(self, path):
+        atomic_write_json(path, self.to_dict())
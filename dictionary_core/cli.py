@@ -0,0 +1,217 @@
+"""Qt olmadan arama, içe aktarma ve PDF dışa aktarma için komut satırı arayüzü.
+
+Örnekler:
+    python -m dictionary_core lookup --lang en apple school
+    python -m dictionary_core reverse "مدرسة"
+    python -m dictionary_core pivot --from en --to tr school
+    python -m dictionary_core import words.tsv --lang tr
+    python -m dictionary_core import deck.txt --format anki --on-conflict replace
+    python -m dictionary_core export dict_en.jsonl --lang en
+    python -m dictionary_core export-pdf dictionary_en.pdf --lang en
+    python -m dictionary_core serve --port 8765
+    python -m dictionary_core convert dict_en.json dict_en.sst --lang en
+"""
+
+import argparse
+import csv
+import sys
+
+from .bulk import CONFLICT_POLICIES, FORMATS, Conflict, export_rows, import_rows, iter_file
+from .lookup import LookupService
+from .metrics import metrics
+from .storage import data_path
+from .translation import FakeTranslatorBackend
+
+
+def _iter_words(words):
+    """Komut satırındaki kelimeleri, '-' için standart girdiyi satır satır üret"""
+    for word in words:
+        if word == "-":
+            for line in sys.stdin:
+                if line.strip():
+                    yield line.strip()
+        else:
+            yield word
+
+
+def cmd_lookup(service, args):
+    status = 0
+    for word in _iter_words(args.words):
+        try:
+            if args.offline:
+                meaning, source = service.lookup_local(word, args.lang)
+            else:
+                meaning, source = service.lookup(word, args.lang)
+        except Exception as e:
+            print(f"{word}\t\terror: {e}", file=sys.stderr)
+            status = 1
+            continue
+        print(f"{word}\t{meaning or ''}\t{source or 'not found'}", flush=True)
+        if meaning is None:
+            status = 1
+    return status
+
+
+def cmd_reverse(service, args):
+    status = 0
+    for text in _iter_words(args.texts):
+        results = service.reverse_lookup(text)
+        for language, words in results.items():
+            print(f"{text}\t{language}\t{', '.join(words)}", flush=True)
+        if not any(results.values()):
+            status = 1
+    return status
+
+
+def cmd_pivot(service, args):
+    status = 0
+    for word in _iter_words(args.words):
+        matches = service.pivot(word, args.src, args.dest)
+        print(f"{word}\t{', '.join(matches) or 'not found'}", flush=True)
+        if not matches:
+            status = 1
+    return status
+
+
+def cmd_import(service, args):
+    store = service.dictionary(args.lang)
+    rows = iter_file(args.file, args.format, args.delimiter)
+    try:
+        report = import_rows(store, rows, args.on_conflict, dry_run=args.dry_run,
+                             progress=lambda n: print(f"\r{n} satır", end="", file=sys.stderr))
+    except (OSError, ValueError) as e:
+        print(f"\nHata: {e}", file=sys.stderr)
+        return 1
+    if report.written and not args.dry_run:
+        store.compact()
+    print(f"\n{report.summary()}", file=sys.stderr)
+    if args.conflicts:
+        with open(args.conflicts, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, delimiter="\t", lineterminator="\n")
+            writer.writerow(Conflict._fields)
+            writer.writerows(report.conflicts)
+    else:
+        for conflict in report.conflicts[:10]:
+            print(f"çakışma: {conflict.word}\t{conflict.current} -> {conflict.incoming}", file=sys.stderr)
+    print(f"{'(deneme) ' if args.dry_run else ''}{report.written} kayıt yazıldı: {store.json_file}", file=sys.stderr)
+    return 0
+
+
+def cmd_export(service, args):
+    store = service.dictionary(args.lang)
+    count = export_rows(store.iter_rows(), args.output, args.format)
+    print(f"{count} kayıt yazıldı: {args.output}", file=sys.stderr)
+    return 0
+
+
+def cmd_export_pdf(service, args):
+    from .pdf_export import AMIRI_FONT_FILE, REPORTLAB_AVAILABLE, build_dictionary_pdf, register_arabic_font
+
+    if not REPORTLAB_AVAILABLE:
+        print("PDF dışa aktarma için 'reportlab', 'arabic-reshaper', 'python-bidi' gerekli.", file=sys.stderr)
+        return 2
+    font_name, font_warning = register_arabic_font(args.font or data_path(AMIRI_FONT_FILE, args.data_dir))
+    if font_warning:
+        print(font_warning, file=sys.stderr)
+    store = service.dictionary(args.lang)
+    total = len(store)
+    build_dictionary_pdf(args.output, args.lang, store.iter_rows(), font_name,
+                         progress=lambda n: print(f"\r{n}/{total}", end="", file=sys.stderr))
+    print(f"\nPDF kaydedildi: {args.output}", file=sys.stderr)
+    return 0
+
+
+def cmd_serve(service, args):
+    from .server import run_server
+
+    for language in ("en", "tr"):
+        print(f"{language}: {len(service.dictionary(language))} kelime", file=sys.stderr)
+    service.lexicon.warm()  # Ters arama indeksleri istek sırasında kurulmasın
+    run_server(service, args.host, args.port, args.max_upstream)
+    return 0
+
+
+def cmd_convert(service, args):
+    from .sstable import json_to_sstable, sstable_to_json
+
+    if args.source.lower().endswith(".json"):
+        count = json_to_sstable(args.source, args.target, args.lang)
+    else:
+        count = sstable_to_json(args.source, args.target)
+    print(f"{count} kayıt yazıldı: {args.target}", file=sys.stderr)
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m dictionary_core", description=__doc__.splitlines()[0])
+    parser.add_argument("--data-dir", help="sözlük dosyalarının bulunduğu klasör")
+    parser.add_argument("--fake-translator", action="store_true",
+                        help="ağa çıkmayan sahte çevirmeni kullan (test/ölçüm için)")
+    parser.add_argument("--metrics", metavar="JSON", help="süre ölçümlerini aç ve sonunda bu dosyaya yaz")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    lookup = sub.add_parser("lookup", help="kelimeleri ara (yerel sözlük, önbellek, sonra ağ)")
+    lookup.add_argument("words", nargs="+", help="aranacak kelimeler; '-' standart girdiden okur")
+    lookup.add_argument("--lang", choices=("en", "tr"), default="en")
+    lookup.add_argument("--offline", action="store_true", help="ağa çıkma")
+    lookup.set_defaults(func=cmd_lookup)
+
+    reverse = sub.add_parser("reverse", help="Arapça anlamdan kayıtlı EN/TR kelimeleri bul")
+    reverse.add_argument("texts", nargs="+", help="Arapça anlamlar; '-' standart girdiden okur")
+    reverse.set_defaults(func=cmd_reverse)
+
+    pivot = sub.add_parser("pivot", help="aynı Arapça anlamı paylaşan diğer dildeki kelimeleri bul")
+    pivot.add_argument("words", nargs="+", help="kelimeler; '-' standart girdiden okur")
+    pivot.add_argument("--from", dest="src", choices=("en", "tr"), default="en")
+    pivot.add_argument("--to", dest="dest", choices=("en", "tr"), default="tr")
+    pivot.set_defaults(func=cmd_pivot)
+
+    imp = sub.add_parser("import", help="CSV/TSV/JSONL/Anki dosyasından kelime içe aktar")
+    imp.add_argument("file")
+    imp.add_argument("--lang", choices=("en", "tr"), default="en")
+    imp.add_argument("--format", choices=FORMATS, help="dosya biçimi (varsayılan: uzantıya göre, .txt Anki)")
+    imp.add_argument("--delimiter", help="CSV/TSV alan ayracı (varsayılan: biçime göre)")
+    imp.add_argument("--on-conflict", choices=CONFLICT_POLICIES, default="skip",
+                     help="anlamı farklı mevcut kelimeler: skip korur, replace üzerine yazar")
+    imp.add_argument("--conflicts", metavar="TSV", help="tüm çakışmaları bu dosyaya yaz")
+    imp.add_argument("--dry-run", action="store_true", help="yazmadan yalnızca raporla")
+    imp.set_defaults(func=cmd_import)
+
+    exp = sub.add_parser("export", help="sözlüğü CSV/TSV/JSONL/Anki dosyasına aktar")
+    exp.add_argument("output")
+    exp.add_argument("--lang", choices=("en", "tr"), default="en")
+    exp.add_argument("--format", choices=FORMATS, help="dosya biçimi (varsayılan: uzantıya göre)")
+    exp.set_defaults(func=cmd_export)
+
+    export = sub.add_parser("export-pdf", help="sözlüğü PDF olarak dışa aktar")
+    export.add_argument("output")
+    export.add_argument("--lang", choices=("en", "tr"), default="en")
+    export.add_argument("--font", help="Amiri-Regular.ttf yolu (varsayılan: veri klasörü)")
+    export.set_defaults(func=cmd_export_pdf)
+
+    convert = sub.add_parser("convert", help="JSON sözlük ile ikili SSTable biçimi arasında dönüştür")
+    convert.add_argument("source", help=".json ise SSTable'a, değilse JSON'a dönüştürülür")
+    convert.add_argument("target")
+    convert.add_argument("--lang", choices=("en", "tr"), default="en")
+    convert.set_defaults(func=cmd_convert)
+
+    serve = sub.add_parser("serve", help="yerel HTTP/JSON arama sunucusunu başlat")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--max-upstream", type=int, default=4, help="aynı anda en fazla ağ çağrısı")
+    serve.set_defaults(func=cmd_serve)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    backend = FakeTranslatorBackend() if args.fake_translator else None
+    if args.metrics:
+        metrics.enabled = True
+    service = LookupService(args.data_dir, backend=backend)
+    try:
+        return args.func(service, args)
+    finally:
+        service.flush()
+        if args.metrics:
+            metrics.dump_json(args.metrics)
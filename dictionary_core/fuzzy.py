@@ -0,0 +1,130 @@
+"""Yazım hatalarına dayanıklı arama için silme (SymSpell) indeksi"""
+
+from .text import fold_word
+
+
+def edit_distance(a, b, max_distance):
+    """Sınırlı Damerau-Levenshtein (bitişik harf yer değiştirmesi dahil) uzaklığı.
+
+    Uzaklık max_distance'ı aşarsa max_distance + 1 döndürülür.
+    """
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    # Ortak önek ve sonek karşılaştırmaya katılmaz
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
+    if not a or not b:
+        return len(a) + len(b) if len(a) + len(b) <= max_distance else max_distance + 1
+
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        char_a = a[i - 1]
+        for j in range(1, len(b) + 1):
+            cost = 0 if char_a == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous_previous is not None and j > 1 and char_a == b[j - 2] and a[i - 2] == b[j - 1]):
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return previous[-1] if previous[-1] <= max_distance else max_distance + 1
+
+
+class FuzzyIndex:
+    """Kayıtlı kelimeler üzerinde yazım hatası toleranslı öneri indeksi (SymSpell).
+
+    Her kelime ve ondan bir harf silinerek elde edilen varyantlar önceden indekslenir.
+    Sorgudan en fazla iki harf silinerek üretilen varyantlar indekste aranır; ortak
+    varyantı olan kelimeler aday olur ve gerçek uzaklıkla doğrulanır. Böylece sorgu süresi
+    sözlük boyutundan neredeyse bağımsızdır. Uzaklık 1 olan tüm kelimeler bulunur;
+    uzaklık 2 için fazladan yazılmış harfler ve bir fazla harf + bir yanlış harf
+    yakalanır (iki harfi eksik yazılmış kelimeler yakalanmaz, indeks küçük kalsın diye).
+    """
+
+    MAX_DISTANCE = 2
+
+    def __init__(self, language):
+        self.language = language
+        self._words = {}  # katlanmış kelime -> görüntülenen kelime
+        # silme varyantı -> katlanmış kelime; birden çok kelime paylaşıyorsa tuple
+        self._deletes = {}
+
+    @staticmethod
+    def _deletions(key):
+        return {key[:i] + key[i + 1:] for i in range(len(key))}
+
+    def __len__(self):
+        return len(self._words)
+
+    def add(self, word):
+        key = fold_word(word, self.language)
+        if not key:
+            return
+        if key not in self._words:
+            deletes = self._deletes
+            for variant in self._deletions(key) | {key}:
+                current = deletes.get(variant)
+                if current is None:
+                    deletes[variant] = key
+                elif isinstance(current, str):
+                    deletes[variant] = (current, key)
+                else:
+                    deletes[variant] = current + (key,)
+        self._words[key] = word
+
+    def remove(self, word):
+        key = fold_word(word, self.language)
+        if self._words.pop(key, None) is None:
+            return
+        deletes = self._deletes
+        for variant in self._deletions(key) | {key}:
+            current = deletes.get(variant)
+            if current == key:
+                del deletes[variant]
+            elif isinstance(current, tuple):
+                rest = tuple(item for item in current if item != key)
+                deletes[variant] = rest[0] if len(rest) == 1 else rest
+
+    def suggest(self, word, k=3, max_distance=MAX_DISTANCE):
+        """En yakın k kelimeyi [(kelime, uzaklık), ...] olarak döndür (tam eşleşme dahil)"""
+        key = fold_word(word.strip(), self.language)
+        if not key:
+            return []
+        variants = {key}
+        frontier = {key}
+        for _ in range(min(max_distance, self.MAX_DISTANCE)):
+            frontier = {item[:i] + item[i + 1:] for item in frontier for i in range(len(item))}
+            variants |= frontier
+
+        candidates = set()
+        deletes = self._deletes
+        for variant in variants:
+            found = deletes.get(variant)
+            if found is None:
+                continue
+            if isinstance(found, str):
+                candidates.add(found)
+            else:
+                candidates.update(found)
+
+        scored = []
+        for candidate in candidates:
+            distance = edit_distance(key, candidate, max_distance)
+            if distance <= max_distance:
+                scored.append((distance, abs(len(candidate) - len(key)), candidate))
+        scored.sort()
+        return [(self._words[candidate], distance) for distance, _, candidate in scored[:k]]
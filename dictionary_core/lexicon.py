@@ -0,0 +1,127 @@
+"""Dil sözlükleri üzerinde çok dilli görünüm: Arapça anlamdan ters arama ve EN↔TR köprüleme"""
+
+import functools
+import re
+import threading
+
+from .text import fold_word, normalize_arabic
+
+LANGUAGES = ('en', 'tr')
+_SEPARATORS = re.compile(r"[,،;؛/|\n]+")
+
+
+def arabic_terms(meaning):
+    """Anlamın arama anahtarları: normalleştirilmiş tamamı ve virgülle ayrılmış parçaları"""
+    normalized = normalize_arabic(meaning)
+    if not normalized:
+        return ()
+    terms = [normalized]
+    for part in _SEPARATORS.split(normalized):
+        part = part.strip()
+        if part and part not in terms:
+            terms.append(part)
+    return tuple(terms)
+
+
+class Lexicon:
+    """dict_en.json ve dict_tr.json üzerinde tek, çok dilli sözlük görünümü.
+
+    Kayıtlar dil başına kendi dosyalarında (LocalDictionary) kalır; Lexicon her dil için
+    normalleştirilmiş Arapça anlam -> kelimeler ikincil indeksini tutar. Böylece aynı Arapça
+    anlamı paylaşan EN ve TR kelimeleri tek bir kayıt gibi görülür ve ters arama ile diller
+    arası köprüleme O(1) sözlük erişimidir. Bir dilin indeksi ilk sorguda kurulur ve sözlük
+    dinleyicisiyle artımlı güncellenir; dosyalar yeniden okunmaz.
+    """
+
+    def __init__(self, dictionary, languages=LANGUAGES):
+        self._dictionary = dictionary  # dil -> LocalDictionary (LookupService.dictionary)
+        self.languages = tuple(languages)
+        self._lock = threading.Lock()
+        self._by_arabic = {}  # Arapça anahtar -> {dil: {fold_word(kelime): kelime}}
+        self._terms = {}  # dil -> {fold_word(kelime): (Arapça anahtarlar)}
+
+    def _ensure(self, language):
+        if language in self._terms:
+            return
+        store = self._dictionary(language)
+        with self._lock:
+            if language in self._terms:
+                return
+            store.add_listener(functools.partial(self._on_change, language))
+            self._rebuild(language, store)
+
+    def warm(self):
+        """Tüm dillerin indekslerini şimdi kur (arka planda ısınma için)"""
+        for language in self.languages:
+            self._ensure(language)
+
+    def _rebuild(self, language, store):
+        for key in list(self._terms.get(language, ())):
+            self._remove(language, key)
+        self._terms[language] = {}
+        for word, meaning in store.iter_rows():
+            # LocalDictionary gibi aynı kelimenin ilk kaydı geçerlidir
+            if fold_word(word, language) not in self._terms[language]:
+                self._add(language, word, meaning)
+
+    def _add(self, language, word, meaning):
+        key = fold_word(word, language)
+        self._remove(language, key)
+        terms = arabic_terms(meaning)
+        self._terms[language][key] = terms
+        for term in terms:
+            self._by_arabic.setdefault(term, {}).setdefault(language, {})[key] = word
+
+    def _remove(self, language, key):
+        for term in self._terms[language].pop(key, ()):
+            bucket = self._by_arabic[term]
+            words = bucket[language]
+            words.pop(key, None)
+            if not words:
+                del bucket[language]
+                if not bucket:
+                    del self._by_arabic[term]
+
+    def _on_change(self, language, changes):
+        with self._lock:
+            if changes is None:
+                self._rebuild(language, self._dictionary(language))
+                return
+            for word, meaning in changes:
+                if meaning is None:
+                    self._remove(language, fold_word(word, language))
+                else:
+                    self._add(language, word, meaning)
+
+    def reverse(self, arabic, languages=None):
+        """Arapça anlamı verilen metinle eşleşen kelimeleri {dil: [kelime, ...]} olarak döndür"""
+        languages = languages or self.languages
+        for language in languages:
+            self._ensure(language)
+        term = normalize_arabic(arabic)
+        with self._lock:
+            bucket = self._by_arabic.get(term, {})
+            return {language: sorted(bucket.get(language, {}).values()) for language in languages}
+
+    def pivot(self, word, src, dest):
+        """src dilindeki kelimeyle aynı Arapça anlamı paylaşan dest dilindeki kelimeler"""
+        self._ensure(src)
+        self._ensure(dest)
+        with self._lock:
+            found = {}
+            for term in self._terms[src].get(fold_word(word, src), ()):
+                # Anlamın tamamıyla eşleşenler önce gelir
+                for key, match in self._by_arabic[term].get(dest, {}).items():
+                    found.setdefault(key, match)
+            return list(found.values())
+
+    def entry(self, word, language):
+        """Kelimenin birleşik kaydı: {'ar': anlam, 'en': [...], 'tr': [...]}; kayıtlı değilse None"""
+        saved = self._dictionary(language).get(word)
+        if saved is None:
+            return None
+        saved_word, meaning = saved
+        result = {'ar': meaning}
+        for other in self.languages:
+            result[other] = [saved_word] if other == language else self.pivot(saved_word, language, other)
+        return result
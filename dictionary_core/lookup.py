@@ -0,0 +1,75 @@
+"""Sözlük, çeviri önbelleği ve çeviri arka ucunu birleştiren arama servisi"""
+
+import threading
+
+from .lexicon import Lexicon
+from .storage import LocalDictionary, data_path, dict_path
+from .translation import GoogleTranslateBackend, TranslationCache
+
+
+class LookupService:
+    """Kelime aramalarının tek giriş noktası (GUI, CLI ve betikler için ortak).
+
+    Önce kayıtlı kelimelere, sonra çeviri önbelleğine bakılır; ağ yalnızca lookup()
+    çağrıldığında ve ikisinde de sonuç yoksa kullanılır. Sözlükler dil başına bir kez
+    yüklenir; lexicon tüm diller üzerinde ters arama ve köprüleme sağlar.
+    """
+
+    def __init__(self, data_dir=None, backend=None, cache=None):
+        self.data_dir = data_dir
+        self.backend = backend or GoogleTranslateBackend()
+        self.cache = cache if cache is not None else TranslationCache(data_path("translation_cache.sqlite3", data_dir))
+        self.dictionaries = {}  # language -> LocalDictionary
+        self._lock = threading.Lock()
+        self.lexicon = Lexicon(self.dictionary)
+
+    def dictionary(self, language):
+        """Dilin sözlüğünü döndür (dil başına tek örnek)"""
+        with self._lock:
+            dictionary = self.dictionaries.get(language)
+            if dictionary is None:
+                dictionary = self.dictionaries[language] = LocalDictionary(language, dict_path(language, self.data_dir))
+            return dictionary
+
+    def lookup_local(self, word, language, dest='ar'):
+        """Ağa çıkmadan ara; (anlam, kaynak) döndür. Kaynak 'dictionary', 'cache' veya None."""
+        dictionary = self.dictionary(language)
+        dictionary.maybe_refresh()  # Başka bir sürecin kaydettikleri (saniyede en fazla bir stat)
+        meaning = dictionary.lookup(word)
+        if meaning is not None:
+            return meaning, 'dictionary'
+        meaning = self.cache.get(word, src=language, dest=dest)
+        if meaning is not None:
+            return meaning, 'cache'
+        return None, None
+
+    def lookup(self, word, language, dest='ar'):
+        """Yerelde yoksa arka uçtan çevir ve önbelleğe yaz; (anlam, kaynak) döndür"""
+        meaning, source = self.lookup_local(word, language, dest)
+        if meaning is not None:
+            return meaning, source
+        meaning = self.backend.translate(word, src=language, dest=dest)
+        self.cache.put(word, meaning, src=language, dest=dest)
+        return meaning, 'remote'
+
+    def reverse_lookup(self, arabic):
+        """Arapça anlamdan kayıtlı kelimeleri bul: {dil: [kelime, ...]}"""
+        return self.lexicon.reverse(arabic)
+
+    def pivot(self, word, src, dest):
+        """Aynı Arapça anlamı paylaşan dest dilindeki kayıtlı kelimeler (ör. EN -> TR)"""
+        return self.lexicon.pivot(word, src, dest)
+
+    def suggest(self, word, language, k=3, max_distance=2):
+        """Kayıtlı kelimeler arasından yazıma en yakın k kelimeyi [(kelime, uzaklık)] döndür"""
+        return self.dictionary(language).suggest(word, k, max_distance)
+
+    def flush(self):
+        """Sözlük günlüklerini kanonik JSON dosyalarına işle"""
+        with self._lock:
+            dictionaries = list(self.dictionaries.values())
+        for dictionary in dictionaries:
+            try:
+                dictionary.compact()
+            except Exception as e:
+                print(f"Sözlük sıkıştırma hatası ({dictionary.json_file}): {e}")
@@ -0,0 +1,183 @@
+"""Sıcak yollar için hafif süre ölçümü, histogramlar ve isteğe bağlı profil yakalama.
+
+Ölçüm varsayılan olarak kapalıdır (DICTIONARY_METRICS=1 ile veya çalışırken açılır).
+Kapalıyken metrics.timer() paylaşılan boş bir bağlam döndürür; maliyeti bir öznitelik
+kontrolünden ibarettir.
+
+    with metrics.timer("save.write"):
+        store.upsert(word, meaning)
+"""
+
+import contextlib
+import os
+import threading
+import time
+from collections import deque
+
+from .storage import atomic_write_json
+
+_DISABLED = contextlib.nullcontext()
+
+
+class Histogram:
+    """Zaman pencerelerine bölünmüş süre histogramlarından oluşan halka tampon.
+
+    Her pencere WINDOW saniyelik ölçümlerin kova sayılarını tutar; en fazla WINDOWS pencere
+    saklanır, böylece bellek kullanımı sabittir ve eski ölçümler kendiliğinden düşer.
+    Yüzdelikler kova üst sınırlarından tahmin edilir.
+    """
+
+    BOUNDS = (0.0001, 0.0003, 0.001, 0.003, 0.01, 0.03, 0.1, 0.3, 1.0, 3.0, 10.0)  # saniye
+    WINDOW = 60.0
+    WINDOWS = 30
+
+    def __init__(self):
+        self._windows = deque(maxlen=self.WINDOWS)  # [başlangıç, kovalar, adet, toplam, en büyük]
+        self._lock = threading.Lock()
+
+    def record(self, seconds):
+        now = time.monotonic()
+        bucket = 0
+        while bucket < len(self.BOUNDS) and seconds > self.BOUNDS[bucket]:
+            bucket += 1
+        with self._lock:
+            if not self._windows or now - self._windows[-1][0] >= self.WINDOW:
+                self._windows.append([now, [0] * (len(self.BOUNDS) + 1), 0, 0.0, 0.0])
+            window = self._windows[-1]
+            window[1][bucket] += 1
+            window[2] += 1
+            window[3] += seconds
+            window[4] = max(window[4], seconds)
+
+    def snapshot(self):
+        """Saklanan tüm pencerelerin birleşik özeti (süreler milisaniye)"""
+        with self._lock:
+            windows = [(counts[:], count, total, largest) for _, counts, count, total, largest in self._windows]
+        buckets = [0] * (len(self.BOUNDS) + 1)
+        count = total = largest = 0
+        for counts, window_count, window_total, window_largest in windows:
+            for i, value in enumerate(counts):
+                buckets[i] += value
+            count += window_count
+            total += window_total
+            largest = max(largest, window_largest)
+
+        def percentile(p):
+            if not count:
+                return 0.0
+            seen = 0
+            for i, value in enumerate(buckets):
+                seen += value
+                if seen >= p * count:
+                    return round(min(self.BOUNDS[i] if i < len(self.BOUNDS) else largest, largest) * 1000, 3)
+            return round(largest * 1000, 3)
+
+        labels = [f"<={bound * 1000:g}ms" for bound in self.BOUNDS] + [f">{self.BOUNDS[-1] * 1000:g}ms"]
+        return {
+            'count': count,
+            'mean_ms': round(total / count * 1000, 3) if count else 0.0,
+            'p50_ms': percentile(0.50),
+            'p95_ms': percentile(0.95),
+            'max_ms': round(largest * 1000, 3),
+            'buckets': {label: value for label, value in zip(labels, buckets) if value},
+        }
+
+
+class _Timer:
+    __slots__ = ('_metrics', '_name', '_started')
+
+    def __init__(self, metrics, name):
+        self._metrics = metrics
+        self._name = name
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._metrics.record(self._name, time.perf_counter() - self._started)
+
+
+class Metrics:
+    """Adlandırılmış süre histogramları ve cProfile/tracemalloc yakalama (thread-safe)"""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self._histograms = {}
+        self._lock = threading.Lock()
+        self._profiler = None
+
+    def timer(self, name):
+        """with bloğunun süresini name altında kaydeden bağlam (kapalıyken işlem yapmaz)"""
+        if not self.enabled:
+            return _DISABLED
+        return _Timer(self, name)
+
+    def record(self, name, seconds):
+        if not self.enabled:
+            return
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(name, Histogram())
+        histogram.record(seconds)
+
+    def snapshot(self):
+        with self._lock:
+            histograms = dict(self._histograms)
+        return {name: histogram.snapshot() for name, histogram in sorted(histograms.items())}
+
+    def reset(self):
+        with self._lock:
+            self._histograms = {}
+
+    def dump_json(self, path):
+        """Özetleri JSON dosyasına yaz"""
+        atomic_write_json(path, {
+            'created': time.strftime("%Y-%m-%d %H:%M:%S"),
+            'enabled': self.enabled,
+            'metrics': self.snapshot(),
+        })
+
+    # --- Profil yakalama ---
+
+    @property
+    def profiling(self):
+        return self._profiler is not None
+
+    def start_profiling(self):
+        """Çağıran thread'de cProfile'ı ve tracemalloc'u başlat"""
+        import cProfile
+        import tracemalloc
+
+        if self._profiler is not None:
+            return
+        tracemalloc.start()
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+
+    def stop_profiling(self, directory):
+        """Yakalamayı durdur; .prof ve bellek özeti dosyalarının yollarını döndür"""
+        import tracemalloc
+
+        profiler, self._profiler = self._profiler, None
+        if profiler is None:
+            return []
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        profile_path = os.path.join(directory, f"profile-{stamp}.prof")
+        memory_path = os.path.join(directory, f"memory-{stamp}.txt")
+        profiler.dump_stats(profile_path)
+        with open(memory_path, 'w', encoding='utf-8') as f:
+            f.write(f"current: {current / 1e6:.1f} MB, peak: {peak / 1e6:.1f} MB\n\n")
+            for stat in snapshot.statistics('lineno')[:50]:
+                f.write(f"{stat}\n")
+        return [profile_path, memory_path]
+
+
+metrics = Metrics(enabled=os.environ.get("DICTIONARY_METRICS") == "1")
@@ -0,0 +1,340 @@
+"""Arapça metin şekillendirme ve akışlı PDF dışa aktarma (ReportLab)"""
+
+import functools
+import importlib.util
+import multiprocessing
+import os
+import threading
+import time
+import types
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from .metrics import metrics
+from .storage import atomic_write_bytes, data_path
+from .text import Script, classify_column
+
+# PDF/şekillendirme kütüphaneleri ilk kullanımda yüklenir; burada yalnızca kurulu olup
+# olmadıkları (içe aktarmadan) kontrol edilir.
+REPORTLAB_AVAILABLE = all(importlib.util.find_spec(name) is not None
+                          for name in ("reportlab", "arabic_reshaper", "bidi"))
+if not REPORTLAB_AVAILABLE:
+    print("Warning: 'reportlab', 'arabic-reshaper', or 'python-bidi' not installed. PDF export will be disabled.")
+
+
+@functools.lru_cache(maxsize=None)
+def load_pdf_stack():
+    """ReportLab, arabic_reshaper ve bidi'yi ilk kullanımda bir kez içe aktar"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib import colors
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
+    from reportlab.pdfgen.canvas import Canvas
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    from reportlab.lib.enums import TA_CENTER
+
+    # Import for Arabic text shaping
+    from arabic_reshaper import ArabicReshaper
+    from bidi.algorithm import get_display
+
+    return types.SimpleNamespace(
+        A4=A4, colors=colors, inch=inch, SimpleDocTemplate=SimpleDocTemplate, Table=Table,
+        TableStyle=TableStyle, Paragraph=Paragraph, getSampleStyleSheet=getSampleStyleSheet,
+        pdfmetrics=pdfmetrics, TTFont=TTFont, TA_CENTER=TA_CENTER, Canvas=Canvas,
+        ArabicReshaper=ArabicReshaper, get_display=get_display,
+    )
+
+
+ARABIC_RESHAPER_CONFIG = {
+    'delete_harakat': False,
+    'delete_tatweel': False,
+    'support_ligatures': True,
+    'arabic_reshaper_join_by_shadda': True,
+    'delete_unnecessary_dots': False,
+    'shift_harakat_position': False,
+    'support_vocalized_arabic': True,
+}
+
+_process_reshaper = None  # Süreç havuzundaki işçilerin kendi reshaper'ı
+
+
+def _shape_in_process(texts):
+    global _process_reshaper
+    pdf = load_pdf_stack()
+    if _process_reshaper is None:
+        _process_reshaper = pdf.ArabicReshaper(configuration=ARABIC_RESHAPER_CONFIG)
+    return [pdf.get_display(_process_reshaper.reshape(text)) for text in texts]
+
+
+class ArabicShaper:
+    """Arapça metni PDF için şekillendirir (reshape + bidi).
+
+    ArabicReshaper bir kez kurulur ve sonuçlar sınırlı bir LRU önbelleğinde tutulur;
+    aynı anlam tekrar tekrar şekillendirilmez. shape_batch, önbellekte olmayan çok
+    sayıda metni bir süreç havuzuna dağıtabilir. Birden çok thread'den kullanılabilir.
+    """
+
+    PROCESS_BATCH_THRESHOLD = 2000  # Bundan az eksik metin varsa havuz kullanılmaz
+    PROCESS_CHUNK = 500
+
+    def __init__(self, cache_size=20000):
+        self.cache_size = cache_size
+        self._get_display = load_pdf_stack().get_display
+        self._reshaper = load_pdf_stack().ArabicReshaper(configuration=ARABIC_RESHAPER_CONFIG)
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._pool = None
+
+    def shape(self, text):
+        with self._lock:
+            shaped = self._cache.get(text)
+            if shaped is not None:
+                self._cache.move_to_end(text)
+                return shaped
+        shaped = self._get_display(self._reshaper.reshape(text))
+        self._remember(text, shaped)
+        return shaped
+
+    def _remember(self, text, shaped):
+        with self._lock:
+            self._cache[text] = shaped
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def shape_batch(self, texts):
+        """Metinleri şekillendir ve {metin: şekillenmiş} sözlüğü döndür; tekrarlar bir kez işlenir"""
+        result = {}
+        missing = []
+        with self._lock:
+            for text in dict.fromkeys(texts):
+                shaped = self._cache.get(text)
+                if shaped is None:
+                    missing.append(text)
+                else:
+                    result[text] = shaped
+
+        if len(missing) < self.PROCESS_BATCH_THRESHOLD:
+            for text in missing:
+                result[text] = self.shape(text)
+            return result
+
+        chunks = [missing[i:i + self.PROCESS_CHUNK] for i in range(0, len(missing), self.PROCESS_CHUNK)]
+        for chunk, shaped_chunk in zip(chunks, self._process_pool().map(_shape_in_process, chunks)):
+            for text, shaped in zip(chunk, shaped_chunk):
+                self._remember(text, shaped)
+                result[text] = shaped
+        return result
+
+    def _process_pool(self):
+        if self._pool is None:
+            # spawn: Qt thread'leri olan bir süreçte fork güvenli değildir
+            self._pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+        return self._pool
+
+    def shutdown_pool(self):
+        """Süreç havuzunu kapat (büyük bir dışa aktarma bittikten sonra)"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+_arabic_shaper = None
+_arabic_shaper_lock = threading.Lock()
+
+
+def get_arabic_shaper():
+    """Paylaşılan ArabicShaper örneğini döndür"""
+    global _arabic_shaper
+    with _arabic_shaper_lock:
+        if _arabic_shaper is None:
+            _arabic_shaper = ArabicShaper()
+        return _arabic_shaper
+
+
+def prepare_arabic_text(text):
+    return get_arabic_shaper().shape(text)
+
+
+# --- PDF dışa aktarma ---
+AMIRI_FONT_FILE = "Amiri-Regular.ttf"  # Veri klasöründe aranır
+AMIRI_FONT_NAME = 'Amiri'  # ReportLab içinde kullanılan isim
+PDF_ROWS_PER_CHUNK = 30  # Yaklaşık bir sayfalık tablo parçası
+PDF_SHAPE_WINDOW = 5000  # Arapça şekillendirmenin toplu yapıldığı satır penceresi
+
+
+class ExportCancelled(Exception):
+    """PDF dışa aktarma kullanıcı tarafından iptal edildi"""
+
+
+def register_arabic_font(font_path=None):
+    """Amiri fontunu ReportLab'e bir kez kaydet; (font adı, uyarı mesajı veya None) döndür"""
+    pdf = load_pdf_stack()
+    if AMIRI_FONT_NAME in pdf.pdfmetrics.getRegisteredFontNames():
+        return AMIRI_FONT_NAME, None
+    font_path = font_path or data_path(AMIRI_FONT_FILE)
+    if not os.path.exists(font_path):
+        return 'Helvetica', f"Amiri fontu bulunamadı: {font_path}\nPDF'deki Arapça metinler doğru görünmeyebilir."
+    try:
+        pdf.pdfmetrics.registerFont(pdf.TTFont(AMIRI_FONT_NAME, font_path))
+    except Exception as e:
+        return 'Helvetica', f"Amiri fontu yüklenirken hata oluştu: {e}\nPDF'deki Arapça metinler doğru görünmeyebilir."
+    return AMIRI_FONT_NAME, None
+
+
+class _FlowableStream(list):
+    """doc.build'e verilen ve tüketildikçe üreteçten doldurulan flowable listesi.
+
+    ReportLab listenin başından eleman siler; her silmeden sonra liste birkaç elemana
+    tamamlanır, böylece bellekte hiçbir zaman tüm tablo bulunmaz.
+    """
+
+    def __init__(self, iterator, low_water=2):
+        super().__init__()
+        self._iterator = iterator
+        self._low_water = low_water
+        self._refill()
+
+    def _refill(self):
+        while self._iterator is not None and len(self) < self._low_water:
+            try:
+                self.append(next(self._iterator))
+            except StopIteration:
+                self._iterator = None
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._refill()
+
+
+def build_dictionary_pdf(file_path, language, rows, font_name='Helvetica', progress=None, is_cancelled=None):
+    """(word, meaning) satırlarını sabit boyutlu tablo parçaları halinde PDF'e yaz.
+
+    rows bir üreteç olabilir; satırlar parça parça okunur. progress(işlenen satır) her
+    parçadan sonra çağrılır; is_cancelled() True dönerse ExportCancelled fırlatılır.
+    PDF aynı klasördeki geçici dosyaya yazılır ve yalnızca başarıyla bitince file_path'in
+    yerine geçer; iptalde veya hatada mevcut dosyaya dokunulmaz.
+    """
+    pdf = load_pdf_stack()
+    styles = pdf.getSampleStyleSheet()
+    header_style = styles['h2'].clone('HeaderStyle')
+    header_style.fontName = 'Helvetica-Bold'
+    header_style.alignment = pdf.TA_CENTER
+
+    # Arapça metin stili
+    arabic_style = styles['Normal'].clone('ArabicStyle')
+    arabic_style.fontName = font_name
+    arabic_style.alignment = pdf.TA_CENTER
+    arabic_style.rightToLeft = 1
+    arabic_style.fontSize = 10
+    arabic_style.allowSplitting = 0  # Prevent splitting of Arabic text
+    arabic_style.leading = 12
+
+    # Latin (Türkçe/İngilizce) metin stili
+    ltr_style = styles['Normal'].clone('LTRStyle')
+    ltr_style.fontName = 'Helvetica'
+    ltr_style.alignment = pdf.TA_CENTER
+    ltr_style.fontSize = 10
+
+    base_style = [
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ('GRID', (0, 0), (-1, -1), 1, pdf.colors.black),
+        ('LEFTPADDING', (0, 0), (-1, -1), 6),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+        ('TOPPADDING', (0, 0), (-1, -1), 6),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+    ]
+    header_style_cmds = base_style + [
+        ('BACKGROUND', (0, 0), (-1, 0), pdf.colors.grey),
+        ('TEXTCOLOR', (0, 0), (-1, 0), pdf.colors.whitesmoke),
+        ('LINEBELOW', (0, 0), (-1, 0), 2, pdf.colors.black),
+    ]
+
+    def make_table(data, with_header):
+        table = pdf.Table(data, colWidths=[3*pdf.inch, 3*pdf.inch])
+        table.setStyle(pdf.TableStyle(header_style_cmds if with_header else base_style))
+        return table
+
+    shaper = get_arabic_shaper()
+    timings = {'shape': 0.0, 'rows': 0.0, 'write': 0.0}  # metrics için dışa aktarma başına toplamlar
+
+    class TimedCanvas(pdf.Canvas):
+        def save(self):
+            started = time.perf_counter()
+            super().save()
+            timings['write'] += time.perf_counter() - started
+
+    def windows():
+        # Satırlar SHAPE_WINDOW'luk pencerelerle okunur; her penceredeki Arapça anlamlar
+        # tek seferde (gerekirse süreç havuzunda) şekillendirilir
+        window = []
+        for row in rows:
+            if is_cancelled is not None and is_cancelled():
+                raise ExportCancelled()
+            window.append(row)
+            if len(window) >= PDF_SHAPE_WINDOW:
+                yield window
+                window = []
+        if window:
+            yield window
+
+    def chunks():
+        # Başlık yalnızca ilk parçada; ardışık parçalar tek bir tablo gibi görünür
+        batch = [[pdf.Paragraph("English" if language == "en" else "Turkish", header_style),
+                  pdf.Paragraph("Arabic", header_style)]]
+        with_header = True
+        done = 0
+        for window in windows():
+            started = time.perf_counter()
+            window = [(word.strip(), meaning.strip()) for word, meaning in window]
+            meanings = [meaning for _, meaning in window]
+            arabic = [meaning for meaning, scripts in zip(meanings, classify_column(meanings)) if Script.ARABIC in scripts]
+            shaped = shaper.shape_batch(arabic)
+            timings['shape'] += time.perf_counter() - started
+
+            started = time.perf_counter()
+            for word, meaning in window:
+                done += 1
+                if not (word or meaning):
+                    continue
+
+                if meaning in shaped:
+                    meaning_paragraph = pdf.Paragraph(shaped[meaning], arabic_style)
+                else:
+                    meaning_paragraph = pdf.Paragraph(meaning, ltr_style)
+                batch.append([pdf.Paragraph(word, ltr_style), meaning_paragraph])
+
+                if len(batch) >= PDF_ROWS_PER_CHUNK:
+                    if is_cancelled is not None and is_cancelled():
+                        raise ExportCancelled()
+                    table = make_table(batch, with_header)
+                    timings['rows'] += time.perf_counter() - started
+                    yield table  # ReportLab tabloyu burada yerleştirir; bu süre "layout"a sayılır
+                    started = time.perf_counter()
+                    with_header = False
+                    batch = []
+                    if progress is not None:
+                        progress(done)
+            timings['rows'] += time.perf_counter() - started
+        if batch:
+            yield make_table(batch, with_header)
+        if progress is not None:
+            progress(done)
+
+    def write(f):
+        doc = pdf.SimpleDocTemplate(f, pagesize=pdf.A4)
+        doc.build(_FlowableStream(chunks()), canvasmaker=TimedCanvas)
+
+    started = time.perf_counter()
+    try:
+        atomic_write_bytes(file_path, write)
+        total = time.perf_counter() - started
+        # Şekillendirme, satır/tablo kurulumu ve dosyaya yazma dışında kalan süre yerleşimdir
+        metrics.record("pdf.total", total)
+        metrics.record("pdf.shape", timings['shape'])
+        metrics.record("pdf.rows", timings['rows'])
+        metrics.record("pdf.write", timings['write'])
+        metrics.record("pdf.layout", max(0.0, total - timings['shape'] - timings['rows'] - timings['write']))
+    finally:
+        shaper.shutdown_pool()
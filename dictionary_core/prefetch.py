@@ -0,0 +1,117 @@
+"""Yazma sürerken olası kelimeleri önceden çevirip önbelleğe alan tahmini çevirici"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .text import capitalize_word, fold_word
+
+MIN_PREFIX = 3  # Daha kısa girişler için tahmin yapılmaz
+
+
+class SpeculativePrefetcher:
+    """Kullanıcı duraksadığında yazılan kelimeyi arka planda çevirip önbelleğe yazar.
+
+    Aday, giriş kutusundaki metnin kendisidir. Metin kayıtlı kelimelerden veya arama
+    geçmişinden (çeviri önbelleği) daha uzun bir kelimenin öneki ise kullanıcı büyük
+    olasılıkla o kelimeyi yazıyordur ve önek için ağa çıkılmaz. Aday seçimi (SQLite
+    okumaları dahil) havuz thread'inde yapılır; önbellek yalnızca peek ile yoklanır, yani
+    isabet sayaçları ve LRU sırası değişmez. Aynı anda en fazla max_pending istek ağdadır,
+    fazlası düşürülür.
+
+    Sayaçlar: requested (ağa giden), used (son aramayla eşleşen), wasted (yazım bitince
+    kullanılmayan), dropped (eşzamanlılık sınırı), errors. enabled=False veya
+    DICTIONARY_SPECULATION=0 tahmini tamamen kapatır.
+    """
+
+    def __init__(self, service, max_workers=2, max_pending=4, completions=3, enabled=None):
+        self.service = service  # LookupService: backend, cache ve sözlükler çağrı anında okunur
+        self.max_pending = max_pending
+        self.completions = completions
+        if enabled is None:
+            enabled = os.environ.get("DICTIONARY_SPECULATION", "1") != "0"
+        self.enabled = enabled
+        self.counters = {'requested': 0, 'used': 0, 'wasted': 0, 'dropped': 0, 'errors': 0}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="speculate")
+        self._lock = threading.Lock()
+        self._in_flight = {}  # (dil, katlanmış kelime) -> Future
+        self._burst = set()  # Bu yazım sırasında istenen anahtarlar
+        self._generation = 0  # settle'da artar; önceki yazımdan kalan aday seçimleri atılır
+
+    def candidate(self, text, language):
+        """Ağa gönderilecek kelime; kısa, yerelde yanıtı olan veya daha uzun bir kelimenin öneki olan metin için None"""
+        word = capitalize_word(text, language)
+        if len(word) < MIN_PREFIX:
+            return None
+        key = fold_word(word, language)
+        dictionary = self.service.dictionary(language)
+        known = [fold_word(w, language) for w in dictionary.complete(word, self.completions)]
+        known += self.service.cache.complete(word, src=language, limit=self.completions)
+        if any(other != key for other in known):
+            return None
+        if dictionary.lookup(word) is not None or self.service.cache.peek(word, src=language) is not None:
+            return None
+        return word
+
+    def speculate(self, text, language):
+        """Yazılan metin için tahmini çeviriyi başlat; aday seçimi görevinin Future'ını döndür.
+
+        Aday seçimi de havuzda yapılır, GUI thread'ini bekletmez.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            generation = self._generation
+        return self._executor.submit(self._plan, text, language, generation)
+
+    def _plan(self, text, language, generation):
+        word = self.candidate(text, language)
+        if word is None:
+            return
+        key = (language, fold_word(word, language))
+        with self._lock:
+            if generation != self._generation or key in self._in_flight or key in self._burst:
+                return
+            if len(self._in_flight) >= self.max_pending:
+                self.counters['dropped'] += 1
+                return
+            self.counters['requested'] += 1
+            self._burst.add(key)
+            self._in_flight[key] = future = self._executor.submit(self._fetch, word, language)
+        future.add_done_callback(lambda _, key=key: self._done(key))
+
+    def _fetch(self, word, language):
+        try:
+            meaning = self.service.backend.translate(word, src=language)
+        except Exception:
+            with self._lock:
+                self.counters['errors'] += 1
+            raise
+        self.service.cache.put(word, meaning, src=language)
+        return meaning
+
+    def _done(self, key):
+        with self._lock:
+            self._in_flight.pop(key, None)
+
+    def pending(self, word, language):
+        """Kelime için ağdaki tahmini isteğin Future'ı; yoksa None"""
+        with self._lock:
+            return self._in_flight.get((language, fold_word(word, language)))
+
+    def settle(self, word=None, language=None):
+        """Yazım bitti: word aranan son kelimedir (None ise giriş temizlendi). Sayaçları güncelle."""
+        with self._lock:
+            self._generation += 1
+            burst, self._burst = self._burst, set()
+            if word is not None and (language, fold_word(word, language)) in burst:
+                self.counters['used'] += 1
+                burst.discard((language, fold_word(word, language)))
+            self.counters['wasted'] += len(burst)
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counters, in_flight=len(self._in_flight), enabled=self.enabled)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
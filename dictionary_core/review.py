@@ -0,0 +1,229 @@
+"""Kayıtlı kelimeler için SM-2 aralıklı tekrar planlayıcısı"""
+
+import heapq
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+from .storage import data_path
+from .text import fold_word
+
+DAY = 86400
+RELEARN_DELAY = 60  # Bilinemeyen kart bu kadar saniye sonra yeniden sorulur
+MIN_EASE = 1.3
+
+ReviewState = namedtuple('ReviewState', 'repetitions interval ease due')  # interval gün, due Unix zamanı
+Card = namedtuple('Card', 'key word meaning new')
+
+
+def sm2(state, quality, now):
+    """SM-2: önceki durum (yeni kartta None) ve 0-5 arası cevap kalitesinden yeni durumu hesapla"""
+    repetitions, interval, ease = (state.repetitions, state.interval, state.ease) if state else (0, 0.0, 2.5)
+    ease = max(MIN_EASE, ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    if quality < 3:
+        return ReviewState(0, 0.0, ease, now + RELEARN_DELAY)
+    if repetitions == 0:
+        interval = 1.0
+    elif repetitions == 1:
+        interval = 6.0
+    else:
+        interval = round(interval * ease, 2)
+    return ReviewState(repetitions + 1, interval, ease, now + interval * DAY)
+
+
+class ReviewStore:
+    """review_{language}.sqlite3: kelime başına tekrar durumu ve cevap günlüğü için yan depo.
+
+    Durumlar katlanmış kelime anahtarıyla tek satır olarak tutulur (sözlük dosyasına
+    dokunulmaz). record() yalnızca belleğe ekler; yazmalar arka plandaki bir thread'de
+    FLUSH_SIZE kayıtta bir veya FLUSH_INTERVAL saniyede bir tek işlemde yapılır.
+    """
+
+    FLUSH_INTERVAL = 2.0
+    FLUSH_SIZE = 64
+
+    def __init__(self, language, path=None):
+        self.path = path or data_path(f"review_{language}.sqlite3")
+        self._conn = None
+        self._db_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._pending_states = {}
+        self._pending_log = []
+        self._wake = threading.Event()
+        self._thread = None
+        self._closed = False
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS states (
+                    key TEXT PRIMARY KEY,
+                    repetitions INTEGER NOT NULL,
+                    interval REAL NOT NULL,
+                    ease REAL NOT NULL,
+                    due INTEGER NOT NULL
+                ) WITHOUT ROWID
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS answers (
+                    key TEXT NOT NULL,
+                    quality INTEGER NOT NULL,
+                    answered INTEGER NOT NULL
+                )
+            """)
+            self._conn = conn
+        return self._conn
+
+    def load(self):
+        """Kayıtlı durumları {anahtar: ReviewState} olarak döndür"""
+        with self._db_lock:
+            rows = self._connect().execute("SELECT key, repetitions, interval, ease, due FROM states").fetchall()
+        return {key: ReviewState(*state) for key, *state in rows}
+
+    def record(self, key, state, quality, now):
+        """Bir cevabı yazma kuyruğuna ekle (bloklamaz)"""
+        with self._lock:
+            self._pending_states[key] = state
+            self._pending_log.append((key, quality, int(now)))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="review-writer", daemon=True)
+                self._thread.start()
+            if len(self._pending_log) >= self.FLUSH_SIZE:
+                self._wake.set()
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.FLUSH_INTERVAL)
+            self._wake.clear()
+            try:
+                self.flush()
+            except (OSError, sqlite3.Error) as e:
+                print(f"Tekrar durumu kaydedilemedi: {e}")
+
+    def flush(self):
+        """Kuyruktaki durumları ve cevapları tek işlemde yaz"""
+        with self._lock:
+            states, self._pending_states = self._pending_states, {}
+            log, self._pending_log = self._pending_log, []
+        if not states and not log:
+            return
+        with self._db_lock:
+            conn = self._connect()
+            conn.execute("BEGIN")
+            try:
+                conn.executemany("INSERT OR REPLACE INTO states VALUES (?, ?, ?, ?, ?)",
+                                 [(key, s.repetitions, s.interval, s.ease, int(s.due)) for key, s in states.items()])
+                conn.executemany("INSERT INTO answers VALUES (?, ?, ?)", log)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def close(self):
+        self._closed = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        self._closed = False
+
+
+class ReviewScheduler:
+    """Sözlüğün kelimelerini SM-2 ile sıraya koyar.
+
+    Zamanı gelen kartlar (due, anahtar) ikilileriyle bir min-yığında tutulur: sıradaki
+    kartı bulmak ve cevaplanan kartı yeniden eklemek O(log n)'dir, hiçbir zaman tüm
+    kelimeler taranmaz. Cevaplanan kartın eski yığın kaydı silinmez, tepeye geldiğinde
+    güncel durumla eşleşmediği için atılır. Hiç sorulmamış kelimeler sözlük sırasıyla,
+    oturum başına new_per_session taneye kadar, zamanı gelen kartlardan sonra verilir;
+    planlayıcı oturumlar arasında saklanıyorsa her oturum start_session ile başlatılır.
+    """
+
+    def __init__(self, dictionary, store, new_per_session=20):
+        self.dictionary = dictionary  # LocalDictionary
+        self.store = store
+        self.new_per_session = new_per_session
+        self.new_remaining = new_per_session
+        self.states = store.load()
+        self._heap = [(state.due, key) for key, state in self.states.items()]
+        heapq.heapify(self._heap)
+        self._new_rows = None  # Yeni kelimeler için tembel yineleyici
+        self._new_card = None  # Gösterilmiş ama henüz cevaplanmamış yeni kart
+
+    def start_session(self):
+        """Yeni tekrar oturumu: yeni kart hakkını yenile"""
+        self.new_remaining = self.new_per_session
+
+    def _is_current(self, due, key):
+        state = self.states.get(key)
+        return state is not None and state.due == due
+
+    def next_card(self, now=None):
+        """Sıradaki kartı döndür; şu an sorulacak kart yoksa None"""
+        now = time.time() if now is None else now
+        while self._heap and self._heap[0][0] <= now:
+            due, key = self._heap[0]
+            saved = self.dictionary.get(key) if self._is_current(due, key) else None
+            if saved is None:
+                heapq.heappop(self._heap)  # Eski kayıt veya sözlükten silinmiş kelime
+                continue
+            return Card(key, saved[0], saved[1], False)
+        if self._new_card is None and self.new_remaining > 0:
+            self._new_card = self._next_new()
+        return self._new_card
+
+    def _next_new(self):
+        if self._new_rows is None:
+            self._new_rows = self.dictionary.iter_rows()
+        for word, meaning in self._new_rows:
+            key = fold_word(word, self.dictionary.language)
+            if key not in self.states:
+                return Card(key, word, meaning, True)
+        return None
+
+    def answer(self, card, quality, now=None):
+        """Kartın cevabını (0-5) işle; yeni durumu döndür"""
+        now = time.time() if now is None else now
+        state = sm2(self.states.get(card.key), quality, now)
+        self.states[card.key] = state
+        heapq.heappush(self._heap, (state.due, card.key))
+        if card.new:
+            self._new_card = None
+            self.new_remaining -= 1
+        self.store.record(card.key, state, quality, now)
+        return state
+
+    def due_count(self, now=None, limit=None):
+        """Zamanı gelmiş kart sayısı, en fazla limit (yığında yalnızca zamanı gelen dallar gezilir)"""
+        now = time.time() if now is None else now
+        count = 0
+        stack = [0] if self._heap else []
+        while stack and (limit is None or count < limit):
+            i = stack.pop()
+            due, key = self._heap[i]
+            if due > now:
+                continue  # Alt dallardakiler daha da geç
+            if self._is_current(due, key):
+                count += 1
+            stack.extend(child for child in (2 * i + 1, 2 * i + 2) if child < len(self._heap))
+        return count
+
+    def next_due(self):
+        """Sıradaki kartın zamanı (Unix), planlanmış kart yoksa None"""
+        while self._heap and not self._is_current(*self._heap[0]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def close(self):
+        self.store.close()
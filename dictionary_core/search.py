@@ -0,0 +1,85 @@
+"""Tablo editöründeki filtre için alt dize arama indeksi"""
+
+from collections import defaultdict
+
+from .text import normalize_search_text
+
+
+class SearchIndex:
+    """Kelime ve anlam sütunlarında alt dize araması için trigram indeksi.
+
+    Üç ve daha uzun sorgular trigram kümelerinin kesişimiyle adaylara indirgenip
+    doğrulanır; daha kısa sorgular kelime öneklerinden (1-2 harf) eşlenir. Satırlar
+    sabit yuva numaralarıyla eklenir/çıkarılır, indeks hiçbir zaman baştan taranmaz.
+    """
+
+    def __init__(self, language):
+        self.language = language
+        self._texts = {}  # slot -> normalleştirilmiş "kelime\0anlam"
+        self._grams = defaultdict(set)  # trigram -> slot kümesi
+        self._prefixes = defaultdict(set)  # 1-2 harflik önek -> slot kümesi
+
+    def _keys(self, text):
+        grams = {text[i:i + 3] for i in range(len(text) - 2)}
+        prefixes = set()
+        for token in text.replace("\0", " ").split():
+            prefixes.add(token[:1])
+            prefixes.add(token[:2])
+        return grams, prefixes
+
+    def add(self, slot, word, meaning):
+        text = normalize_search_text(word, self.language) + "\0" + normalize_search_text(meaning, self.language)
+        self._texts[slot] = text
+        grams, prefixes = self._keys(text)
+        for gram in grams:
+            self._grams[gram].add(slot)
+        for prefix in prefixes:
+            self._prefixes[prefix].add(slot)
+
+    def remove(self, slot):
+        text = self._texts.pop(slot, None)
+        if text is None:
+            return
+        grams, prefixes = self._keys(text)
+        for gram in grams:
+            self._discard(self._grams, gram, slot)
+        for prefix in prefixes:
+            self._discard(self._prefixes, prefix, slot)
+
+    @staticmethod
+    def _discard(table, key, slot):
+        slots = table.get(key)
+        if slots is not None:
+            slots.discard(slot)
+            if not slots:
+                del table[key]
+
+    def update(self, slot, word, meaning):
+        self.remove(slot)
+        self.add(slot, word, meaning)
+
+    def matches(self, slot, query):
+        """Yuva sorguyla eşleşiyor mu (search ile aynı kurallar, tek yuva için)"""
+        text = self._texts.get(slot)
+        if text is None:
+            return False
+        query = normalize_search_text(query, self.language)
+        if len(query) < 3:
+            return any(token.startswith(query) for token in text.replace("\0", " ").split())
+        return query in text
+
+    def search(self, query):
+        """Sorguyla eşleşen yuvaların kümesini döndür"""
+        query = normalize_search_text(query, self.language)
+        if len(query) < 3:
+            return set(self._prefixes.get(query, ()))
+
+        sets = []
+        for i in range(len(query) - 2):
+            slots = self._grams.get(query[i:i + 3])
+            if not slots:
+                return set()
+            sets.append(slots)
+        sets.sort(key=len)
+        candidates = sets[0].intersection(*sets[1:])
+        return {slot for slot in candidates if query in self._texts[slot]}
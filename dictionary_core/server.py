@@ -0,0 +1,381 @@
+"""Birden çok aracın aynı sözlüğü paylaşması için yerel HTTP/JSON arama sunucusu (asyncio).
+
+Uç noktalar:
+    GET  /lookup?word=apple&lang=en[&dest=ar][&offline=1]
+    POST /lookup/batch   {"words": ["apple", "pen"], "lang": "en", "dest": "ar", "offline": false}
+    GET  /reverse?q=مدرسة
+    GET  /entry?word=school&lang=en
+    GET  /stats
+
+Sözlükler LookupService üzerinden bir kez yüklenir. Ağ çağrıları sabit boyutlu bir thread
+havuzunda yapılır; Translator örnekleri thread başına tutulduğu için bağlantılar istekler
+arasında yeniden kullanılır. Yerel aramalar (dosya kilidi, SQLite) da olay döngüsünü
+bloklamamak için ayrı küçük bir havuzda çalışır. Aynı kelime için eşzamanlı gelen istekler tek bir ağ çağrısında
+birleştirilir.
+"""
+
+import asyncio
+import json
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+from .text import fold_word
+
+MAX_BODY = 1 << 20  # POST gövdesi için üst sınır (bayt)
+MAX_BATCH = 1000  # Tek toplu istekte en fazla kelime
+LOCAL_WORKERS = 2  # Yerel aramalar için thread sayısı
+LANGUAGES = ('en', 'tr')
+ENDPOINTS = ("/lookup", "/lookup/batch", "/reverse", "/entry", "/stats")
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error", 502: "Bad Gateway"}
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class EndpointStats:
+    """Bir uç nokta için istek sayısı, hata sayısı ve son gecikmeler"""
+
+    WINDOW = 1024  # Yüzdelikler için saklanan son gecikme sayısı
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self._recent = deque(maxlen=self.WINDOW)
+
+    def record(self, elapsed, ok):
+        self.requests += 1
+        if not ok:
+            self.errors += 1
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+        self._recent.append(elapsed)
+
+    def snapshot(self):
+        recent = sorted(self._recent)
+
+        def percentile(p):
+            return round(recent[min(len(recent) - 1, int(p * len(recent)))] * 1000, 3) if recent else 0.0
+
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'avg_ms': round(self.total_time / self.requests * 1000, 3) if self.requests else 0.0,
+            'p50_ms': percentile(0.50),
+            'p95_ms': percentile(0.95),
+            'max_ms': round(self.max_time * 1000, 3),
+        }
+
+
+class LookupServer:
+    """LookupService'i HTTP üzerinden sunar.
+
+    max_upstream aynı anda yapılabilecek ağ çağrısı sayısıdır (thread havuzu boyutu).
+    """
+
+    def __init__(self, service, host="127.0.0.1", port=8765, max_upstream=4):
+        self.service = service
+        self.host = host
+        self.port = port
+        self._executor = ThreadPoolExecutor(max_workers=max_upstream, thread_name_prefix="upstream")
+        self._local = ThreadPoolExecutor(max_workers=LOCAL_WORKERS, thread_name_prefix="local")
+        self._in_flight = {}  # (src, dest, katlanmış kelime) -> asyncio.Future
+        self._upstream_tasks = set()  # Çalışan _translate_upstream görevleri (çöp toplanmasınlar)
+        self._server = None
+        self.started = time.monotonic()
+        self.endpoints = {}  # yol -> EndpointStats
+        self.upstream_calls = 0
+        self.upstream_words = 0
+        self.upstream_errors = 0
+        self.coalesced = 0
+        self.sources = {'dictionary': 0, 'cache': 0, 'remote': 0, 'missing': 0}
+
+    async def start(self):
+        """Dinlemeye başla; port 0 verildiyse atanan portu self.port'a yaz"""
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self.started = time.monotonic()
+        return self
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._local.shutdown(wait=False, cancel_futures=True)
+
+    # --- HTTP ---
+
+    async def _handle_client(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except HttpError as e:
+                    await self._respond(writer, e.status, {'error': str(e)}, keep_alive=False)
+                    break
+                if request is None:
+                    break
+                method, path, query, body, keep_alive = request
+                started = time.perf_counter()
+                try:
+                    status, payload = 200, await self._dispatch(method, path, query, body)
+                except HttpError as e:
+                    status, payload = e.status, {'error': str(e)}
+                except Exception as e:
+                    status, payload = 500, {'error': str(e)}
+                endpoint = path if path in ENDPOINTS else "other"
+                self.endpoints.setdefault(endpoint, EndpointStats()).record(time.perf_counter() - started, status == 200)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader):
+        """Bir HTTP isteğini oku; bağlantı kapandıysa None döndür"""
+        try:
+            line = await reader.readline()
+        except ValueError:  # Akış sınırını aşan satır
+            raise HttpError(400, "istek satırı çok uzun")
+        if not line:
+            return None
+        try:
+            method, target, version = line.decode('latin-1').split()
+        except ValueError:
+            raise HttpError(400, "geçersiz istek satırı")
+        headers = {}
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:
+                raise HttpError(413, "başlık satırı çok uzun")
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode('latin-1').partition(":")
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get('content-length') or 0)
+        except ValueError:
+            raise HttpError(400, "geçersiz Content-Length")
+        if length < 0 or length > MAX_BODY:
+            raise HttpError(413, "istek gövdesi çok büyük")
+        body = await reader.readexactly(length) if length else b""
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection != 'close' if version == "HTTP/1.1" else connection == 'keep-alive'
+        url = urlsplit(target)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        return method.upper(), url.path, query, body, keep_alive
+
+    async def _respond(self, writer, status, payload, keep_alive):
+        data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode('latin-1') + data)
+        await writer.drain()
+
+    async def _dispatch(self, method, path, query, body):
+        if path == "/lookup":
+            if method != "GET":
+                raise HttpError(405, "GET bekleniyor")
+            word = (query.get('word') or "").strip()
+            if not word:
+                raise HttpError(400, "'word' parametresi gerekli")
+            lang, dest = self._language(query.get('lang')), self._dest(query.get('dest', 'ar'))
+            offline = query.get('offline', '') not in ('', '0', 'false')
+            result = (await self.lookup_many([word], lang, dest, offline))[0]
+            if 'error' in result:
+                raise HttpError(502, result['error'])
+            return result
+        if path == "/lookup/batch":
+            if method != "POST":
+                raise HttpError(405, "POST bekleniyor")
+            try:
+                request = json.loads(body.decode('utf-8') or "{}")
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                raise HttpError(400, "geçersiz JSON")
+            if not isinstance(request, dict):
+                raise HttpError(400, "gövde bir JSON nesnesi olmalı")
+            words = request.get('words')
+            if not isinstance(words, list) or not all(isinstance(word, str) for word in words):
+                raise HttpError(400, "'words' bir metin listesi olmalı")
+            if len(words) > MAX_BATCH:
+                raise HttpError(413, f"en fazla {MAX_BATCH} kelime gönderilebilir")
+            lang, dest = self._language(request.get('lang')), self._dest(request.get('dest', 'ar'))
+            offline = request.get('offline', False)
+            if not isinstance(offline, bool):
+                raise HttpError(400, "'offline' true ya da false olmalı")
+            results = await self.lookup_many([word.strip() for word in words], lang, dest, offline)
+            return {'results': results}
+        if path in ("/reverse", "/entry"):
+            if method != "GET":
+                raise HttpError(405, "GET bekleniyor")
+            if path == "/reverse":
+                text = (query.get('q') or "").strip()
+                if not text:
+                    raise HttpError(400, "'q' parametresi gerekli")
+                return {'query': text, 'results': await self._run_local(self.service.reverse_lookup, text)}
+            word = (query.get('word') or "").strip()
+            if not word:
+                raise HttpError(400, "'word' parametresi gerekli")
+            entry = await self._run_local(self.service.lexicon.entry, word, self._language(query.get('lang')))
+            if entry is None:
+                raise HttpError(404, f"kayıtlı değil: {word}")
+            return {'word': word, 'entry': entry}
+        if path == "/stats":
+            return self.stats(await self._run_local(self.service.cache.stats))
+        raise HttpError(404, f"bilinmeyen yol: {path}")
+
+    @staticmethod
+    def _language(lang):
+        lang = lang or 'en'
+        if lang not in LANGUAGES:
+            raise HttpError(400, f"desteklenmeyen dil: {lang}")
+        return lang
+
+    @staticmethod
+    def _dest(dest):
+        if not isinstance(dest, str) or not dest:
+            raise HttpError(400, "'dest' bir dil kodu olmalı")
+        return dest
+
+    # --- Arama ---
+
+    async def _run_local(self, function, *args):
+        """Yerel aramayı olay döngüsü dışında, yerel havuzda çalıştır"""
+        return await asyncio.get_running_loop().run_in_executor(self._local, function, *args)
+
+    def _lookup_local_many(self, words, lang, dest):
+        return [self.service.lookup_local(word, lang, dest) if word else (None, None) for word in words]
+
+    async def lookup_many(self, words, lang, dest='ar', offline=False):
+        """Kelimeleri ara; yerelde olmayanları tek bir toplu ağ çağrısıyla çevir"""
+        results = [None] * len(words)
+        waiting = []  # (index, future)
+        new_keys = {}  # key -> kelime; bu istekte ağa gidecek olanlar
+        local = await self._run_local(self._lookup_local_many, words, lang, dest)
+        for i, (word, (meaning, source)) in enumerate(zip(words, local)):
+            if meaning is not None or offline or not word:
+                results[i] = self._result(word, meaning, source)
+                continue
+            key = (lang, dest, fold_word(word, lang))
+            future = self._in_flight.get(key)
+            if future is None:
+                future = self._in_flight[key] = asyncio.get_running_loop().create_future()
+                new_keys[key] = word
+            elif key not in new_keys:
+                self.coalesced += 1
+            waiting.append((i, future))
+
+        if new_keys:
+            task = asyncio.ensure_future(self._translate_upstream(new_keys, lang, dest))
+            self._upstream_tasks.add(task)
+            task.add_done_callback(self._upstream_done)
+        for i, future in waiting:
+            try:
+                results[i] = self._result(words[i], await asyncio.shield(future), 'remote')
+            except Exception as e:
+                results[i] = {'word': words[i], 'meaning': None, 'source': None, 'error': str(e)}
+        return results
+
+    async def _translate_upstream(self, new_keys, lang, dest):
+        keys = list(new_keys)
+        texts = [new_keys[key] for key in keys]
+        self.upstream_calls += 1
+        self.upstream_words += len(texts)
+        loop = asyncio.get_running_loop()
+        try:
+            meanings = await loop.run_in_executor(self._executor, self._translate_and_cache, texts, lang, dest)
+            _check_count(texts, meanings)
+        except Exception as e:
+            self.upstream_errors += 1
+            for key in keys:
+                future = self._in_flight.pop(key)
+                future.set_exception(e)
+                future.exception()  # bekleyen yoksa "never retrieved" uyarısını önle
+            return
+        for key, meaning in zip(keys, meanings):
+            self._in_flight.pop(key).set_result(meaning)
+
+    def _upstream_done(self, task):
+        self._upstream_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            print(f"Toplu çeviri görevi hatası: {task.exception()}")
+
+    def _translate_and_cache(self, texts, lang, dest):
+        """Havuz thread'inde: çevir ve sonuçları önbelleğe yaz"""
+        backend = self.service.backend
+        if len(texts) == 1:
+            meanings = [backend.translate(texts[0], src=lang, dest=dest)]
+        else:
+            meanings = backend.translate_batch(texts, src=lang, dest=dest)
+        _check_count(texts, meanings)  # Eksik yanıt yanlış kelimelere yazılmasın
+        for text, meaning in zip(texts, meanings):
+            self.service.cache.put(text, meaning, src=lang, dest=dest)
+        return meanings
+
+    def _result(self, word, meaning, source):
+        self.sources[source or 'missing'] += 1
+        return {'word': word, 'meaning': meaning, 'source': source}
+
+    def stats(self, cache_stats=None):
+        """Verim ve gecikme sayaçları; cache_stats verilmezse önbellek sayımı burada yapılır (bloklar)"""
+        uptime = time.monotonic() - self.started
+        requests = sum(endpoint.requests for endpoint in self.endpoints.values())
+        return {
+            'uptime_s': round(uptime, 3),
+            'requests': requests,
+            'requests_per_s': round(requests / uptime, 3) if uptime else 0.0,
+            'endpoints': {path: endpoint.snapshot() for path, endpoint in sorted(self.endpoints.items())},
+            'sources': dict(self.sources),
+            'upstream': {
+                'calls': self.upstream_calls,
+                'words': self.upstream_words,
+                'errors': self.upstream_errors,
+                'coalesced': self.coalesced,
+                'in_flight': len(self._in_flight),
+            },
+            'cache': cache_stats if cache_stats is not None else self.service.cache.stats(),
+        }
+
+
+def _check_count(texts, meanings):
+    if len(meanings) != len(texts):
+        raise ValueError(f"çevirmen {len(texts)} kelime için {len(meanings)} sonuç döndürdü")
+
+
+def run_server(service, host="127.0.0.1", port=8765, max_upstream=4):
+    """Sunucuyu Ctrl+C'ye kadar çalıştır"""
+
+    async def main():
+        server = await LookupServer(service, host, port, max_upstream).start()
+        print(f"Sözlük sunucusu dinliyor: http://{server.host}:{server.port}", flush=True)
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
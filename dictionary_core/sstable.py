@@ -0,0 +1,190 @@
+"""dict_*.json için ikili, sıralı dize tablosu (SSTable) biçimi.
+
+Dosya düzeni (tüm tamsayılar little-endian):
+
+    başlık   : MAGIC (8 bayt), dil (4 bayt, ASCII), kayıt sayısı (u32),
+               indeks konumu (u64), sıra tablosu konumu (u64)
+    kayıtlar : anahtar uzunluğu (u16), kelime uzunluğu (u16), anlam uzunluğu (u32),
+               ek alan uzunluğu (u32), ardından UTF-8 anahtar, kelime, anlam, ek alanlar
+    indeks   : kayıtların konumları (u64), fold_word anahtarının UTF-8 baytlarına göre sıralı
+    sıra     : JSON'daki her kaydın indeksteki yeri (u32), dosya sırasını korumak için
+
+Dosya mmap ile açılır; arama, indeks üzerinde ikili arama yapar ve yalnızca dokunulan
+kayıtları çözer. "word" ve "meaning" dışındaki alanlar kayıtta JSON olarak saklanır,
+böylece JSON'a geri dönüş kayıpsızdır.
+"""
+
+import json
+import mmap
+import struct
+
+from .storage import atomic_write_bytes, atomic_write_json
+from .text import fold_word
+
+MAGIC = b"DICTSST\x01"
+_HEADER = struct.Struct("<8s4sIQQ")
+_RECORD = struct.Struct("<HHII")
+
+
+class SSTableError(ValueError):
+    """Dosya SSTable biçiminde değil veya bozuk"""
+
+
+def write_sstable(path, entries, language):
+    """{'word', 'meaning', ...} kayıtlarını SSTable olarak atomik yaz; kayıt sayısını döndür"""
+    records = []
+    for position, entry in enumerate(entries):
+        word = entry.get('word', '')
+        meaning = entry.get('meaning', '')
+        extra = {name: value for name, value in entry.items() if name not in ('word', 'meaning')}
+        records.append((
+            fold_word(word.strip(), language).encode('utf-8'),
+            position,
+            word.encode('utf-8'),
+            meaning.encode('utf-8'),
+            json.dumps(extra, ensure_ascii=False).encode('utf-8') if extra else b"",
+        ))
+    # Aynı anahtarlı kayıtlar dosya sırasını korur; aramada ilk kayıt geçerlidir (LocalDictionary gibi)
+    records.sort(key=lambda record: (record[0], record[1]))
+
+    def write(f):
+        f.write(b"\0" * _HEADER.size)
+        offset = _HEADER.size
+        offsets = []
+        order = [0] * len(records)
+        for sorted_index, (key, position, word, meaning, extra) in enumerate(records):
+            if len(key) > 0xFFFF or len(word) > 0xFFFF:
+                raise SSTableError(f"kelime çok uzun: {word[:40]!r}")
+            offsets.append(offset)
+            order[position] = sorted_index
+            head = _RECORD.pack(len(key), len(word), len(meaning), len(extra))
+            f.write(head + key + word + meaning + extra)
+            offset += len(head) + len(key) + len(word) + len(meaning) + len(extra)
+        index_offset = offset
+        f.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        order_offset = index_offset + 8 * len(offsets)
+        f.write(struct.pack(f"<{len(order)}I", *order))
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, language.encode('ascii')[:4], len(records), index_offset, order_offset))
+
+    atomic_write_bytes(path, write)
+    return len(records)
+
+
+class SSTable:
+    """Salt okunur, mmap ile açılan SSTable sözlüğü.
+
+    Açılış yalnızca başlığı okur; lookup O(log n) kayıt çözer. with bloğuyla kullanılabilir.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            try:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise SSTableError(f"boş dosya: {path}")
+        try:
+            if len(self._mm) < _HEADER.size:
+                raise SSTableError(f"SSTable değil: {path}")
+            magic, language, count, index_offset, order_offset = _HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC or order_offset + 4 * count != len(self._mm):
+                raise SSTableError(f"SSTable değil veya bozuk: {path}")
+        except SSTableError:
+            self._mm.close()
+            raise
+        self.language = language.rstrip(b"\0").decode('ascii')
+        self._count = count
+        self._view = memoryview(self._mm)
+        self._offsets = self._view[index_offset:order_offset].cast('Q')
+        self._order = self._view[order_offset:].cast('I')
+
+    def close(self):
+        if self._mm is not None:
+            self._offsets.release()
+            self._order.release()
+            self._view.release()
+            self._mm.close()
+            self._mm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def _key_at(self, index):
+        offset = self._offsets[index]
+        key_len = _RECORD.unpack_from(self._mm, offset)[0]
+        start = offset + _RECORD.size
+        return self._mm[start:start + key_len]
+
+    def _record_at(self, index):
+        offset = self._offsets[index]
+        key_len, word_len, meaning_len, extra_len = _RECORD.unpack_from(self._mm, offset)
+        start = offset + _RECORD.size + key_len
+        word = self._mm[start:start + word_len].decode('utf-8')
+        start += word_len
+        meaning = self._mm[start:start + meaning_len].decode('utf-8')
+        start += meaning_len
+        entry = {'word': word, 'meaning': meaning}
+        if extra_len:
+            entry.update(json.loads(self._mm[start:start + extra_len].decode('utf-8')))
+        return entry
+
+    def _find(self, key):
+        """key için ilk kaydın sıralı konumunu döndür (bisect_left)"""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def get(self, word):
+        """Kelimenin kaydını {'word', 'meaning', ...} olarak döndür, yoksa None"""
+        key = fold_word(word.strip(), self.language).encode('utf-8')
+        index = self._find(key)
+        if index < self._count and self._key_at(index) == key:
+            return self._record_at(index)
+        return None
+
+    def lookup(self, word):
+        """Kayıtlı anlamı döndür, yoksa None (LocalDictionary.lookup ile aynı anlam)"""
+        entry = self.get(word)
+        if entry is None:
+            return None
+        return entry['meaning'].strip() or None
+
+    def iter_prefix(self, prefix):
+        """Anahtarı önekle başlayan kayıtları sıralı olarak üret"""
+        key = fold_word(prefix.strip(), self.language).encode('utf-8')
+        index = self._find(key)
+        while index < self._count and self._key_at(index).startswith(key):
+            yield self._record_at(index)
+            index += 1
+
+    def __iter__(self):
+        """Kayıtları JSON dosyasındaki sırasıyla üret"""
+        for i in range(self._count):
+            yield self._record_at(self._order[i])
+
+
+def json_to_sstable(json_path, sstable_path, language):
+    """dict_*.json dosyasını SSTable'a dönüştür; kayıt sayısını döndür"""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    return write_sstable(sstable_path, entries, language)
+
+
+def sstable_to_json(sstable_path, json_path):
+    """SSTable'ı dict_*.json biçimine geri yaz; kayıt sayısını döndür"""
+    with SSTable(sstable_path) as table:
+        entries = list(table)
+    atomic_write_json(json_path, entries)
+    return len(entries)
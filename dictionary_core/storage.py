@@ -0,0 +1,583 @@
+"""Sözlük dosyalarının depolanması: kanonik JSON + ekleme günlüğü"""
+
+import bisect
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from .fuzzy import FuzzyIndex
+from .text import fold_word
+
+APP_NAME = "dictionary_app_by_Anas_Moneer"
+
+
+def default_app_dir():
+    """Uygulama klasörü: Windows'ta %APPDATA%, macOS'ta Application Support, diğerlerinde XDG veri klasörü"""
+    if os.name == 'nt':
+        base = os.environ.get("APPDATA") or os.path.join(os.path.expanduser("~"), "AppData", "Roaming")
+    elif sys.platform == "darwin":
+        base = os.path.join(os.path.expanduser("~"), "Library", "Application Support")
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+    return os.path.join(base, APP_NAME)
+
+
+def default_data_dir():
+    """Sözlük dosyalarının klasörü; DICTIONARY_DATA_DIR ortam değişkeniyle değiştirilebilir"""
+    return os.environ.get("DICTIONARY_DATA_DIR") or os.path.join(default_app_dir(), "main")
+
+
+APP_DIR = default_app_dir()  # İkon gibi paylaşılan dosyalar
+DATA_DIR = default_data_dir()
+
+
+def data_path(name, data_dir=None):
+    """Veri klasöründeki bir dosyanın yolunu döndür"""
+    return os.path.join(data_dir or DATA_DIR, name)
+
+
+def dict_path(language, data_dir=None):
+    """Verilen dilin sözlük dosyasının yolunu döndür"""
+    return data_path(f"dict_{language}.json", data_dir)
+
+
+def _write_temp(path, write):
+    """write(dosya) ile path'in yanına geçici dosya yaz ve diske işle; geçici dosyanın yolunu döndür.
+
+    Hedef dosya varsa izinleri korunur (mkstemp dosyaları 0600 oluşturur).
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+        except FileNotFoundError:
+            os.chmod(tmp_path, 0o644)
+    except BaseException:
+        _remove_quietly(tmp_path)
+        raise
+    return tmp_path
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _dump_json(data):
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def atomic_write_bytes(path, write):
+    """write(dosya) ile geçici dosyaya yaz, sonra yeniden adlandırarak atomik olarak kaydet"""
+    tmp_path = _write_temp(path, write)
+    try:
+        os.replace(tmp_path, path)
+    except BaseException:
+        _remove_quietly(tmp_path)
+        raise
+
+
+def atomic_write_json(path, data):
+    """JSON verisini geçici dosyaya yazıp yeniden adlandırarak atomik olarak kaydet"""
+    atomic_write_bytes(path, lambda f: f.write(_dump_json(data)))
+
+
+if os.name == 'nt':
+    import msvcrt
+
+    def _lock_file(f):
+        f.seek(0)
+        while True:
+            try:
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue  # LK_LOCK yaklaşık 10 saniye denedikten sonra vazgeçer; beklemeye devam et
+
+    def _unlock_file(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(f):
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class FileLock:
+    """Süreçler arası danışma (advisory) kilidi: POSIX'te flock, Windows'ta msvcrt.locking.
+
+    Aynı thread tarafından iç içe alınabilir. Thread'ler arasındaki dışlamayı sağlamaz;
+    LocalDictionary onu kendi thread kilidinin içinde kullanır. Kilit dosyası ilk
+    kullanımda açılır ve close() çağrılana kadar açık tutulur.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+        self._depth = 0
+
+    def acquire(self):
+        if self._depth == 0:
+            if self._file is None:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                self._file = open(self.path, 'a+b')
+            _lock_file(self._file)
+        self._depth += 1
+
+    def release(self):
+        self._depth -= 1
+        if self._depth == 0:
+            _unlock_file(self._file)
+
+    def close(self):
+        if self._file is not None and self._depth == 0:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+class LocalDictionary:
+    """dict_{language}.json için depolama motoru ve bellek içi arama indeksi.
+
+    Kaydetmeler kanonik dosyayı yeniden yazmaz; dict_{language}.json.journal dosyasına
+    birer JSON satırı (upsert/silme; apply ile gelen gruplar tek satırda, hep birlikte ya da
+    hiç) olarak eklenir ve yüklemede kanonik dosyanın üzerine yeniden oynatılır. Günlük, arka planda veya çıkışta kanonik dosyaya sıkıştırılır
+    (compact). Kanonik dosya her zaman geçici dosya + yeniden adlandırma ile yazılır.
+
+    Aynı dosyaları birden çok süreç paylaşabilir: her yazma dict_{language}.json.lock
+    üzerindeki dosya kilidi altında yapılır ve önce diğer süreçlerin günlüğe eklediği
+    satırlar (bu sürecin okuduğu konumdan itibaren) uygulanır. Kanonik dosyanın kimliği
+    (mtime, boyut, inode) değiştiyse başka bir süreç sıkıştırma yapmıştır ve dosyalar
+    yeniden okunur. Değişiklikler add_listener ile kaydedilen geri çağrılara bildirilir.
+
+    Kelimeler fold_word ile normalleştirilip _entries listesindeki konumlarına indekslenir.
+    """
+
+    COMPACT_THRESHOLD = 500  # Bu kadar günlük kaydından sonra arka planda sıkıştır
+    BULK_REINDEX = 1000  # Daha büyük gruplarda yardımcı indeksler güncellenmez, ilk kullanımda yeniden kurulur
+
+    def __init__(self, language, json_file=None):
+        self.language = language
+        self.json_file = json_file or dict_path(language)
+        self.journal_file = self.json_file + ".journal"
+        self.lock_file = self.json_file + ".lock"
+        self.load_error = None
+        self._lock = threading.RLock()
+        self._file_lock = FileLock(self.lock_file)
+        self._compact_lock = threading.Lock()
+        self._entries = None  # [word, meaning] çiftleri; silinenler None
+        self._index = {}  # fold_word(word) -> _entries içindeki konum
+        self._fuzzy = None  # İlk öneri isteğinde kurulan FuzzyIndex
+        self._sorted_keys = None  # İlk tamamlama isteğinde kurulan sıralı anahtar listesi
+        self._journal_ops = 0
+        self._journal_offset = 0  # Günlüğün bu süreçte uygulanmış bayt sayısı
+        self._canonical_stat = None  # Kanonik dosyanın son okunduğu/yazıldığı andaki kimliği
+        self._listeners = []
+        self._last_check = 0.0
+
+    @contextlib.contextmanager
+    def _locked(self):
+        """Thread kilidi + süreçler arası dosya kilidi"""
+        with self._lock, self._file_lock:
+            yield
+
+    def load(self):
+        """Kanonik dosyayı oku ve günlüğü üzerine oynat. JSON bozuksa ValueError fırlatır."""
+        with self._locked():
+            self._load_locked()
+        self._notify(None)
+        if self.load_error is not None:
+            raise self.load_error
+
+    def _load_locked(self):
+        self._entries = []
+        self._index = {}
+        self._fuzzy = None
+        self._sorted_keys = None
+        self._journal_ops = 0
+        self._journal_offset = 0
+        self.load_error = None
+        self._canonical_stat = self._stat_canonical()
+        data = []
+        try:
+            with open(self.json_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            pass
+        except ValueError as e:
+            self.load_error = e
+        if not isinstance(data, list):
+            self.load_error = ValueError(f"{self.json_file}: kayıt listesi bekleniyordu")
+            data = []
+
+        invalid = 0
+        for entry in data:
+            if not (isinstance(entry, dict) and isinstance(entry.get('word', ''), str)
+                    and isinstance(entry.get('meaning', ''), str)):
+                invalid += 1  # Elle düzenlenmiş dosyadaki nesne olmayan veya bozuk kayıt
+                continue
+            word = entry.get('word', '').strip()
+            key = fold_word(word, self.language)
+            # save_to_json gibi ilk eşleşen kayıt geçerlidir
+            self._index.setdefault(key, len(self._entries))
+            self._entries.append([word, entry.get('meaning', '').strip()])
+        if invalid:
+            print(f"Uyarı: {self.json_file} içindeki {invalid} geçersiz kayıt atlandı")
+
+        self._replay_journal()
+
+    def _ensure_loaded(self):
+        if self._entries is None:
+            with self._locked():
+                if self._entries is None:
+                    self._load_locked()
+                    if self.load_error is not None:
+                        print(f"Sözlük okunamadı ({self.json_file}): {self.load_error}")
+
+    def _stat_canonical(self):
+        try:
+            st = os.stat(self.json_file)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def _replay_journal(self, changes=None):
+        """Günlüğü _journal_offset'ten itibaren uygula; changes verilirse değişiklikleri ekle"""
+        try:
+            with open(self.journal_file, 'rb') as f:
+                f.seek(self._journal_offset)
+                good_offset = self._journal_offset
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # Yazma sırasında çökmeden kalan yarım satır
+                    good_offset += len(line)
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    ops = record['ops'] if record.get('op') == 'batch' else (record,)
+                    self._prepare_bulk(len(ops))
+                    for op in ops:
+                        if op.get('op') == 'del':
+                            self._delete(op['word'])
+                            if changes is not None:
+                                changes.append((op['word'], None))
+                        else:
+                            self._put(op['word'], op.get('meaning', ''))
+                            if changes is not None:
+                                changes.append((op['word'], op.get('meaning', '')))
+                        self._journal_ops += 1
+        except FileNotFoundError:
+            return
+        self._journal_offset = good_offset
+        if good_offset < self._journal_size():
+            # Yarım satırı at ki sonraki eklemeler onunla birleşmesin (dosya kilidi altındayız,
+            # yani başka bir süreç şu an yazmıyor)
+            os.truncate(self.journal_file, good_offset)
+
+    def _sync_locked(self):
+        """Diğer süreçlerin değişikliklerini uygula (kilit altında çağrılır).
+
+        Değişiklik listesini, dosyalar baştan okunduysa None döndürür.
+        """
+        journal_size = self._journal_size()
+        if (self._entries is None or self._stat_canonical() != self._canonical_stat
+                or journal_size < self._journal_offset):
+            self._load_locked()
+            return None
+        changes = []
+        if journal_size > self._journal_offset:
+            self._replay_journal(changes)
+        return changes
+
+    def refresh(self):
+        """Diğer süreçlerin yaptığı değişiklikleri uygula ve dinleyicilere bildir.
+
+        Değişiklikleri [(kelime, anlam; silindiyse None)] olarak, dosyalar baştan okunduysa
+        None döndürür.
+        """
+        with self._locked():
+            changes = self._sync_locked()
+        if changes is None or changes:
+            self._notify(changes)
+        return changes
+
+    def maybe_refresh(self, interval=1.0):
+        """Son kontrolden bu yana interval saniye geçtiyse dosyalara bak, değiştiyse refresh et"""
+        now = time.monotonic()
+        if now - self._last_check < interval:
+            return
+        self._last_check = now
+        if (self._entries is not None and self._stat_canonical() == self._canonical_stat
+                and self._journal_size() == self._journal_offset):
+            return
+        self.refresh()
+
+    def add_listener(self, callback):
+        """callback(changes) her değişiklikten sonra, değişikliği yapan thread'de çağrılır.
+
+        changes günlük sırasıyla [(kelime, anlam; silindiyse None)] listesi ya da dosyalar
+        baştan okunduysa None'dır. Bu sürecin kendi yazmaları da bildirilir.
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, changes):
+        for callback in list(self._listeners):
+            try:
+                callback(changes)
+            except Exception as e:
+                print(f"Sözlük dinleyici hatası: {e}")
+
+    def _prepare_bulk(self, count):
+        """Büyük bir grup uygulanmadan önce öneri ve tamamlama indekslerini bırak.
+
+        Kayıt başına güncelleme (sıralı listeye insort) büyük içe aktarmalarda karesel olur;
+        indeksler bir sonraki suggest/complete çağrısında tek seferde yeniden kurulur.
+        """
+        if count > self.BULK_REINDEX:
+            self._fuzzy = None
+            self._sorted_keys = None
+
+    def _put(self, word, meaning):
+        key = fold_word(word, self.language)
+        pos = self._index.get(key)
+        if pos is None:
+            self._index[key] = len(self._entries)
+            self._entries.append([word, meaning])
+            if self._sorted_keys is not None:
+                bisect.insort(self._sorted_keys, key)
+        else:
+            self._entries[pos] = [word, meaning]
+        if self._fuzzy is not None:
+            self._fuzzy.add(word)
+
+    def _delete(self, word):
+        key = fold_word(word, self.language)
+        pos = self._index.pop(key, None)
+        if pos is not None:
+            self._entries[pos] = None
+            if self._fuzzy is not None:
+                self._fuzzy.remove(word)
+            if self._sorted_keys is not None:
+                del self._sorted_keys[bisect.bisect_left(self._sorted_keys, key)]
+
+    def lookup(self, word):
+        """Kayıtlı anlamı döndür, yoksa None"""
+        with self._lock:
+            self._ensure_loaded()
+            pos = self._index.get(fold_word(word, self.language))
+            if pos is None:
+                return None
+            return self._entries[pos][1] or None
+
+    def get(self, word):
+        """Kaydı (kayıtlı kelime, anlam) olarak döndür, yoksa None"""
+        with self._lock:
+            self._ensure_loaded()
+            pos = self._index.get(fold_word(word, self.language))
+            if pos is None:
+                return None
+            return tuple(self._entries[pos])
+
+    def get_many(self, words):
+        """Her kelime için get sonucunu tek kilit alımıyla döndür (toplu içe aktarma için)"""
+        with self._lock:
+            self._ensure_loaded()
+            index, entries, language = self._index, self._entries, self.language
+            result = []
+            for word in words:
+                pos = index.get(fold_word(word, language))
+                result.append(None if pos is None else tuple(entries[pos]))
+            return result
+
+    def suggest(self, word, k=3, max_distance=2):
+        """Yazım hatasına dayanıklı öneriler: [(kayıtlı kelime, uzaklık), ...]"""
+        with self._lock:
+            self._ensure_loaded()
+            if self._fuzzy is None:
+                self._fuzzy = FuzzyIndex(self.language)
+                for entry in self._entries:
+                    if entry is not None:
+                        self._fuzzy.add(entry[0])
+            return self._fuzzy.suggest(word, k, max_distance)
+
+    def complete(self, prefix, limit=3):
+        """Öneki prefix olan kayıtlı kelimelerden en fazla limit tanesi (alfabetik)"""
+        key = fold_word(prefix, self.language)
+        with self._lock:
+            self._ensure_loaded()
+            if self._sorted_keys is None:
+                self._sorted_keys = sorted(self._index)
+            start = bisect.bisect_left(self._sorted_keys, key)
+            words = []
+            for match in self._sorted_keys[start:start + limit]:
+                if not match.startswith(key):
+                    break
+                words.append(self._entries[self._index[match]][0])
+            return words
+
+    def entries(self):
+        """Canlı kayıtları dosyadaki sırasıyla {'word', 'meaning'} listesi olarak döndür"""
+        with self._lock:
+            self._ensure_loaded()
+            return [{'word': e[0], 'meaning': e[1]} for e in self._entries if e is not None]
+
+    def iter_rows(self):
+        """Canlı kayıtları (word, meaning) olarak sırayla üret (anlık görüntü üzerinden)"""
+        with self._lock:
+            self._ensure_loaded()
+            snapshot = list(self._entries)
+        for entry in snapshot:
+            if entry is not None:
+                yield entry[0], entry[1]
+
+    def __len__(self):
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._index)
+
+    def upsert(self, word, meaning):
+        """Kelimeyi ekle veya güncelle (günlüğe tek satır ekler)"""
+        self.apply([(word, meaning)])
+
+    def delete(self, word):
+        """Kelimeyi sil (günlüğe tek satır ekler)"""
+        self.apply([], [word])
+
+    def apply(self, upserts, deletes=()):
+        """Bir grup değişikliği tek, atomik günlük satırıyla uygula (önce silmeler, sonra upsert'ler)"""
+        records = [{'op': 'del', 'word': word} for word in deletes]
+        records += [{'op': 'put', 'word': word, 'meaning': meaning} for word, meaning in upserts]
+        if not records:
+            return
+        with self._locked():
+            self._ensure_loaded()
+            external = self._sync_locked()
+            os.makedirs(os.path.dirname(self.journal_file) or ".", exist_ok=True)
+            # Birden çok kayıt tek satıra yazılır: yarım kalan yazma grubun tamamını geçersiz kılar
+            line = records[0] if len(records) == 1 else {'op': 'batch', 'ops': records}
+            with open(self.journal_file, 'ab') as f:
+                f.write((json.dumps(line, ensure_ascii=False) + "\n").encode('utf-8'))
+                f.flush()
+                os.fsync(f.fileno())
+                self._journal_offset = f.tell()
+            self._prepare_bulk(len(records))
+            for word in deletes:
+                self._delete(word)
+            for word, meaning in upserts:
+                self._put(word, meaning)
+            self._journal_ops += len(records)
+            should_compact = self._journal_ops >= self.COMPACT_THRESHOLD
+        if external is None or external:
+            self._notify(external)
+        self._notify([(word, None) for word in deletes] + list(upserts))
+        if should_compact:
+            self.compact_in_background()
+
+    def replace_all(self, entries):
+        """Tüm sözlüğü verilen listeyle değiştir ve kanonik dosyayı hemen yaz"""
+        with self._compact_lock, self._locked():
+            atomic_write_json(self.json_file, entries)
+            self._truncate_journal(self._journal_size())
+            self._entries = []
+            self._index = {}
+            self._fuzzy = None
+            self._sorted_keys = None
+            self._journal_ops = 0
+            self._journal_offset = 0
+            self._canonical_stat = self._stat_canonical()
+            self.load_error = None
+            for entry in entries:
+                self._index.setdefault(fold_word(entry['word'], self.language), len(self._entries))
+                self._entries.append([entry['word'], entry['meaning']])
+        self._notify(None)
+
+    def compact(self, create=False):
+        """Günlüğü kanonik dosyaya işle. Yazma kilitler dışında yapılır, kaydetmeleri bekletmez.
+
+        Günlük boşsa bir şey yazılmaz; create=True ise kanonik dosya yoksa (boş da olsa) yaratılır.
+        """
+        notifications = []
+        with self._compact_lock:
+            with self._locked():
+                if self._entries is None or self.load_error is not None:
+                    return  # Bozuk kanonik dosyanın üzerine yazma
+                notifications.append(self._sync_locked())
+                if self._journal_ops == 0 and (os.path.exists(self.json_file) or not create):
+                    tmp_path = None  # Salt okunur komutlar (ör. CLI'da reverse) boş dosya yaratmasın
+                else:
+                    snapshot = self.entries()
+                    journal_offset = self._journal_offset
+                    canonical_stat = self._canonical_stat
+                    ops = self._journal_ops
+                    tmp_path = True
+
+            if tmp_path:
+                tmp_path = _write_temp(self.json_file, lambda f: f.write(_dump_json(snapshot)))
+                try:
+                    with self._locked():
+                        notifications.append(self._sync_locked())
+                        # Bu arada başka bir süreç sıkıştırdıysa onun dosyası zaten günceldir
+                        if self._canonical_stat == canonical_stat:
+                            os.replace(tmp_path, self.json_file)
+                            tmp_path = None
+                            self._canonical_stat = self._stat_canonical()
+                            # Yazma sırasında eklenen günlük satırları korunur
+                            self._truncate_journal(journal_offset)
+                            self._journal_offset -= journal_offset
+                            self._journal_ops = max(0, self._journal_ops - ops)
+                finally:
+                    if tmp_path:
+                        _remove_quietly(tmp_path)
+
+        for changes in notifications:
+            if changes is None or changes:
+                self._notify(changes)
+
+    def compact_in_background(self):
+        threading.Thread(target=self.compact, name=f"compact-{self.language}", daemon=True).start()
+
+    def _journal_size(self):
+        try:
+            return os.path.getsize(self.journal_file)
+        except OSError:
+            return 0
+
+    def _truncate_journal(self, offset):
+        """Günlüğün ilk offset baytını at, kalanını atomik olarak yeniden yaz"""
+        try:
+            with open(self.journal_file, 'rb') as f:
+                f.seek(offset)
+                tail = f.read()
+        except FileNotFoundError:
+            return
+        if not tail:
+            os.remove(self.journal_file)
+            return
+        atomic_write_bytes(self.journal_file, lambda f: f.write(tail))
@@ -0,0 +1,88 @@
+"""Kelime normalleştirme ve yazı sistemi tespiti"""
+
+import enum
+import functools
+import re
+
+
+def fold_word(word, language):
+    """Kelimeyi büyük/küçük harf duyarsız karşılaştırma için normalleştir (Türkçe I/İ kurallarıyla)"""
+    word = word.strip()
+    if language == "tr":
+        return word.replace("I", "ı").replace("İ", "i").lower()
+    return word.casefold()
+
+
+def capitalize_word(word, language):
+    """str.capitalize'ın Türkçe i/ı farkını gözeten sürümü"""
+    word = word.strip()
+    if language != "tr" or not word:
+        return word.capitalize()
+    first = {"i": "İ", "ı": "I"}.get(word[0], word[0].upper())
+    rest = word[1:].replace("I", "ı").replace("İ", "i").lower()
+    return first + rest
+
+
+# Harekeler (fetha, kesra, şedde, sükun, ...), üstün elif ve tatvil aramada yok sayılır
+_HARAKAT_TABLE = dict.fromkeys([*range(0x064B, 0x0660), 0x0670, 0x0640])
+
+
+def normalize_search_text(text, language):
+    """Metni arama için normalleştir: harekeleri at, büyük/küçük harf farkını kaldır"""
+    return fold_word(text.translate(_HARAKAT_TABLE), language)
+
+
+# Hemze taşıyıcıları ve elif biçimleri yalın harfe indirgenir (أ إ آ ٱ -> ا, ؤ -> و, ئ ى -> ي, ة -> ه)
+_ARABIC_FOLD_TABLE = {
+    **_HARAKAT_TABLE,
+    **dict.fromkeys(map(ord, "أإآٱ"), "ا"),
+    ord("ؤ"): "و",
+    ord("ئ"): "ي",
+    ord("ى"): "ي",
+    ord("ة"): "ه",
+}
+
+
+def normalize_arabic(text):
+    """Arapça metni karşılaştırma için normalleştir: harekeler atılır, hemze ve elif biçimleri birleştirilir"""
+    return " ".join(text.translate(_ARABIC_FOLD_TABLE).split())
+
+
+class Script(enum.Flag):
+    """Bir metinde bulunan yazı sistemleri"""
+    NONE = 0
+    ARABIC = enum.auto()
+    LATIN = enum.auto()
+    TURKISH = enum.auto()  # Türkçeye özgü harfler (ğ, ı, İ, ş); LATIN ile birlikte gelir
+
+    @property
+    def mixed(self):
+        """Hem Arapça hem Latin harfleri içeriyor mu"""
+        return Script.ARABIC in self and Script.LATIN in self
+
+
+_ARABIC_RE = re.compile('[\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF\uFB50-\uFDFF\uFE70-\uFEFF]')
+_LATIN_RE = re.compile('[A-Za-z\u00C0-\u024F]')
+_TURKISH_RE = re.compile('[ğĞıİşŞ]')
+
+
+@functools.lru_cache(maxsize=65536)
+def classify_script(text):
+    """Metindeki yazı sistemlerini Script bayrakları olarak döndür (sonuç metin başına önbelleklenir)"""
+    scripts = Script.NONE
+    if _ARABIC_RE.search(text):
+        scripts |= Script.ARABIC
+    if _LATIN_RE.search(text):
+        scripts |= Script.LATIN
+        if _TURKISH_RE.search(text):
+            scripts |= Script.TURKISH
+    return scripts
+
+
+def classify_column(texts):
+    """Bir sütundaki her metnin Script bayraklarını tek geçişte döndür"""
+    return [classify_script(text) for text in texts]
+
+
+def is_arabic_text(text):
+    return _ARABIC_RE.search(text) is not None
@@ -0,0 +1,354 @@
+"""Çeviri arka uçları, toplu çeviri ve kalıcı çeviri önbelleği"""
+
+import asyncio
+import inspect
+import os
+import random
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .storage import data_path
+from .text import fold_word
+
+# Her iş parçacığı kendi Translator'ını (ve async googletrans için kendi event loop'unu) tutar,
+# böylece bağlantılar thread'ler arasında paylaşılmaz ama aynı thread içinde yeniden kullanılır.
+_translator_state = threading.local()
+
+
+def get_translator():
+    """Çağıran thread'e ait Translator örneğini döndür"""
+    if getattr(_translator_state, 'translator', None) is None:
+        from googletrans import Translator
+        _translator_state.translator = Translator()
+    return _translator_state.translator
+
+
+def remote_translate(text, src, dest='ar'):
+    """Metni googletrans ile çevir (senkron ve async googletrans sürümlerini destekler)"""
+    result = get_translator().translate(text, src=src, dest=dest)
+    if inspect.isawaitable(result):
+        loop = getattr(_translator_state, 'loop', None)
+        if loop is None:
+            loop = _translator_state.loop = asyncio.new_event_loop()
+        result = loop.run_until_complete(result)
+    return result.text.strip()
+
+
+class TranslatorBackend:
+    """Çeviri arka ucu arayüzü. translate uygulanmalı; translate_batch isteğe bağlıdır."""
+
+    def translate(self, text, src, dest='ar'):
+        raise NotImplementedError
+
+    def translate_batch(self, texts, src, dest='ar'):
+        return [self.translate(text, src, dest) for text in texts]
+
+
+class GoogleTranslateBackend(TranslatorBackend):
+    """googletrans üzerinden çeviri (thread başına bir Translator)"""
+
+    def translate(self, text, src, dest='ar'):
+        return remote_translate(text, src, dest)
+
+    def translate_batch(self, texts, src, dest='ar'):
+        result = get_translator().translate(list(texts), src=src, dest=dest)
+        if inspect.isawaitable(result):
+            loop = getattr(_translator_state, 'loop', None)
+            if loop is None:
+                loop = _translator_state.loop = asyncio.new_event_loop()
+            result = loop.run_until_complete(result)
+        return [item.text.strip() for item in result]
+
+
+class FakeTranslatorBackend(TranslatorBackend):
+    """Ağa çıkmayan sahte arka uç (testler ve ölçümler için).
+
+    mapping'de olan kelimeler oradan, diğerleri "<dest>:<kelime>" olarak çevrilir;
+    latency her çağrıda beklenen süredir, fail_first ilk kaç çağrının hata vereceğidir.
+    """
+
+    def __init__(self, mapping=None, latency=0.0, fail_first=0):
+        self.mapping = mapping or {}
+        self.latency = latency
+        self.fail_first = fail_first
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _call(self):
+        with self._lock:
+            self.calls += 1
+            calls = self.calls
+        if self.latency:
+            time.sleep(self.latency)
+        if calls <= self.fail_first:
+            raise ConnectionError("fake translator failure")
+
+    def translate(self, text, src, dest='ar'):
+        self._call()
+        return self.mapping.get(text, f"{dest}:{text}")
+
+    def translate_batch(self, texts, src, dest='ar'):
+        self._call()
+        return [self.mapping.get(text, f"{dest}:{text}") for text in texts]
+
+
+class RateLimiter:
+    """Saniyede en fazla rate isteğe izin veren token-bucket (thread-safe)"""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class BatchTranslator:
+    """Çok sayıda kelimeyi sınırlı boyutlu gruplar halinde eşzamanlı çevirir.
+
+    Kelimeler fold_word ile tekilleştirilir ve önce önbelleğe bakılır. Gruplar en fazla
+    max_workers thread'de, hız sınırlayıcıdan geçerek gönderilir; hata veren grup üstel
+    geri çekilmeyle (backoff, 2*backoff, ...) retries kez yeniden denenir.
+    """
+
+    def __init__(self, backend, cache=None, batch_size=20, max_workers=4, rate=5.0, retries=3, backoff=1.0):
+        self.backend = backend
+        self.cache = cache
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.limiter = RateLimiter(rate, burst=max_workers)
+        self.retries = retries
+        self.backoff = backoff
+
+    def translate_all(self, words, src, dest='ar', progress=None, is_cancelled=None):
+        """Kelimeleri çevir; ({kelime: çeviri}, {kelime: hata}) döndür.
+
+        progress(tamamlanan, toplam) tekil kelime sayısıyla çağrılır. is_cancelled() True
+        dönerse BatchCancelled fırlatılır (kısmi sonuç döndürülmez).
+        """
+        unique = {}
+        for word in words:
+            unique.setdefault(fold_word(word, src), word.strip())
+
+        results = {}
+        todo = []
+        for key, word in unique.items():
+            cached = self.cache.get(word, src, dest) if self.cache is not None else None
+            if cached is not None:
+                results[key] = cached
+            else:
+                todo.append(key)
+
+        failures = {}
+        total = len(unique)
+        done = len(results)
+        if progress is not None:
+            progress(done, total)
+
+        batches = [todo[i:i + self.batch_size] for i in range(0, len(todo), self.batch_size)]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self._translate_batch, [unique[key] for key in batch], src, dest, is_cancelled): batch
+                       for batch in batches}
+            for future in as_completed(futures):
+                batch = futures[future]
+                try:
+                    translations = future.result()
+                except BatchCancelled:
+                    raise  # Kalan gruplar başlarken iptali görüp hemen çıkar
+                except Exception as e:
+                    for key in batch:
+                        failures[key] = str(e)
+                else:
+                    for key, translation in zip(batch, translations):
+                        results[key] = translation
+                        if self.cache is not None:
+                            self.cache.put(unique[key], translation, src, dest)
+                done += len(batch)
+                if progress is not None:
+                    progress(done, total)
+
+        return ({word: results[fold_word(word, src)] for word in words if fold_word(word, src) in results},
+                {word: failures[fold_word(word, src)] for word in words if fold_word(word, src) in failures})
+
+    def _translate_batch(self, texts, src, dest, is_cancelled):
+        for attempt in range(self.retries + 1):
+            if is_cancelled is not None and is_cancelled():
+                raise BatchCancelled()
+            self.limiter.acquire()
+            try:
+                translations = self.backend.translate_batch(texts, src, dest)
+                if len(translations) != len(texts):
+                    raise ValueError("translator returned a different number of results")
+                return translations
+            except Exception:
+                if attempt == self.retries:
+                    raise
+                time.sleep(self.backoff * 2 ** attempt * random.uniform(0.8, 1.2))
+
+
+class BatchCancelled(Exception):
+    """Toplu çeviri iptal edildi"""
+
+
+class TranslationCache:
+    """Uzak çeviri sonuçları için oturumlar arası kalıcı önbellek (SQLite).
+
+    Anahtar (src, dest, normalleştirilmiş kelime) üçlüsüdür. Kayıt sayısı max_entries'i
+    aşınca en uzun süredir kullanılmayanlar silinir; ttl (saniye) verilirse daha eski
+    kayıtlar yok sayılır. Birden çok thread'den kullanılabilir. Veritabanı hatasında
+    önbellek RETRY_AFTER saniye devre dışı kalır, sonra yeniden bağlanmayı dener.
+    """
+
+    EVICT_EVERY = 64  # Kaç yazmada bir boyut sınırı kontrol edilsin
+    RETRY_AFTER = 60.0
+
+    def __init__(self, path=None, max_entries=50000, ttl=None):
+        self.path = path or data_path("translation_cache.sqlite3")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._puts = 0
+        self._lock = threading.Lock()
+        self._conn = None
+        self._disabled_until = 0.0  # time.monotonic() değeri; o zamana kadar veritabanına gidilmez
+        self.last_error = None
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS translations (
+                    src TEXT NOT NULL,
+                    dest TEXT NOT NULL,
+                    word TEXT NOT NULL,
+                    translation TEXT NOT NULL,
+                    created REAL NOT NULL,
+                    last_used REAL NOT NULL,
+                    PRIMARY KEY (src, dest, word)
+                ) WITHOUT ROWID
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS translations_last_used ON translations (last_used)")
+            self._conn = conn
+            self._evict()
+        return self._conn
+
+    def _run(self, func):
+        """Veritabanı işlemini kilit altında çalıştır; hata olursa önbelleği bir süre devre dışı bırak"""
+        if time.monotonic() < self._disabled_until:
+            return None
+        with self._lock:
+            try:
+                return func(self._connect())
+            except (OSError, sqlite3.Error) as e:
+                print(f"Uyarı: Çeviri önbelleği {self.RETRY_AFTER:.0f} sn devre dışı: {e}")
+                self.last_error = str(e)
+                self._disabled_until = time.monotonic() + self.RETRY_AFTER
+                if self._conn is not None:
+                    self._conn.close()
+                    self._conn = None
+                return None
+
+    def get(self, word, src, dest='ar'):
+        """Önbellekteki çeviriyi döndür, yoksa (veya süresi dolduysa) None"""
+        key = (src, dest, fold_word(word, src))
+
+        def query(conn):
+            row = conn.execute(
+                "SELECT translation, created FROM translations WHERE src = ? AND dest = ? AND word = ?", key
+            ).fetchone()
+            now = time.time()
+            if row is None or (self.ttl is not None and now - row[1] > self.ttl):
+                self.misses += 1  # Sayaçlar da _run'ın kilidi altında güncellenir
+                return None
+            conn.execute("UPDATE translations SET last_used = ? WHERE src = ? AND dest = ? AND word = ?", (now, *key))
+            self.hits += 1
+            return row[0]
+
+        return self._run(query)
+
+    def peek(self, word, src, dest='ar'):
+        """get gibi, ama sayaçlara ve son kullanım zamanına dokunmaz (tahmini çeviri yoklamaları için)"""
+        key = (src, dest, fold_word(word, src))
+
+        def query(conn):
+            row = conn.execute(
+                "SELECT translation, created FROM translations WHERE src = ? AND dest = ? AND word = ?", key
+            ).fetchone()
+            if row is None or (self.ttl is not None and time.time() - row[1] > self.ttl):
+                return None
+            return row[0]
+
+        return self._run(query)
+
+    def complete(self, prefix, src, dest='ar', limit=3):
+        """Arama geçmişinde öneki prefix olan kelimeler, en son kullanılan önce (katlanmış hâlde)"""
+        key = fold_word(prefix, src)
+        if not key:
+            return []
+
+        def query(conn):
+            rows = conn.execute(
+                "SELECT word FROM translations WHERE src = ? AND dest = ? AND word >= ? AND word < ? "
+                "ORDER BY last_used DESC LIMIT ?", (src, dest, key, key + "\U0010ffff", limit)
+            ).fetchall()
+            return [row[0] for row in rows]
+
+        return self._run(query) or []
+
+    def put(self, word, translation, src, dest='ar'):
+        """Bir çeviriyi önbelleğe yaz"""
+        if not translation:
+            return
+
+        def store(conn):
+            now = time.time()
+            conn.execute(
+                "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?, ?)",
+                (src, dest, fold_word(word, src), translation, now, now),
+            )
+            self._puts += 1
+            if self._puts % self.EVICT_EVERY == 0:
+                self._evict()
+
+        self._run(store)
+
+    def _evict(self):
+        conn = self._conn
+        if self.ttl is not None:
+            conn.execute("DELETE FROM translations WHERE created < ?", (time.time() - self.ttl,))
+        excess = conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0] - self.max_entries
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM translations WHERE (src, dest, word) IN "
+                "(SELECT src, dest, word FROM translations ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
+
+    def stats(self):
+        """İsabet/ıskalama sayaçlarını ve kayıt sayısını döndür"""
+        entries = self._run(lambda conn: conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0])
+        return {'hits': self.hits, 'misses': self.misses, 'entries': entries or 0, 'error': self.last_error}
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
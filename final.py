@@ -1,595 +1,1805 @@
-import sys
-import json
-import os
-from PySide6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, 
-                              QLineEdit, QPushButton, QToolButton, QLabel, QTableWidget, 
-                              QTableWidgetItem, QHeaderView, QMessageBox, QFileDialog)
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QIcon, QRegion, QPainterPath
-from googletrans import Translator
-
-translator = Translator()
-try:
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib import colors
-    from reportlab.lib.units import inch
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
-    from reportlab.lib.styles import getSampleStyleSheet
-    from reportlab.pdfbase import pdfmetrics
-    from reportlab.pdfbase.ttfonts import TTFont
-    from reportlab.lib.enums import TA_LEFT, TA_RIGHT, TA_CENTER # Crucial: Import TA_CENTER
-
-    # Import for Arabic text shaping
-    from arabic_reshaper import ArabicReshaper
-    from bidi.algorithm import get_display
-
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
-    print("Warning: 'reportlab', 'arabic-reshaper', or 'python-bidi' not installed. PDF export will be disabled.")
-
-
-class TableEditorWindow(QWidget):
-    def __init__(self, parent, language):
-        super().__init__()
-        self.parent = parent
-        self.language = language
-
-        self.json_file = rf"C:\Users\hp\AppData\Roaming\dictionary_app_by_Anas_Moneer\main\dict_{language}.json"
-
-        self.setWindowTitle(f"Dictionary Editor - {language.upper()}")
-        self.setGeometry(200, 200, 600, 400)
-
-        icon_path = r"C:\Users\hp\AppData\Roaming\dictionary_app_by_Anas_Moneer\dictionary1.ico"
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
-        else:
-            print(f"Uyarı: İkon dosyası bulunamadı: {icon_path}")
-
-        layout = QVBoxLayout(self)
-
-        self.table = QTableWidget(self)
-        self.table.setColumnCount(2)
-
-        if language == "en":
-            headers = ["English", "Arabic"]
-        else:
-            headers = ["Turkish", "Arabic"]
-
-        self.table.setHorizontalHeaderLabels(headers)
-
-        header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.Stretch)
-
-        button_layout = QHBoxLayout()
-
-        add_button = QPushButton("Add Row", self)
-        add_button.clicked.connect(self.add_row)
-
-        delete_button = QPushButton("Delete Row", self)
-        delete_button.clicked.connect(self.delete_row)
-
-        save_button = QPushButton("Save", self)
-        save_button.clicked.connect(self.save_data)
-
-        export_button = QPushButton("Export PDF", self)
-        if not REPORTLAB_AVAILABLE:
-            export_button.setEnabled(False)
-            export_button.setToolTip("PDF dışa aktarma için 'reportlab', 'arabic-reshaper', 'python-bidi' yüklenmeli.")
-        export_button.clicked.connect(self.export_pdf)
-
-        button_layout.addWidget(add_button)
-        button_layout.addWidget(delete_button)
-        button_layout.addWidget(save_button)
-        button_layout.addWidget(export_button)
-
-        layout.addWidget(self.table)
-        layout.addLayout(button_layout)
-
-        self.load_data()
-
-    def load_data(self):
-        try:
-            if os.path.exists(self.json_file):
-                with open(self.json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                self.table.setRowCount(len(data))
-
-                for row, item in enumerate(data):
-                    word_item = QTableWidgetItem(item.get('word', ''))
-                    meaning_item = QTableWidgetItem(item.get('meaning', ''))
-
-                    self.table.setItem(row, 0, word_item)
-                    self.table.setItem(row, 1, meaning_item)
-            else:
-                self.table.setRowCount(0)
-                os.makedirs(os.path.dirname(self.json_file), exist_ok=True)
-                with open(self.json_file, 'w', encoding='utf-8') as f:
-                    json.dump([], f, ensure_ascii=False, indent=2)
-                QMessageBox.information(self, "Bilgi", f"Sözlük dosyası bulunamadı. '{os.path.basename(self.json_file)}' oluşturuldu.")
-
-        except json.JSONDecodeError:
-            QMessageBox.critical(self, "Hata", f"JSON dosyası bozuk: {self.json_file}. Lütfen kontrol edin veya silin.")
-            self.table.setRowCount(0)
-        except Exception as e:
-            QMessageBox.warning(self, "Hata", f"Dosya yüklenirken hata: {str(e)}")
-
-    def add_row(self):
-        row_count = self.table.rowCount()
-        self.table.insertRow(row_count)
-
-        self.table.setItem(row_count, 0, QTableWidgetItem(""))
-        self.table.setItem(row_count, 1, QTableWidgetItem(""))
-
-    def delete_row(self):
-        current_row = self.table.currentRow()
-        if current_row >= 0:
-            self.table.removeRow(current_row)
-
-    def save_data(self):
-        try:
-            data = []
-
-            for row in range(self.table.rowCount()):
-                word_item = self.table.item(row, 0)
-                meaning_item = self.table.item(row, 1)
-
-                if word_item and meaning_item:
-                    word = word_item.text().strip()
-                    meaning = meaning_item.text().strip()
-
-                    if word or meaning:
-                        data.append({
-                            'word': word,
-                            'meaning': meaning
-                        })
-
-            os.makedirs(os.path.dirname(self.json_file), exist_ok=True)
-            with open(self.json_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-
-        except Exception as e:
-            QMessageBox.critical(self, "Hata", f"Kaydetme hatası: {str(e)}")
-
-    def export_pdf(self):
-        if not REPORTLAB_AVAILABLE:
-            QMessageBox.critical(self, "Hata", "PDF dışa aktarma için 'reportlab', 'arabic-reshaper', 'python-bidi' kütüphaneleri gerekli.\n\nKurulum: pip install reportlab arabic-reshaper python-bidi")
-            return
-
-        try:
-            file_path, _ = QFileDialog.getSaveFileName(
-                self,
-                "PDF Olarak Kaydet",
-                f"dictionary_{self.language}.pdf",
-                "PDF Files (*.pdf)"
-            )
-
-            if not file_path:
-                return
-
-            # Re-import ReportLab components to ensure they are available within this scope
-            from reportlab.lib.pagesizes import A4
-            from reportlab.lib import colors
-            from reportlab.lib.units import inch
-            from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
-            from reportlab.lib.styles import getSampleStyleSheet
-            from reportlab.pdfbase import pdfmetrics
-            from reportlab.pdfbase.ttfonts import TTFont
-            from reportlab.lib.enums import TA_LEFT, TA_RIGHT, TA_CENTER # Crucial: Import TA_CENTER
-
-            # --- Amiri Fontunu Buraya Kaydedin ---
-            AMIRI_FONT_PATH = r"C:\Users\hp\AppData\Roaming\dictionary_app_by_Anas_Moneer\main\Amiri-Regular.ttf"
-            AMIRI_FONT_NAME = 'Amiri' # ReportLab içinde kullanacağınız isim
-
-            if os.path.exists(AMIRI_FONT_PATH):
-                try:
-                    pdfmetrics.registerFont(TTFont(AMIRI_FONT_NAME, AMIRI_FONT_PATH))
-                    # Verify if the font was actually registered
-                    if pdfmetrics.getFont(AMIRI_FONT_NAME):
-                        print(f"DEBUG: Amiri fontu başarıyla yüklendi: {AMIRI_FONT_PATH}")
-                    else:
-                        raise RuntimeError("Font registration failed silently.")
-                except Exception as e:
-                    QMessageBox.warning(self, "Font Hatası", f"Amiri fontu yüklenirken hata oluştu: {e}\nPDF'deki Arapça metinler doğru görünmeyebilir.")
-                    AMIRI_FONT_NAME = 'Helvetica' # Fallback
-            else:
-                QMessageBox.warning(self, "Font Hatası", f"Amiri fontu bulunamadı: {AMIRI_FONT_PATH}\nPDF'deki Arapça metinler doğru görünmeyebilir.")
-                AMIRI_FONT_NAME = 'Helvetica' # Fallback
-
-            doc = SimpleDocTemplate(file_path, pagesize=A4)
-            elements = []
-
-            table_data = []
-
-            # Header'ları Paragraph olarak ekleyin ve hizalamaları ayarlayın
-            styles = getSampleStyleSheet()
-            header_ltr_style = styles['h2'].clone('HeaderLTRStyle') # Clone for safety
-            header_ltr_style.fontName = 'Helvetica-Bold'
-            header_ltr_style.alignment = TA_CENTER # Changed to TA_CENTER
-
-            header_rtl_style = styles['h2'].clone('HeaderRTLStyle') # Clone for safety
-            header_rtl_style.fontName = 'Helvetica-Bold'
-            header_rtl_style.alignment = TA_CENTER # Changed to TA_CENTER
-
-            processed_headers = []
-            if self.language == "en":
-                processed_headers.append(Paragraph("English", header_ltr_style))
-                processed_headers.append(Paragraph("Arabic", header_rtl_style))
-            else:
-                processed_headers.append(Paragraph("Turkish", header_ltr_style))
-                processed_headers.append(Paragraph("Arabic", header_rtl_style))
-
-            table_data.append(processed_headers)
-
-            # Arapça metin stili
-            arabic_style = styles['Normal'].clone('ArabicStyle') # Clone the style
-            arabic_style.fontName = AMIRI_FONT_NAME # Arapça fontunu kullan
-            arabic_style.alignment = TA_CENTER # Changed to TA_CENTER
-            arabic_style.rightToLeft = 1 # Explicitly set right-to-left direction
-            arabic_style.fontSize = 10
-            arabic_style.allowSplitting = 0 # Prevent splitting of Arabic text
-            arabic_style.leading = 12 # Add leading for better line spacing
-
-            # Latin (Türkçe/İngilizce) metin stili
-            ltr_style = styles['Normal'].clone('LTRStyle') # Clone the style
-            ltr_style.fontName = 'Helvetica' # veya 'Times-Roman'
-            ltr_style.alignment = TA_CENTER # Changed to TA_CENTER
-            ltr_style.fontSize = 10
-
-            for row in range(self.table.rowCount()):
-                word_item = self.table.item(row, 0)
-                meaning_item = self.table.item(row, 1)
-
-                if word_item and meaning_item:
-                    word = word_item.text().strip()
-                    meaning = meaning_item.text().strip()
-
-                    if word or meaning:
-                        processed_meaning_paragraph = None
-                        # Check if the meaning contains Arabic characters
-                        if self.is_arabic_text(meaning):
-                            processed_meaning = self.prepare_arabic_text(meaning)
-                            
-                            # --- Diagnostic: Save reshaped Arabic text for verification ---
-                            # Bu bölüm hata ayıklama amaçlıdır ve doğrulandıktan sonra kaldırılabilir.
-                            # try:
-                            #     debug_file_path = os.path.join(os.path.dirname(file_path), "debug_arabic_text.txt")
-                            #     with open(debug_file_path, 'a', encoding='utf-8') as df:
-                            #         df.write(f"Original: {meaning}\n")
-                            #         df.write(f"Reshaped: {processed_meaning}\n\n")
-                            #     print(f"DEBUG: Reshaped Arabic text appended to {debug_file_path}")
-                            # except Exception as debug_e:
-                            #     print(f"DEBUG: Failed to write debug Arabic text: {debug_e}")
-                            # ----------------------------------------------------------------
-
-                            processed_meaning_paragraph = Paragraph(processed_meaning, arabic_style)
-                        else:
-                            processed_meaning_paragraph = Paragraph(meaning, ltr_style)
-
-                        processed_word_paragraph = Paragraph(word, ltr_style)
-
-                        table_data.append([processed_word_paragraph, processed_meaning_paragraph])
-
-            if len(table_data) <= 1:
-                QMessageBox.information(self, "Bilgi", "Tabloda PDF'e aktarılacak veri yok!")
-                return
-
-            table = Table(table_data, colWidths=[3*inch, 3*inch])
-
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('LINEBELOW', (0, 0), (-1, 0), 2, colors.black),
-                ('LEFTPADDING', (0, 0), (-1, -1), 6),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-                ('TOPPADDING', (0, 0), (-1, -1), 6),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                # Alignment for cells is handled by the Paragraph styles themselves
-            ]))
-
-            elements.append(table)
-            doc.build(elements)
-
-        except Exception as e:
-            QMessageBox.critical(self, "Hata", f"PDF kaydetme hatası: {str(e)}")
-
-    def is_arabic_text(self, text):
-        # A more concise check for Arabic characters
-        for char in text:
-            if '\u0600' <= char <= '\u06FF' or \
-               '\u0750' <= char <= '\u077F' or \
-               '\u08A0' <= char <= '\u08FF' or \
-               '\uFB50' <= char <= '\uFDFF' or \
-               '\uFE70' <= char <= '\uFEFF':
-                return True
-        return False
-
-    def prepare_arabic_text(self, text):
-        reshaper = ArabicReshaper(
-            configuration={
-                'delete_harakat': False,
-                'delete_tatweel': False,
-                'support_ligatures': True,
-                'arabic_reshaper_join_by_shadda': True,
-                'delete_unnecessary_dots': False,
-                'shift_harakat_position': False,
-                'support_vocalized_arabic': True,
-            }
-        )
-        reshaped_text = reshaper.reshape(text)
-        bidi_text = get_display(reshaped_text)
-        return bidi_text
-
-    def closeEvent(self, event):
-        self.save_data()
-        event.accept()
-
-
-class DictionaryApp(QWidget):
-    def __init__(self):
-        super().__init__()
-
-        self.setWindowTitle("Dictionary")
-        self.setGeometry(1210, 100, 200, 20)
-        self.title_bar_visible = True
-        self.always_on_top = False
-        self.table_window = None
-	
-        self.setWindowIcon(QIcon(r"C:\Users\hp\AppData\Roaming\dictionary_app_by_Anas_Moneer\dictionary1.ico"))
-
-        # --- 1. Katman: Şeffaf pencere ---
-        outer_layout = QVBoxLayout(self)
-        outer_layout.setSizeConstraint(QVBoxLayout.SetFixedSize)
-        outer_layout.setContentsMargins(0, 0, 0, 0)
-
-        # --- 2. Katman: Radius'lu içerik ---
-        self.content_widget = QWidget(self)
-        self.content_widget.setStyleSheet("""
-            background-color: #2E2E2E;
-            border-radius: 7px;
-        """)
-        outer_layout.addWidget(self.content_widget)
-
-        # --- Layoutlar ---
-        main_layout = QVBoxLayout(self.content_widget)
-        
-        input_layout = QVBoxLayout()
-
-        # --- Giriş kutusu (kelime) ---
-        self.english_entry = QLineEdit(self.content_widget)
-        self.english_entry.setPlaceholderText("Enter Word")
-        self.english_entry.setStyleSheet("""
-            font-size: 12pt;
-            padding: 5px;
-            border-radius: 5px;
-            border: 1px solid #FD7B01;
-            width: 120px;
-        """)
-        self.english_entry.textChanged.connect(self.reset_timer)
-
-        # --- Çeviri kutusu ---
-        self.translation_entry = QLineEdit(self.content_widget)
-        self.translation_entry.setReadOnly(True)
-        self.translation_entry.setPlaceholderText("Meaning")
-        self.translation_entry.setStyleSheet("""
-            font-size: 12pt;
-            padding: 5px;
-            border-radius: 5px;
-            border: 1px solid #FF4031;
-            width: 120px;
-        """)
-
-        # --- Save Butonu ---
-        self.save_button = QPushButton("Save", self.content_widget)
-        self.save_button.setStyleSheet("""
-            font-size: 12pt;
-            padding: 5px;
-            border-radius: 5px;
-            background-color: #FF3510;
-            color: white;
-            width: 80px;
-            height: 24px;
-        """)
-        self.save_button.clicked.connect(self.save_to_json)
-
-        # --- Mod Değiştirici Buton ---
-        self.mode_button = QToolButton(self.content_widget)
-        self.mode_button.setText("EN")
-        self.mode_button.setStyleSheet("""
-            background-color: #FB9901;
-            border-radius: 5px;
-            font-size: 12pt;
-            padding: 5px;
-            width: 30px;
-            height: 21px;
-        """)
-        self.mode_button.clicked.connect(self.toggle_language_mode)
-        self.language = "en"
-
-        # --- Pin Butonu ---
-        self.pin_button = QToolButton(self.content_widget)
-        self.pin_button.setText("⚲")
-        self.pin_button.setStyleSheet("""
-            background-color: #FF4031;
-            border-radius: 5px;
-            font-size: 12pt;
-            padding: 5px;
-            width: 23px;
-            height: 22px;
-        """)
-        self.pin_button.clicked.connect(self.toggle_title_bar)
-
-        # --- Tablo Editör Butonu ---
-        self.table_button = QToolButton(self.content_widget)
-        self.table_button.setText("📄")
-        self.table_button.setStyleSheet("""
-            background-color: #4CAF50;
-            border-radius: 5px;
-            font-size: 12pt;
-            padding: 5px;
-            width: 23px;
-            height: 22px;
-        """)
-        self.table_button.clicked.connect(self.open_table_editor)
-
-        # --- Layoutlara yerleştir ---
-        input_layout.addWidget(self.english_entry)
-        input_layout.addWidget(self.translation_entry)
-        
-        button_layout = QHBoxLayout()
-        button_layout.addWidget(self.save_button)
-        button_layout.addWidget(self.mode_button)
-        button_layout.addWidget(self.pin_button)
-        button_layout.addWidget(self.table_button)
-
-        main_layout.addLayout(input_layout)
-        main_layout.addLayout(button_layout)
-
-        # Timer for debouncing
-        self.timer = QTimer(self)
-        self.timer.setSingleShot(True)  # Only run once after the timeout
-        self.timer.timeout.connect(self.translate_word)
-
-    def reset_timer(self):
-        """Reset the timer every time the user types a new character"""
-        self.timer.start(500)  # Start the timer again with a 500ms delay
-
-    def translate_word(self):
-        """Kelimeyi çevirmek için bu fonksiyonu kullan"""
-        if self.english_entry.text().strip() == "":
-            self.translation_entry.clear()
-            return
-
-        english_word = self.english_entry.text().strip().capitalize()
-        arabic_word = translator.translate(english_word, src=self.language, dest='ar').text.strip()
-
-        self.translation_entry.setText(arabic_word)
-
-    def toggle_language_mode(self):
-        """Dil modunu değiştir ve buton görünümünü güncelle"""
-        if self.language == "en":
-            self.language = "tr"
-            self.mode_button.setText("TR")
-            self.mode_button.setStyleSheet("""
-                background-color: #B74135;
-                border-radius: 5px;
-                font-size: 12pt;
-                padding: 5px;
-                width: 30px;
-                height: 21px;
-            """)
-        else:
-            self.language = "en"
-            self.mode_button.setText("EN")
-            self.mode_button.setStyleSheet("""
-                background-color: #FB9901;
-                border-radius: 5px;
-                font-size: 12pt;
-                padding: 5px;
-                width: 30px;
-                height: 21px;
-            """)
-        self.translate_word()
-
-    def toggle_title_bar(self):
-        if self.always_on_top:
-            self.setWindowFlags(Qt.Window)
-            self.setAttribute(Qt.WA_TranslucentBackground, False)
-            self.setMask(QRegion())
-            self.always_on_top = False
-            self.content_widget.setStyleSheet("""
-            background-color: #2E2E2E;  /* Koyu gri */
-            border-radius: 7px;
-        """)
-        else:
-            self.move(self.x(), self.y() + 30)
-            self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
-            self.setAttribute(Qt.WA_TranslucentBackground, True)
-            self.always_on_top = True
-            self.apply_rounded_mask()  # Şekli kırparak uygula
-
-        self.setGeometry(self.x(), self.y(), self.width(), self.height())
-        self.show()
-
-    def apply_rounded_mask(self):
-        radius = 8
-        rect = self.rect()
-
-        path = QPainterPath()
-        path.addRoundedRect(rect, radius, radius)
-
-        region = QRegion(path.toFillPolygon().toPolygon())
-        self.setMask(region)
-
-    def save_to_json(self):
-        """Çevirilen kelimeyi JSON dosyasına kaydet"""
-        if self.english_entry.text() == "":
-            return
-        
-        english_word = self.english_entry.text().strip().capitalize()
-        arabic_word = self.translation_entry.text().strip()
-        
-        json_file = rf"C:\Users\hp\AppData\Roaming\dictionary_app_by_Anas_Moneer\main\dict_{self.language}.json"
-        
-        try:
-            # Mevcut verileri yükle
-            data = []
-            if os.path.exists(json_file):
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-            
-            # Yeni veriyi ekle
-            new_entry = {
-                'word': english_word,
-                'meaning': arabic_word
-            }
-            
-            # Aynı kelime var mı kontrol et
-            word_exists = False
-            for i, entry in enumerate(data):
-                if entry['word'].lower() == english_word.lower():
-                    data[i] = new_entry  # Güncelle
-                    word_exists = True
-                    break
-            
-            if not word_exists:
-                data.append(new_entry)  # Yeni ekle
-            
-            # Dosyaya kaydet
-            os.makedirs(os.path.dirname(json_file), exist_ok=True)
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            
-        except Exception as e:
-            print(f"JSON kaydetme hatası: {e}")
-
-        # Girişleri temizle
-        self.english_entry.clear()
-        self.english_entry.setFocus()
-        self.translation_entry.clear()
-
-    def open_table_editor(self):
-        """Tablo editör penceresini aç"""
-        if self.table_window is None or not self.table_window.isVisible():
-            self.table_window = TableEditorWindow(self, self.language)
-            self.table_window.show()
-        else:
-            self.table_window.raise_()
-            self.table_window.activateWindow()
-
-    def closeEvent(self, event):
-        """Override the close event to hide the window instead of quitting the application"""
-        event.accept()  # Do not let the window close
-        self.hide()  # Hide the window
-
-# Uygulama başlatma
-app = QApplication(sys.argv)
-window = DictionaryApp()
-
-# Start the application
-window.show()
-sys.exit(app.exec())
+import time
+_STARTUP_T0 = time.perf_counter()  # --startup-timing için modülün yüklenmeye başladığı an
+
+import sys
+import json
+import os
+import threading
+from bisect import bisect_left
+from PySide6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, 
+                              QLineEdit, QPushButton, QToolButton, QLabel, QTableView, 
+                              QHeaderView, QMessageBox, QFileDialog, QProgressDialog, QListWidget,
+                              QTableWidget, QTableWidgetItem, QCheckBox)
+from PySide6.QtCore import (Qt, QTimer, QObject, QRunnable, QThreadPool, QThread, Signal,
+                            QAbstractTableModel, QModelIndex, QEvent, QFileSystemWatcher)
+from PySide6.QtGui import QIcon, QRegion, QPainterPath, QKeySequence, QShortcut
+
+_STARTUP_IMPORTS_DONE = time.perf_counter()
+
+from dictionary_core import (APP_DIR, BatchCancelled, BatchTranslator, GoogleTranslateBackend, LookupService,
+                             ReviewScheduler, ReviewStore, SearchIndex, SpeculativePrefetcher, TypingCadence,
+                             capitalize_word, data_path, fold_word, is_arabic_text, metrics)
+from dictionary_core.bulk import ImportCancelled, export_rows, iter_file, plan_import
+from dictionary_core.pdf_export import (REPORTLAB_AVAILABLE, ExportCancelled, build_dictionary_pdf,
+                                        prepare_arabic_text, register_arabic_font)
+
+ICON_FILE = "dictionary1.ico"  # Uygulama klasöründe (APP_DIR)
+
+
+class TranslationSignals(QObject):
+    finished = Signal(int, str, str)  # request_id, word, translation
+    failed = Signal(int, str, str)  # request_id, word, error
+
+
+class TranslationTask(QRunnable):
+    """Tek bir çeviri isteğini thread havuzunda çalıştırır"""
+
+    def __init__(self, request_id, word, language, backend, cache=None, speculative=None):
+        super().__init__()
+        self.request_id = request_id
+        self.word = word
+        self.language = language
+        self.backend = backend
+        self.cache = cache
+        self.speculative = speculative  # Aynı kelime için ağdaki tahmini isteğin Future'ı
+        self.signals = TranslationSignals()
+
+    def run(self):
+        try:
+            text = None
+            if self.speculative is not None:
+                # Tahmini istek zaten yolda: ikinci kez ağa çıkmak yerine onu bekle
+                try:
+                    text = self.speculative.result()
+                except Exception:
+                    text = None
+            if text is None and self.cache is not None:
+                # Aramayla bu görevin başlaması arasında biten tahmini istek sonucu önbelleğe yazmış olabilir
+                text = self.cache.peek(self.word, src=self.language)
+            if text is None:
+                with metrics.timer("translate.network"):
+                    text = self.backend.translate(self.word, src=self.language)
+                if self.cache is not None:
+                    self.cache.put(self.word, text, src=self.language)
+        except Exception as e:
+            self.signals.failed.emit(self.request_id, self.word, str(e))
+        else:
+            self.signals.finished.emit(self.request_id, self.word, text)
+
+
+class TranslationService(QObject):
+    """Çevirileri GUI thread'i dışında yapar.
+
+    Her isteğe artan bir kimlik verilir; yalnızca en son isteğin yanıtı yayınlanır,
+    eskiler sessizce atılır. Her dil için aynı anda en fazla bir istek ağdadır; bu sırada
+    gelen yeni istekler tek bir bekleme yuvasında birbirinin yerine geçer.
+    """
+
+    translated = Signal(str, str)  # word, translation
+    failed = Signal(str, str)  # word, error
+
+    def __init__(self, parent=None, cache=None, backend=None, prefetcher=None):
+        super().__init__(parent)
+        self.cache = cache
+        self.backend = backend or GoogleTranslateBackend()
+        self.prefetcher = prefetcher
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(2)
+        self.pool.setExpiryTimeout(-1)  # Thread'ler (ve Translator bağlantıları) canlı kalsın
+        self._latest_id = 0
+        self._in_flight = {}  # language -> TranslationTask
+        self._pending = {}  # language -> (request_id, word)
+
+    def request(self, word, language):
+        """Yeni bir çeviri iste ve istek kimliğini döndür"""
+        self._latest_id += 1
+        if language in self._in_flight:
+            self._pending[language] = (self._latest_id, word)
+        else:
+            self._start(self._latest_id, word, language)
+        return self._latest_id
+
+    def cancel(self):
+        """Bekleyen istekleri bırak; uçuştaki isteklerin yanıtı geldiğinde atılır"""
+        self._latest_id += 1
+        self._pending.clear()
+
+    def _start(self, request_id, word, language):
+        speculative = self.prefetcher.pending(word, language) if self.prefetcher is not None else None
+        task = TranslationTask(request_id, word, language, self.backend, self.cache, speculative)
+        task.signals.finished.connect(lambda rid, w, text, lang=language: self._on_finished(lang, rid, w, text))
+        task.signals.failed.connect(lambda rid, w, error, lang=language: self._on_failed(lang, rid, w, error))
+        self._in_flight[language] = task
+        self.pool.start(task)
+
+    def _on_finished(self, language, request_id, word, text):
+        self._start_next(language)
+        if request_id == self._latest_id:
+            self.translated.emit(word, text)
+
+    def _on_failed(self, language, request_id, word, error):
+        self._start_next(language)
+        if request_id == self._latest_id:
+            self.failed.emit(word, error)
+
+    def _start_next(self, language):
+        self._in_flight.pop(language, None)
+        pending = self._pending.pop(language, None)
+        if pending is not None:
+            self._start(pending[0], pending[1], language)
+
+
+class BatchTranslationWorker(QThread):
+    """BatchTranslator'ı GUI thread'i dışında çalıştırır"""
+
+    progress = Signal(int, int)  # tamamlanan, toplam
+    translated = Signal(dict, dict)  # {kelime: çeviri}, {kelime: hata}
+    failed = Signal(str)
+
+    def __init__(self, translator, words, language, parent=None):
+        super().__init__(parent)
+        self.translator = translator
+        self.words = words
+        self.language = language
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def run(self):
+        try:
+            results, failures = self.translator.translate_all(
+                self.words, self.language, progress=self.progress.emit, is_cancelled=self._cancelled.is_set)
+        except BatchCancelled:
+            return
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.translated.emit(results, failures)
+
+
+class DictionaryTableModel(QAbstractTableModel):
+    """Tablo editörü için sanal model.
+
+    Kayıtlar paralel listelerde (sütun düzeninde) tutulur ve görünüm yalnızca ekrandaki
+    hücreleri data() ile ister; satır başına widget nesnesi oluşturulmaz. Her satır sabit
+    bir yuva (slot) numarasına sahiptir: silinen satırların yuvası boşaltılır, _order
+    görünen satır -> yuva eşlemesini tutar. Değişen yuvalar ve silinen orijinal kelimeler
+    izlenir, böylece kaydetme yalnızca farkları yazar.
+
+    Başka bir pencere veya süreçte kaydedilen değişiklikler merge_external ile satır satır
+    uygulanır; kaydedilmemiş değişiklik içeren kelimelere dokunulmaz, conflicts'e eklenir.
+    """
+
+    INDEX_CHUNK = 1000  # Olay döngüsü turu başına indekslenecek satır
+
+    edited = Signal()  # Kullanıcı düzenlemesi (dışarıdan birleştirilen değişikliklerde yayınlanmaz)
+
+    def __init__(self, headers, language, parent=None):
+        super().__init__(parent)
+        self.headers = headers
+        self.language = language
+        self._words = []
+        self._meanings = []
+        self._origin = []  # Yuvanın diskteki kelimesi (yeni satırlarda None)
+        self._slot_by_key = {}  # fold_word(diskteki kelime) -> yuva
+        self._order = []  # Görünen satır -> yuva (her zaman artan sırada)
+        self._dirty = set()
+        self._deleted = []  # Kaydedilmemiş silmelerin orijinal kelimeleri
+        self.conflicts = {}  # fold_word(kelime) -> kelime: hem burada hem dışarıda değişenler
+        self._saving = {}  # Son anlık görüntüde yazılan hâller: fold_word(kelime) -> (kelime, anlam) / None
+        self.search_index = SearchIndex(language)
+        self._indexed_upto = 0
+        self._index_target = 0
+        self.filter_text = ""
+
+    def load(self, entries):
+        self.beginResetModel()
+        self._words = [entry.get('word', '') for entry in entries]
+        self._meanings = [entry.get('meaning', '') for entry in entries]
+        self._origin = list(self._words)
+        self._slot_by_key = {}
+        for slot, word in enumerate(self._words):
+            self._slot_by_key.setdefault(fold_word(word, self.language), slot)
+        self._order = list(range(len(self._words)))
+        self._dirty = set()
+        self._deleted = []
+        self.conflicts = {}
+        self._saving = {}
+        self.search_index = SearchIndex(self.language)
+        self._indexed_upto = 0
+        self._index_target = len(self._words)
+        self.filter_text = ""
+        self.endResetModel()
+        # Arama indeksi olay döngüsünü bloklamadan küçük parçalar halinde kurulur
+        QTimer.singleShot(0, self._index_next_chunk)
+
+    def _index_next_chunk(self):
+        self._build_index(self._indexed_upto + self.INDEX_CHUNK)
+        if self._indexed_upto < self._index_target:
+            QTimer.singleShot(0, self._index_next_chunk)
+
+    def _build_index(self, upto):
+        upto = min(upto, self._index_target)
+        for slot in range(self._indexed_upto, upto):
+            if self._words[slot] is not None:
+                self.search_index.add(slot, self._words[slot], self._meanings[slot])
+        self._indexed_upto = max(self._indexed_upto, upto)
+
+    def set_filter(self, text):
+        """Yalnızca metni içeren satırları göster (boş metin filtreyi kaldırır)"""
+        text = text.strip()
+        if text == self.filter_text:
+            return
+        self._build_index(self._index_target)  # İndeks henüz bitmediyse tamamla
+        self.beginResetModel()
+        self.filter_text = text
+        if text:
+            # Yuvalar eklenme sırasında olduğundan sıralamak görünüm sırasını korur
+            self._order = sorted(self.search_index.search(text))
+        else:
+            self._order = [slot for slot, word in enumerate(self._words) if word is not None]
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._order)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        slot = self._order[index.row()]
+        return self._words[slot] if index.column() == 0 else self._meanings[slot]
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        slot = self._order[index.row()]
+        column = self._words if index.column() == 0 else self._meanings
+        if column[slot] == value:
+            return False
+        column[slot] = value
+        self._dirty.add(slot)
+        self.search_index.update(slot, self._words[slot], self._meanings[slot])
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        self.edited.emit()
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.headers[section]
+        return str(section + 1)
+
+    def append_row(self, word="", meaning=""):
+        """Sona yeni bir satır ekle ve satır numarasını döndür"""
+        row = len(self._order)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._words.append(word)
+        self._meanings.append(meaning)
+        self._origin.append(None)
+        slot = len(self._words) - 1
+        self._order.append(slot)
+        self._dirty.add(slot)
+        self.search_index.add(slot, word, meaning)
+        self.endInsertRows()
+        self.edited.emit()
+        return row
+
+    def remove_row(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        slot = self._order.pop(row)
+        if self._origin[slot]:
+            self._deleted.append(self._origin[slot])
+            self._forget_key(self._origin[slot], slot)
+        self._words[slot] = self._meanings[slot] = self._origin[slot] = None
+        self._dirty.discard(slot)
+        self.search_index.remove(slot)
+        self.endRemoveRows()
+        self.edited.emit()
+
+    def missing_meanings(self):
+        """Kelimesi olup anlamı boş olan canlı satırları [(yuva, kelime)] olarak döndür"""
+        return [(slot, word) for slot, (word, meaning) in enumerate(zip(self._words, self._meanings))
+                if word is not None and word.strip() and not meaning.strip()]
+
+    def fill_meanings(self, meanings):
+        """{yuva: (kelime, anlam)} ile boş anlamları doldur; bu arada değişen satırlara dokunma"""
+        filled = False
+        for slot, (word, meaning) in meanings.items():
+            if self._words[slot] == word and not self._meanings[slot].strip():
+                self._meanings[slot] = meaning
+                self._dirty.add(slot)
+                self.search_index.update(slot, word, meaning)
+                filled = True
+        if self._order:
+            self.dataChanged.emit(self.index(0, 1), self.index(len(self._order) - 1, 1),
+                                  [Qt.DisplayRole, Qt.EditRole])
+        if filled:
+            self.edited.emit()
+
+    def rows(self):
+        """Görünen satırları (word, meaning) olarak sırayla üret"""
+        for slot in self._order:
+            yield self._words[slot], self._meanings[slot]
+
+    def is_dirty(self):
+        return bool(self._dirty or self._deleted)
+
+    def pending_changes(self):
+        """Kaydedilmemiş değişiklikleri (upserts, deletes) olarak döndür"""
+        upserts, deletes, _ = self.snapshot_changes()
+        return upserts, deletes
+
+    def snapshot_changes(self, skip=()):
+        """Kaydedilmemiş değişikliklerin değişmez anlık görüntüsü: (upserts, deletes, state).
+
+        Dönen listeler yalnızca dizeler içerir, başka bir thread'de yazılabilir; yazma
+        bitince state mark_saved'e verilir. skip'teki (katlanmış) kelimeler atlanır.
+        """
+        upserts = []
+        deletes = []
+        deleted = []
+        for word in self._deleted:
+            if fold_word(word, self.language) not in skip:
+                deletes.append(word)
+                deleted.append(word)
+        saved = {}
+        for slot in sorted(self._dirty):
+            word = self._words[slot].strip()
+            meaning = self._meanings[slot].strip()
+            origin = self._origin[slot]
+            if skip and (fold_word(word, self.language) in skip
+                         or (origin and fold_word(origin, self.language) in skip)):
+                continue
+            if origin and fold_word(origin, self.language) != fold_word(word, self.language):
+                deletes.append(origin)  # Kelime yeniden adlandırıldı
+            if word:
+                upserts.append((word, meaning))
+            saved[slot] = (origin, self._words[slot], self._meanings[slot])
+        # Yazmanın bildirimi, yazma sürerken yeniden düzenlenen satırlarda çakışma sayılmasın
+        self._saving = {fold_word(word, self.language): None for word in deletes}
+        self._saving.update((fold_word(word, self.language), (word, meaning)) for word, meaning in upserts)
+        return upserts, deletes, (saved, deleted)
+
+    def mark_saved(self, state):
+        """snapshot_changes ile alınan değişiklikler diske yazıldı.
+
+        Yazma sürerken yeniden düzenlenen satırlar kirli kalır; yalnızca diskteki kelimeleri
+        (yeniden adlandırma ve silme için) güncellenir.
+        """
+        saved, deleted = state
+        for word in deleted:
+            if word in self._deleted:
+                self._deleted.remove(word)
+        for slot, (origin, word, meaning) in saved.items():
+            disk_word = word.strip() or None
+            if self._words[slot] is None:
+                # Yazma sırasında silindi: silme artık diskteki kelimeyi hedeflemeli
+                if origin in self._deleted:
+                    self._deleted.remove(origin)
+                if disk_word:
+                    self._deleted.append(disk_word)
+                continue
+            if self._origin[slot]:
+                self._forget_key(self._origin[slot], slot)
+            self._origin[slot] = disk_word
+            if disk_word:
+                self._slot_by_key[fold_word(disk_word, self.language)] = slot
+            if self._words[slot] == word and self._meanings[slot] == meaning:
+                self._dirty.discard(slot)
+
+    def mark_clean(self):
+        for slot in self._dirty:
+            word = self._words[slot].strip()
+            if self._origin[slot]:
+                self._forget_key(self._origin[slot], slot)
+            self._origin[slot] = word or None
+            if word:
+                self._slot_by_key[fold_word(word, self.language)] = slot
+        self._dirty = set()
+        self._deleted = []
+        self.conflicts = {}
+
+    def _forget_key(self, word, slot):
+        key = fold_word(word, self.language)
+        if self._slot_by_key.get(key) == slot:
+            del self._slot_by_key[key]
+
+    def _row_of(self, slot):
+        """Yuvanın görünen satırı, görünmüyorsa None"""
+        row = bisect_left(self._order, slot)
+        if row < len(self._order) and self._order[row] == slot:
+            return row
+        return None
+
+    def merge_external(self, changes):
+        """Diskteki [(kelime, anlam; silindiyse None)] değişikliklerini modele uygula.
+
+        Yalnızca etkilenen satırlar güncellenir, eklenir veya çıkarılır. Kaydedilmemiş
+        değişikliği olan kelimeler çakışma olarak işaretlenir.
+        """
+        if not changes:
+            return
+        # Kaydedilmemiş hâller: katlanmış kelime -> (kelime, anlam); silinen/yeniden adlandırılan -> None
+        local = {fold_word(word, self.language): None for word in self._deleted}
+        for slot in self._dirty:
+            if self._origin[slot]:
+                local.setdefault(fold_word(self._origin[slot], self.language), None)
+        for slot in self._dirty:
+            local[fold_word(self._words[slot], self.language)] = (self._words[slot].strip(), self._meanings[slot].strip())
+        appended = {}  # Yeni kelimeler sonda tek bir satır ekleme bildirimiyle eklenir (toplu içe aktarma)
+        for word, meaning in changes:
+            key = fold_word(word, self.language)
+            if key in local:
+                # Diskteki hâl buradakiyle ya da kendi yazdığımızla aynıysa çakışma yok
+                disk = None if meaning is None else (word, meaning)
+                if local[key] != disk and (key not in self._saving or self._saving[key] != disk):
+                    self.conflicts[key] = word
+                continue
+            if key in appended:
+                if meaning is None:
+                    del appended[key]
+                else:
+                    appended[key] = (word, meaning)
+                continue
+            slot = self._slot_by_key.get(key)
+            if meaning is None:
+                if slot is not None:
+                    self._remove_slot(slot)
+            elif slot is None:
+                appended[key] = (word, meaning)
+            elif self._words[slot] != word or self._meanings[slot] != meaning:
+                self._words[slot] = self._origin[slot] = word
+                self._meanings[slot] = meaning
+                self.search_index.update(slot, word, meaning)
+                row = self._row_of(slot)
+                if row is not None:
+                    self.dataChanged.emit(self.index(row, 0), self.index(row, 1), [Qt.DisplayRole, Qt.EditRole])
+        self._append_slots(appended.values())
+
+    def merge_snapshot(self, entries):
+        """Diskin tamamı yeniden okunduğunda: yalnızca farkları merge_external ile uygula"""
+        disk = {}
+        for entry in entries:
+            disk.setdefault(fold_word(entry['word'], self.language), (entry['word'], entry['meaning']))
+        changes = [(self._origin[slot], None) for key, slot in self._slot_by_key.items() if key not in disk]
+        for key, (word, meaning) in disk.items():
+            slot = self._slot_by_key.get(key)
+            if slot is None or self._words[slot] != word or self._meanings[slot] != meaning:
+                changes.append((word, meaning))
+        self.merge_external(changes)
+
+    def _remove_slot(self, slot):
+        row = self._row_of(slot)
+        if row is not None:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._order[row]
+        self._forget_key(self._origin[slot], slot)
+        self._words[slot] = self._meanings[slot] = self._origin[slot] = None
+        self.search_index.remove(slot)
+        if row is not None:
+            self.endRemoveRows()
+
+    def _append_slots(self, rows):
+        visible = []
+        for word, meaning in rows:
+            self._words.append(word)
+            self._meanings.append(meaning)
+            self._origin.append(word)
+            slot = len(self._words) - 1
+            self._slot_by_key[fold_word(word, self.language)] = slot
+            self.search_index.add(slot, word, meaning)
+            if not self.filter_text or self.search_index.matches(slot, self.filter_text):
+                visible.append(slot)
+        if visible:
+            first = len(self._order)
+            self.beginInsertRows(QModelIndex(), first, first + len(visible) - 1)
+            self._order.extend(visible)
+            self.endInsertRows()
+
+
+class PdfExportWorker(QThread):
+    """build_dictionary_pdf'i GUI thread'i dışında çalıştırır"""
+
+    progress = Signal(int)
+    failed = Signal(str)
+
+    def __init__(self, file_path, language, rows, font_name, parent=None):
+        super().__init__(parent)
+        self.file_path = file_path
+        self.language = language
+        self.rows = rows
+        self.font_name = font_name
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def run(self):
+        try:
+            build_dictionary_pdf(self.file_path, self.language, self.rows, self.font_name,
+                                 progress=self.progress.emit, is_cancelled=self._cancelled.is_set)
+        except ExportCancelled:
+            pass
+        except Exception as e:
+            self.failed.emit(str(e))
+
+
+class AutosaveWorker(QThread):
+    """Editördeki değişikliklerin anlık görüntüsünü GUI thread'i dışında günlüğe yazar"""
+
+    def __init__(self, store, upserts, deletes, state, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.upserts = upserts
+        self.deletes = deletes
+        self.state = state  # DictionaryTableModel.snapshot_changes'in döndürdüğü durum
+        self.error = None
+
+    def run(self):
+        try:
+            with metrics.timer("editor.autosave"):
+                self.store.apply(self.upserts, self.deletes)
+        except Exception as e:
+            self.error = str(e)
+
+
+class ImportWorker(QThread):
+    """Dosyayı okuyup sözlükle karşılaştırır (plan_import); commit() ile yeniden başlatılınca
+    planlanan kayıtları tek atomik günlük satırıyla yazar"""
+
+    progress = Signal(int)
+    failed = Signal(str)
+
+    def __init__(self, store, file_path, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.file_path = file_path
+        self.upserts = None
+        self.report = None
+        self.error = None
+        self.committing = False
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def commit(self):
+        self.committing = True
+        self.start()
+
+    def run(self):
+        started = time.perf_counter()
+        try:
+            if self.committing:
+                with metrics.timer("editor.import_commit"):
+                    self.store.apply(self.upserts)
+            else:
+                self.upserts, self.report = plan_import(self.store, iter_file(self.file_path),
+                                                        progress=self.progress.emit,
+                                                        is_cancelled=self._cancelled.is_set)
+        except ImportCancelled:
+            return
+        except Exception as e:
+            self.error = str(e)
+            self.failed.emit(self.error)
+            return
+        # Okuma ve yazma süreleri toplanır (aradaki çakışma sorusu hariç)
+        self.report.seconds += time.perf_counter() - started
+
+
+class TableEditorWindow(QWidget):
+    AUTOSAVE_IDLE_MS = 1500  # Son düzenlemeden bu kadar sonra otomatik kaydet
+
+    # Sözlük dinleyicisi herhangi bir thread'den çağrılabilir; değişiklikler GUI thread'ine kuyrukla taşınır
+    store_changed = Signal(object)
+
+    def __init__(self, parent, language):
+        super().__init__()
+        self.parent = parent
+        self.language = language
+
+        self.store = parent.local_dictionary(language)
+        self.json_file = self.store.json_file
+        self.export_worker = None
+        self.batch_worker = None
+        self.import_worker = None
+        self.save_worker = None
+
+        self.setWindowTitle(f"Dictionary Editor - {language.upper()}")
+        self.setGeometry(200, 200, 600, 400)
+
+        icon_path = os.path.join(APP_DIR, ICON_FILE)
+        if os.path.exists(icon_path):
+            self.setWindowIcon(QIcon(icon_path))
+        else:
+            print(f"Uyarı: İkon dosyası bulunamadı: {icon_path}")
+
+        layout = QVBoxLayout(self)
+
+        # Kelime veya anlamda yazarken filtrele
+        self.filter_entry = QLineEdit(self)
+        self.filter_entry.setPlaceholderText("Ara...")
+        self.filter_entry.setClearButtonEnabled(True)
+        self.filter_entry.textChanged.connect(self.model_filter_changed)
+
+        if language == "en":
+            headers = ["English", "Arabic"]
+        else:
+            headers = ["Turkish", "Arabic"]
+
+        self.model = DictionaryTableModel(headers, language, self)
+        self.table = QTableView(self)
+        self.table.setModel(self.model)
+        # Sabit satır yüksekliği: görünüm satır boyutlarını tek tek ölçmez
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        header.setSectionResizeMode(1, QHeaderView.Stretch)
+
+        button_layout = QHBoxLayout()
+
+        add_button = QPushButton("Add Row", self)
+        add_button.clicked.connect(self.add_row)
+
+        delete_button = QPushButton("Delete Row", self)
+        delete_button.clicked.connect(self.delete_row)
+
+        save_button = QPushButton("Save", self)
+        save_button.clicked.connect(self.save_data)
+
+        export_button = QPushButton("Export PDF", self)
+        if not REPORTLAB_AVAILABLE:
+            export_button.setEnabled(False)
+            export_button.setToolTip("PDF dışa aktarma için 'reportlab', 'arabic-reshaper', 'python-bidi' yüklenmeli.")
+        export_button.clicked.connect(self.export_pdf)
+
+        self.import_button = QPushButton("Import", self)
+        self.import_button.setToolTip("CSV, TSV, JSONL veya Anki (.txt) dosyasından kelime içe aktar")
+        self.import_button.clicked.connect(self.import_file)
+
+        export_file_button = QPushButton("Export", self)
+        export_file_button.setToolTip("Tabloyu CSV, TSV, JSONL veya Anki dosyası olarak kaydet")
+        export_file_button.clicked.connect(self.export_file)
+
+        self.translate_missing_button = QPushButton("Translate Missing", self)
+        self.translate_missing_button.setToolTip("Anlamı boş olan kelimeleri toplu olarak çevir")
+        self.translate_missing_button.clicked.connect(self.translate_missing)
+
+        button_layout.addWidget(add_button)
+        button_layout.addWidget(delete_button)
+        button_layout.addWidget(save_button)
+        button_layout.addWidget(self.import_button)
+        button_layout.addWidget(export_file_button)
+        button_layout.addWidget(export_button)
+        button_layout.addWidget(self.translate_missing_button)
+
+        layout.addWidget(self.filter_entry)
+        layout.addWidget(self.table)
+        layout.addLayout(button_layout)
+
+        self.load_data()
+
+        # Art arda gelen düzenlemeler, yazmaya ara verilince tek bir arka plan yazmasında birleşir
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.setSingleShot(True)
+        self.autosave_timer.setInterval(self.AUTOSAVE_IDLE_MS)
+        self.autosave_timer.timeout.connect(self.autosave)
+        self.model.edited.connect(self.autosave_timer.start)
+
+        # Açılır pencerenin ve diğer süreçlerin kaydettikleri tabloya satır satır işlenir
+        self.store_changed.connect(self.on_store_changed, Qt.QueuedConnection)
+        store = self.store
+        self._store_listener = listener = self.store_changed.emit
+        store.add_listener(listener)
+        self.destroyed.connect(lambda: store.remove_listener(listener))
+
+    def model_filter_changed(self, text):
+        self.model.set_filter(text)
+
+    def load_data(self):
+        try:
+            # Kanonik dosya + günlük; açılır pencere ile aynı depolama motoru kullanılır.
+            # Sözlük zaten yüklüyse yalnızca diğer süreçlerin değişiklikleri okunur.
+            with metrics.timer("editor.load.read"):
+                self.store.refresh()
+                if self.store.load_error is not None:
+                    raise self.store.load_error
+            with metrics.timer("editor.load.model"):
+                self.model.load(self.store.entries())
+            self.filter_entry.clear()
+
+            if not os.path.exists(self.json_file):
+                self.store.compact(create=True)
+                QMessageBox.information(self, "Bilgi", f"Sözlük dosyası bulunamadı. '{os.path.basename(self.json_file)}' oluşturuldu.")
+
+        except json.JSONDecodeError:
+            QMessageBox.critical(self, "Hata", f"JSON dosyası bozuk: {self.json_file}. Lütfen kontrol edin veya silin.")
+            self.model.load([])
+        except Exception as e:
+            QMessageBox.warning(self, "Hata", f"Dosya yüklenirken hata: {str(e)}")
+
+    def add_row(self):
+        row = self.model.append_row()
+        self.table.scrollToBottom()
+        self.table.setCurrentIndex(self.model.index(row, 0))
+
+    def delete_row(self):
+        current_row = self.table.currentIndex().row()
+        if current_row >= 0:
+            self.model.remove_row(current_row)
+
+    def autosave(self):
+        """Kaydedilmemiş değişiklikleri arka planda yaz (çakışan kelimeler Save'e bırakılır)"""
+        if self.save_worker is not None:
+            self.autosave_timer.start()  # Önceki yazma bitince yeniden dene
+            return
+        upserts, deletes, state = self.model.snapshot_changes(skip=set(self.model.conflicts))
+        if not upserts and not deletes:
+            return
+        worker = AutosaveWorker(self.store, upserts, deletes, state, self)
+        worker.finished.connect(lambda: self.finish_autosave(worker))
+        self.save_worker = worker
+        worker.start()
+
+    def finish_autosave(self, worker):
+        if self.save_worker is not worker:
+            return  # wait_for_autosave zaten işledi
+        self.save_worker = None
+        worker.deleteLater()
+        if worker.error is not None:
+            print(f"Otomatik kaydetme hatası: {worker.error}")
+            self.autosave_timer.start()
+        else:
+            self.model.mark_saved(worker.state)
+
+    def wait_for_autosave(self):
+        self.autosave_timer.stop()
+        worker = self.save_worker
+        if worker is not None:
+            worker.wait()
+            self.finish_autosave(worker)
+
+    def save_data(self):
+        self.wait_for_autosave()
+        try:
+            # Yalnızca değişen satırlar günlüğe yazılır
+            upserts, deletes = self.model.pending_changes()
+            conflicts = self.model.conflicts
+            keep_disk = False
+            if conflicts:
+                answer = QMessageBox.question(
+                    self, "Çakışma",
+                    f"Şu kelimeler siz düzenlerken başka bir yerde de değiştirildi: {', '.join(sorted(conflicts.values()))}.\n"
+                    "Sizin değişiklikleriniz kaydedilsin mi? (Hayır: diskteki hâlleri korunur)")
+                if answer != QMessageBox.Yes:
+                    keep_disk = True
+                    upserts = [(word, meaning) for word, meaning in upserts
+                               if fold_word(word, self.language) not in conflicts]
+                    deletes = [word for word in deletes if fold_word(word, self.language) not in conflicts]
+            self.store.apply(upserts, deletes)
+            self.model.mark_clean()
+            if keep_disk:
+                self.model.merge_snapshot(self.store.entries())
+
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Kaydetme hatası: {str(e)}")
+
+    def on_store_changed(self, changes):
+        if changes is None:
+            # Dosyalar baştan okundu (ör. başka bir süreç sıkıştırdı); farklar hesaplanır
+            self.model.merge_snapshot(self.store.entries())
+        else:
+            self.model.merge_external(changes)
+
+    def export_pdf(self):
+        if not REPORTLAB_AVAILABLE:
+            QMessageBox.critical(self, "Hata", "PDF dışa aktarma için 'reportlab', 'arabic-reshaper', 'python-bidi' kütüphaneleri gerekli.\n\nKurulum: pip install reportlab arabic-reshaper python-bidi")
+            return
+
+        if self.export_worker is not None:
+            QMessageBox.information(self, "Bilgi", "PDF dışa aktarma zaten devam ediyor.")
+            return
+
+        try:
+            # Satırların anlık görüntüsü: yalnızca mevcut dizelere referanslar, kopya yok
+            rows = list(self.model.rows())
+            if not any(word.strip() or meaning.strip() for word, meaning in rows):
+                QMessageBox.information(self, "Bilgi", "Tabloda PDF'e aktarılacak veri yok!")
+                return
+
+            file_path, _ = QFileDialog.getSaveFileName(
+                self,
+                "PDF Olarak Kaydet",
+                f"dictionary_{self.language}.pdf",
+                "PDF Files (*.pdf)"
+            )
+
+            if not file_path:
+                return
+
+            font_name, font_warning = register_arabic_font()
+            if font_warning:
+                QMessageBox.warning(self, "Font Hatası", font_warning)
+
+            self.export_progress = QProgressDialog("PDF oluşturuluyor...", "İptal", 0, len(rows), self)
+            self.export_progress.setWindowModality(Qt.WindowModal)
+            self.export_progress.setMinimumDuration(300)
+
+            self.export_worker = PdfExportWorker(file_path, self.language, rows, font_name, self)
+            self.export_worker.progress.connect(self.export_progress.setValue)
+            self.export_worker.failed.connect(self.on_export_failed)
+            self.export_worker.finished.connect(self.on_export_finished)
+            self.export_progress.canceled.connect(self.export_worker.cancel)
+            self.export_worker.start()
+
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"PDF kaydetme hatası: {str(e)}")
+
+    EXPORT_FORMATS = {"CSV (*.csv)": 'csv', "TSV (*.tsv)": 'tsv', "JSONL (*.jsonl)": 'jsonl', "Anki (*.txt)": 'anki'}
+
+    def import_file(self):
+        """Dosyayı arka planda okuyup sözlükle karşılaştır; çakışmaları sorup tek seferde kaydet"""
+        if self.import_worker is not None:
+            QMessageBox.information(self, "Bilgi", "İçe aktarma zaten devam ediyor.")
+            return
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "İçe Aktar", "", "Sözlük dosyaları (*.csv *.tsv *.tab *.jsonl *.ndjson *.txt);;Tüm dosyalar (*)")
+        if not file_path:
+            return
+
+        self.import_progress = QProgressDialog("Dosya okunuyor...", "İptal", 0, 0, self)
+        self.import_progress.setWindowModality(Qt.WindowModal)
+        self.import_progress.setMinimumDuration(300)
+
+        self.import_worker = ImportWorker(self.store, file_path, self)
+        self.import_worker.progress.connect(lambda rows: self.import_progress.setLabelText(f"{rows} satır okundu..."))
+        self.import_worker.failed.connect(lambda error: QMessageBox.critical(self, "Hata", f"İçe aktarma hatası: {error}"))
+        self.import_worker.finished.connect(self.on_import_finished)
+        self.import_progress.canceled.connect(self.import_worker.cancel)
+        self.import_button.setEnabled(False)
+        self.import_worker.start()
+
+    def on_import_finished(self):
+        worker = self.import_worker
+        report = worker.report
+        if worker.error is not None:
+            report = None  # Hata bildirildi; başarı özeti gösterilmez
+        elif not worker.committing and report is not None and not worker._cancelled.is_set():
+            conflicts = [conflict for conflict in report.conflicts if conflict.source == 'dictionary']
+            if conflicts:
+                sample = ", ".join(conflict.word for conflict in conflicts[:5])
+                answer = QMessageBox.question(
+                    self, "Çakışma",
+                    f"{len(conflicts)} kelime sözlükte farklı bir anlamla kayıtlı ({sample}...).\n"
+                    "Dosyadaki anlamlar kullanılsın mı?")
+                if answer == QMessageBox.Yes:
+                    worker.upserts += report.accept_conflicts()
+            if worker.upserts:
+                # Yazma iptal edilemez: tek günlük satırı hep birlikte ya da hiç uygulanır
+                self.import_progress.setLabelText(f"{len(worker.upserts)} kayıt kaydediliyor...")
+                self.import_progress.setCancelButton(None)
+                worker.commit()
+                return
+        self.import_progress.reset()
+        if report is not None and not worker._cancelled.is_set():
+            QMessageBox.information(self, "Bilgi", report.summary())
+        worker.deleteLater()
+        self.import_worker = None
+        self.import_button.setEnabled(True)
+
+    def export_file(self):
+        """Görünen satırları seçilen biçimde dosyaya kaydet"""
+        file_path, selected = QFileDialog.getSaveFileName(
+            self, "Dışa Aktar", f"dictionary_{self.language}.csv", ";;".join(self.EXPORT_FORMATS))
+        if not file_path:
+            return
+        try:
+            rows = [(word.strip(), meaning.strip()) for word, meaning in self.model.rows() if word.strip()]
+            count = export_rows(rows, file_path, self.EXPORT_FORMATS.get(selected))
+        except (OSError, ValueError) as e:
+            QMessageBox.critical(self, "Hata", f"Dışa aktarma hatası: {e}")
+            return
+        QMessageBox.information(self, "Bilgi", f"{count} kayıt dışa aktarıldı: {file_path}")
+
+    def translate_missing(self):
+        """Anlamı boş satırları arka planda toplu çevir ve sonuçları tabloya yaz"""
+        if self.batch_worker is not None:
+            return
+
+        self.missing_rows = self.model.missing_meanings()
+        if not self.missing_rows:
+            QMessageBox.information(self, "Bilgi", "Anlamı boş olan kelime yok.")
+            return
+
+        words = [word for _, word in self.missing_rows]
+        translator = BatchTranslator(self.parent.translation_service.backend, cache=self.parent.translation_cache)
+
+        self.batch_progress = QProgressDialog("Kelimeler çevriliyor...", "İptal", 0, len(words), self)
+        self.batch_progress.setWindowModality(Qt.WindowModal)
+        self.batch_progress.setMinimumDuration(300)
+
+        self.batch_worker = BatchTranslationWorker(translator, words, self.language, self)
+        self.batch_worker.progress.connect(self.on_batch_progress)
+        self.batch_worker.translated.connect(self.on_batch_translated)
+        self.batch_worker.failed.connect(lambda error: QMessageBox.critical(self, "Hata", f"Çeviri hatası: {error}"))
+        self.batch_worker.finished.connect(self.on_batch_finished)
+        self.batch_progress.canceled.connect(self.batch_worker.cancel)
+        self.translate_missing_button.setEnabled(False)
+        self.batch_worker.start()
+
+    def on_batch_progress(self, done, total):
+        self.batch_progress.setMaximum(total)
+        self.batch_progress.setValue(done)
+
+    def on_batch_translated(self, results, failures):
+        self.model.fill_meanings({slot: (word, results[word]) for slot, word in self.missing_rows if word in results})
+        if failures:
+            QMessageBox.warning(self, "Uyarı", f"{len(failures)} kelime çevrilemedi.")
+
+    def on_batch_finished(self):
+        self.batch_progress.reset()
+        self.batch_worker.deleteLater()
+        self.batch_worker = None
+        self.missing_rows = []
+        self.translate_missing_button.setEnabled(True)
+
+    def on_export_failed(self, error):
+        QMessageBox.critical(self, "Hata", f"PDF kaydetme hatası: {error}")
+
+    def on_export_finished(self):
+        self.export_progress.reset()
+        self.export_worker.deleteLater()
+        self.export_worker = None
+
+    def is_arabic_text(self, text):
+        return is_arabic_text(text)
+
+    def prepare_arabic_text(self, text):
+        return prepare_arabic_text(text)
+
+    def closeEvent(self, event):
+        for worker in (self.export_worker, self.batch_worker, self.import_worker):
+            if worker is not None:
+                worker.cancel()
+                worker.wait()
+        self.save_data()
+        self.store.remove_listener(self._store_listener)
+        event.accept()
+
+
+class PerformanceWindow(QWidget):
+    """Ölçülen sıcak yolların histogram özetlerini gösteren tanılama penceresi"""
+
+    COLUMNS = ["Ölçüm", "Adet", "Ort. ms", "p50 ms", "p95 ms", "En büyük ms"]
+
+    def __init__(self, prefetcher=None):
+        super().__init__()
+        self.prefetcher = prefetcher
+        self.setWindowTitle("Performans")
+        self.setGeometry(250, 250, 560, 320)
+
+        layout = QVBoxLayout(self)
+        self.enabled_box = QCheckBox("Ölçümü etkinleştir", self)
+        self.enabled_box.setChecked(metrics.enabled)
+        self.enabled_box.toggled.connect(self.set_enabled)
+
+        # Tahmini çeviri için kapatma anahtarı ve sayaçlar
+        self.speculation_box = QCheckBox("Tahmini çeviri", self)
+        self.speculation_box.setToolTip("Yazarken duraksamalarda kelimeyi önceden çevirip önbelleğe al")
+        self.speculation_box.setChecked(prefetcher is not None and prefetcher.enabled)
+        self.speculation_box.setEnabled(prefetcher is not None)
+        self.speculation_box.toggled.connect(self.set_speculation)
+        self.speculation_label = QLabel(self)
+
+        self.table = QTableWidget(0, len(self.COLUMNS), self)
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+
+        button_layout = QHBoxLayout()
+        reset_button = QPushButton("Sıfırla", self)
+        reset_button.clicked.connect(self.reset)
+        dump_button = QPushButton("JSON'a Aktar", self)
+        dump_button.clicked.connect(self.dump_json)
+        self.profile_button = QPushButton("Profili Başlat", self)
+        self.profile_button.setToolTip("GUI thread'inde cProfile ve tracemalloc yakalaması")
+        self.profile_button.clicked.connect(self.toggle_profiling)
+        button_layout.addWidget(reset_button)
+        button_layout.addWidget(dump_button)
+        button_layout.addWidget(self.profile_button)
+
+        layout.addWidget(self.enabled_box)
+        layout.addWidget(self.speculation_box)
+        layout.addWidget(self.speculation_label)
+        layout.addWidget(self.table)
+        layout.addLayout(button_layout)
+
+        # Yalnızca pencere açıkken yenilenir
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        self.refresh()
+        self.refresh_timer.start(1000)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.refresh_timer.stop()
+        super().hideEvent(event)
+
+    def set_enabled(self, enabled):
+        metrics.enabled = enabled
+
+    def set_speculation(self, enabled):
+        self.prefetcher.enabled = enabled
+
+    def refresh(self):
+        if self.prefetcher is not None:
+            stats = self.prefetcher.stats()
+            self.speculation_label.setText(
+                f"Tahmini istek: {stats['requested']}, kullanılan: {stats['used']}, boşa giden: {stats['wasted']}, "
+                f"düşürülen: {stats['dropped']}, hata: {stats['errors']}, yolda: {stats['in_flight']}")
+        snapshot = metrics.snapshot()
+        self.table.setRowCount(len(snapshot))
+        for row, (name, summary) in enumerate(snapshot.items()):
+            values = [name, summary['count'], summary['mean_ms'], summary['p50_ms'], summary['p95_ms'], summary['max_ms']]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(str(value))
+                if column:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                item.setToolTip(json.dumps(summary['buckets']))
+                self.table.setItem(row, column, item)
+
+    def reset(self):
+        metrics.reset()
+        self.refresh()
+
+    def dump_json(self):
+        file_path, _ = QFileDialog.getSaveFileName(self, "Ölçümleri Kaydet", data_path("metrics.json"), "JSON Files (*.json)")
+        if not file_path:
+            return
+        try:
+            metrics.dump_json(file_path)
+        except OSError as e:
+            QMessageBox.critical(self, "Hata", f"Ölçümler kaydedilemedi: {e}")
+
+    def toggle_profiling(self):
+        if not metrics.profiling:
+            metrics.start_profiling()
+            self.profile_button.setText("Profili Durdur")
+            return
+        try:
+            paths = metrics.stop_profiling(data_path("profiles"))
+        except OSError as e:
+            QMessageBox.critical(self, "Hata", f"Profil kaydedilemedi: {e}")
+            return
+        finally:
+            self.profile_button.setText("Profili Başlat")
+        QMessageBox.information(self, "Bilgi", "Profil kaydedildi:\n" + "\n".join(paths))
+
+
+class ReviewLoader(QThread):
+    """Tekrar durumlarını okuyup planlayıcıyı GUI thread'i dışında kurar"""
+
+    def __init__(self, store, language, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.language = language
+        self.scheduler = None
+        self.error = None
+
+    def run(self):
+        try:
+            self.scheduler = ReviewScheduler(self.store, ReviewStore(self.language))
+        except Exception as e:
+            self.error = str(e)
+
+
+class ReviewWindow(QWidget):
+    """Kayıtlı kelimeleri SM-2 aralıklı tekrarla soran kart penceresi"""
+
+    ANSWERS = [("Bilemedim", 1), ("Zor", 3), ("İyi", 4), ("Kolay", 5)]  # (etiket, SM-2 kalitesi)
+    DUE_LIMIT = 1000  # Durum satırında bundan fazlası "1000+" gösterilir
+    WAKE_WITHIN = 3600  # Bu kadar saniye içinde zamanı gelecek kart varsa pencere açıkken beklenir
+
+    def __init__(self, parent, language):
+        super().__init__()
+        self.parent = parent
+        self.language = language
+        self.scheduler = None
+        self.card = None
+        self.setWindowTitle(f"Tekrar ({language.upper()})")
+        self.setGeometry(250, 200, 380, 220)
+
+        layout = QVBoxLayout(self)
+        self.status_label = QLabel("Yükleniyor...", self)
+        self.word_label = QLabel(self)
+        self.word_label.setAlignment(Qt.AlignCenter)
+        self.word_label.setWordWrap(True)
+        self.word_label.setStyleSheet("font-size: 18pt;")
+        self.meaning_label = QLabel(self)
+        self.meaning_label.setAlignment(Qt.AlignCenter)
+        self.meaning_label.setWordWrap(True)
+        self.meaning_label.setStyleSheet("font-size: 18pt; color: #FB9901;")
+
+        self.show_button = QPushButton("Cevabı Göster", self)
+        self.show_button.setShortcut(QKeySequence(Qt.Key_Space))
+        self.show_button.clicked.connect(self.reveal)
+
+        answer_layout = QHBoxLayout()
+        self.answer_buttons = []
+        for number, (label, quality) in enumerate(self.ANSWERS, 1):
+            button = QPushButton(f"{label} ({number})", self)
+            button.setShortcut(QKeySequence(str(number)))
+            button.clicked.connect(lambda _=False, quality=quality: self.answer(quality))
+            answer_layout.addWidget(button)
+            self.answer_buttons.append(button)
+
+        layout.addWidget(self.status_label)
+        layout.addWidget(self.word_label, 1)
+        layout.addWidget(self.meaning_label, 1)
+        layout.addWidget(self.show_button)
+        layout.addLayout(answer_layout)
+
+        # Yeniden sorulacak kartın zamanı gelince kendiliğinden devam et
+        self.wake_timer = QTimer(self)
+        self.wake_timer.setSingleShot(True)
+        self.wake_timer.timeout.connect(self.next_card)
+
+        self.set_buttons(reveal=False, answer=False)
+        scheduler = parent.review_schedulers.get(language)
+        if scheduler is not None:
+            self.set_scheduler(scheduler)
+        else:
+            # Yükleyici uygulamaya bağlıdır: pencere erken kapansa da thread tamamlanır
+            self.loader = ReviewLoader(parent.local_dictionary(language), language, parent)
+            self.loader.finished.connect(self.on_loaded)
+            self.loader.start()
+
+    def on_loaded(self):
+        if self.loader.error:
+            QMessageBox.critical(self, "Hata", f"Tekrar durumları yüklenemedi: {self.loader.error}")
+            self.status_label.setText("")
+            return
+        scheduler = self.parent.review_schedulers.setdefault(self.language, self.loader.scheduler)
+        if scheduler is not self.loader.scheduler:
+            self.loader.scheduler.close()  # Aynı dil başka bir pencereden yüklenmiş
+        self.set_scheduler(scheduler)
+
+    def set_scheduler(self, scheduler):
+        self.scheduler = scheduler
+        scheduler.start_session()  # Planlayıcı uygulama boyunca saklanır; yeni kart sınırı pencere başınadır
+        self.next_card()
+
+    def set_buttons(self, reveal, answer):
+        self.show_button.setEnabled(reveal)
+        for button in self.answer_buttons:
+            button.setEnabled(answer)
+
+    def next_card(self):
+        """Sıradaki kartı göster; yoksa bir sonraki kartın zamanını bekle"""
+        self.wake_timer.stop()
+        with metrics.timer("review.next"):
+            self.card = self.scheduler.next_card()
+        self.meaning_label.clear()
+        if self.card is None:
+            self.word_label.setText("Şimdilik tekrar edilecek kelime yok")
+            self.set_buttons(reveal=False, answer=False)
+            next_due = self.scheduler.next_due()
+            if next_due is not None and next_due - time.time() < self.WAKE_WITHIN:
+                self.wake_timer.start(max(0, int((next_due - time.time()) * 1000)) + 100)
+        else:
+            self.word_label.setText(self.card.word)
+            self.set_buttons(reveal=True, answer=False)
+        self.update_status()
+
+    def reveal(self):
+        if self.card is not None:
+            self.meaning_label.setText(self.card.meaning)
+            self.set_buttons(reveal=False, answer=True)
+
+    def answer(self, quality):
+        if self.card is None or self.show_button.isEnabled():
+            return  # Cevap görülmeden değerlendirilemez
+        with metrics.timer("review.answer"):
+            self.scheduler.answer(self.card, quality)  # Yazma arka planda toplu yapılır
+        self.next_card()
+
+    def update_status(self):
+        due = self.scheduler.due_count(limit=self.DUE_LIMIT)
+        due_text = f"{due}+" if due >= self.DUE_LIMIT else str(due)
+        self.status_label.setText(f"Zamanı gelen: {due_text}   Yeni: {max(0, self.scheduler.new_remaining)}")
+
+
+class DictionaryWatcher(QObject):
+    """Sözlük dosyalarını izler; başka bir süreç kaydettiğinde sözlükleri tazeler.
+
+    Kanonik dosya atomik yeniden adlandırmayla değiştiğinde dosya izlemesi düşer, bu
+    yüzden klasör de izlenir ve yollar her tazelemede yeniden eklenir. Art arda gelen
+    bildirimler kısa bir gecikmeyle tek tazelemede birleştirilir.
+    """
+
+    watch_requested = Signal(object)  # Diğer thread'lerden gelen izleme istekleri (kuyruklu)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.stores = []
+        self.watch_requested.connect(self.watch)
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.schedule)
+        self.watcher.directoryChanged.connect(self.schedule)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(100)
+        self.timer.timeout.connect(self.refresh)
+
+    def watch_later(self, store):
+        """Herhangi bir thread'den çağrılabilir; izleme GUI thread'inde başlar"""
+        self.watch_requested.emit(store)
+
+    def watch(self, store):
+        if store not in self.stores:
+            self.stores.append(store)
+            self._watch_paths(store)
+
+    def _watch_paths(self, store):
+        paths = [os.path.dirname(store.json_file) or "."]
+        paths += [path for path in (store.json_file, store.journal_file) if os.path.exists(path)]
+        watched = set(self.watcher.files()) | set(self.watcher.directories())
+        missing = [path for path in paths if path not in watched and os.path.isdir(os.path.dirname(path) or ".")]
+        if missing:
+            self.watcher.addPaths(missing)
+
+    def schedule(self, path=None):
+        self.timer.start()
+
+    def refresh(self):
+        for store in self.stores:
+            self._watch_paths(store)
+            try:
+                store.refresh()  # Yalnızca kendi yazmalarımız varsa bir stat'tan ibaret
+            except Exception as e:
+                print(f"Sözlük tazelenemedi ({store.json_file}): {e}")
+
+
+class StartupTimer(QObject):
+    """Açılış sürelerini stderr'e yazar (--startup-timing veya DICTIONARY_STARTUP_TIMING=1)"""
+
+    def __init__(self, t0):
+        super().__init__()
+        self.t0 = t0
+        self._last = t0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def enabled():
+        return "--startup-timing" in sys.argv or os.environ.get("DICTIONARY_STARTUP_TIMING") == "1"
+
+    def mark(self, name, at=None):
+        at = time.perf_counter() if at is None else at
+        with self._lock:
+            print(f"[startup] {name:<18} {(at - self.t0) * 1000:8.1f} ms  (+{(at - self._last) * 1000:.1f} ms)",
+                  file=sys.stderr)
+            self._last = max(self._last, at)
+
+    def watch_first_paint(self, widget):
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            obj.removeEventFilter(self)
+            self.mark("first paint")
+        return False
+
+
+def warm_up(app_window, startup=None):
+    """Pencere göründükten sonra arka planda ağır modülleri ve yerel verileri hazırla"""
+    started = time.perf_counter()
+    service = app_window.lookup_service
+    try:
+        service.dictionary(app_window.language).suggest("")  # Sözlüğü yükle ve öneri indeksini kur
+        # Diğer dilin sözlüğü ve Arapça ters arama indeksleri: dil değiştirmek dosya okumasın
+        for language in service.lexicon.languages:
+            # Dosya izleyicisi GUI thread'ine ait; kayıt oraya kuyrukla gönderilir
+            app_window.dictionary_watcher.watch_later(service.dictionary(language))
+        service.lexicon.warm()
+        app_window.translation_cache.stats()
+    except Exception as e:
+        print(f"Isınma hatası: {e}")
+    if startup is not None:
+        startup.mark(f"warm-up ({(time.perf_counter() - started) * 1000:.0f} ms)")
+
+
+class DictionaryApp(QWidget):
+    def __init__(self):
+        super().__init__()
+
+        self.setWindowTitle("Dictionary")
+        self.setGeometry(1210, 100, 200, 20)
+        self.title_bar_visible = True
+        self.always_on_top = False
+        self.table_window = None
+        self.lookup_service = LookupService(backend=GoogleTranslateBackend())
+        self.translation_cache = self.lookup_service.cache
+        self.dictionary_watcher = DictionaryWatcher(self)
+	
+        self.setWindowIcon(QIcon(os.path.join(APP_DIR, ICON_FILE)))
+
+        # --- 1. Katman: Şeffaf pencere ---
+        outer_layout = QVBoxLayout(self)
+        outer_layout.setSizeConstraint(QVBoxLayout.SetFixedSize)
+        outer_layout.setContentsMargins(0, 0, 0, 0)
+
+        # --- 2. Katman: Radius'lu içerik ---
+        self.content_widget = QWidget(self)
+        self.content_widget.setStyleSheet("""
+            background-color: #2E2E2E;
+            border-radius: 7px;
+        """)
+        outer_layout.addWidget(self.content_widget)
+
+        # --- Layoutlar ---
+        main_layout = QVBoxLayout(self.content_widget)
+        
+        input_layout = QVBoxLayout()
+
+        # --- Giriş kutusu (kelime) ---
+        self.english_entry = QLineEdit(self.content_widget)
+        self.english_entry.setPlaceholderText("Enter Word")
+        self.english_entry.setStyleSheet("""
+            font-size: 12pt;
+            padding: 5px;
+            border-radius: 5px;
+            border: 1px solid #FD7B01;
+            width: 120px;
+        """)
+        self.english_entry.textChanged.connect(self.reset_timer)
+
+        # --- Öneri listesi (yazım hatalı kelimeler için kayıtlı en yakın kelimeler) ---
+        self.suggestion_list = QListWidget(self.content_widget)
+        self.suggestion_list.setStyleSheet("""
+            font-size: 10pt;
+            color: #DDDDDD;
+            border: 1px solid #555555;
+            border-radius: 5px;
+        """)
+        self.suggestion_list.setFocusPolicy(Qt.NoFocus)
+        self.suggestion_list.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.suggestion_list.itemClicked.connect(self.apply_suggestion)
+        self.suggestion_list.hide()
+
+        # --- Çeviri kutusu ---
+        self.translation_entry = QLineEdit(self.content_widget)
+        self.translation_entry.setReadOnly(True)
+        self.translation_entry.setPlaceholderText("Meaning")
+        self.translation_entry.setStyleSheet("""
+            font-size: 12pt;
+            padding: 5px;
+            border-radius: 5px;
+            border: 1px solid #FF4031;
+            width: 120px;
+        """)
+
+        # --- Save Butonu ---
+        self.save_button = QPushButton("Save", self.content_widget)
+        self.save_button.setStyleSheet("""
+            font-size: 12pt;
+            padding: 5px;
+            border-radius: 5px;
+            background-color: #FF3510;
+            color: white;
+            width: 80px;
+            height: 24px;
+        """)
+        self.save_button.clicked.connect(self.save_to_json)
+
+        # --- Mod Değiştirici Buton ---
+        self.mode_button = QToolButton(self.content_widget)
+        self.mode_button.setText("EN")
+        self.mode_button.setStyleSheet("""
+            background-color: #FB9901;
+            border-radius: 5px;
+            font-size: 12pt;
+            padding: 5px;
+            width: 30px;
+            height: 21px;
+        """)
+        self.mode_button.clicked.connect(self.toggle_language_mode)
+        self.language = "en"
+
+        # --- Pin Butonu ---
+        self.pin_button = QToolButton(self.content_widget)
+        self.pin_button.setText("⚲")
+        self.pin_button.setStyleSheet("""
+            background-color: #FF4031;
+            border-radius: 5px;
+            font-size: 12pt;
+            padding: 5px;
+            width: 23px;
+            height: 22px;
+        """)
+        self.pin_button.clicked.connect(self.toggle_title_bar)
+
+        # --- Tablo Editör Butonu ---
+        self.table_button = QToolButton(self.content_widget)
+        self.table_button.setText("📄")
+        self.table_button.setStyleSheet("""
+            background-color: #4CAF50;
+            border-radius: 5px;
+            font-size: 12pt;
+            padding: 5px;
+            width: 23px;
+            height: 22px;
+        """)
+        self.table_button.clicked.connect(self.open_table_editor)
+
+        # --- Tekrar Butonu ---
+        self.review_button = QToolButton(self.content_widget)
+        self.review_button.setText("🎓")
+        self.review_button.setToolTip("Kelime tekrarı (Ctrl+Shift+R)")
+        self.review_button.setStyleSheet("""
+            background-color: #2196F3;
+            border-radius: 5px;
+            font-size: 12pt;
+            padding: 5px;
+            width: 23px;
+            height: 22px;
+        """)
+        self.review_button.clicked.connect(self.open_review_window)
+
+        # --- Layoutlara yerleştir ---
+        input_layout.addWidget(self.english_entry)
+        input_layout.addWidget(self.suggestion_list)
+        input_layout.addWidget(self.translation_entry)
+        
+        button_layout = QHBoxLayout()
+        button_layout.addWidget(self.save_button)
+        button_layout.addWidget(self.mode_button)
+        button_layout.addWidget(self.pin_button)
+        button_layout.addWidget(self.table_button)
+        button_layout.addWidget(self.review_button)
+
+        main_layout.addLayout(input_layout)
+        main_layout.addLayout(button_layout)
+
+        # Timer for debouncing (gecikme kullanıcının yazma temposundan öğrenilir)
+        self.cadence = TypingCadence.load(data_path("typing_cadence.json"))
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)  # Only run once after the timeout
+        self.timer.timeout.connect(self.translate_word)
+        self.last_keystroke = None
+        self.query_keystroke = None  # Ekrandaki sorgunun son tuş zamanı (sonuç gecikmesi için)
+
+        # Kısa duraksamalarda olası kelimeleri önceden çevir
+        self.prefetcher = SpeculativePrefetcher(self.lookup_service)
+        self.speculation_timer = QTimer(self)
+        self.speculation_timer.setSingleShot(True)
+        self.speculation_timer.timeout.connect(self.speculate)
+
+        # Performans paneli (Ctrl+Shift+P)
+        self.performance_window = None
+        QShortcut(QKeySequence("Ctrl+Shift+P"), self, self.open_performance_window)
+
+        # Tekrar modu (Ctrl+Shift+R); planlayıcılar dil başına bir kez yüklenir
+        self.review_window = None
+        self.review_schedulers = {}
+        QShortcut(QKeySequence("Ctrl+Shift+R"), self, self.open_review_window)
+
+        # Çeviriler arka planda yapılır, sonuçlar sinyalle geri gelir
+        self.translation_service = TranslationService(self, cache=self.translation_cache,
+                                                      backend=self.lookup_service.backend,
+                                                      prefetcher=self.prefetcher)
+        self.translation_service.translated.connect(self.on_translation_ready)
+        self.translation_service.failed.connect(self.on_translation_failed)
+
+    def reset_timer(self):
+        """Reset the timer every time the user types a new character"""
+        self.last_keystroke = time.perf_counter()
+        self.translation_entry.setPlaceholderText("Meaning")  # Önceki hata mesajını kaldır
+        self.translation_service.cancel()  # Uçuştaki eski kelimenin yanıtı artık gösterilmesin
+        self.cadence.keystroke(self.last_keystroke)
+        self.timer.start(round(self.cadence.delay() * 1000))
+        self.speculation_timer.start(round(self.cadence.speculation_delay() * 1000))
+
+    def speculate(self):
+        """Kullanıcı duraksadı: yazılan kelimeyi ağdan önceden çevirmeye başla"""
+        text = self.english_entry.text()
+        if not text.strip() or is_arabic_text(text):
+            return
+        with metrics.timer("translate.speculate"):
+            self.prefetcher.speculate(text, self.language)
+
+    def translate_word(self):
+        """Kelimeyi çevirmek için bu fonksiyonu kullan"""
+        self.speculation_timer.stop()
+        if self.english_entry.text().strip() == "":
+            self.translation_service.cancel()
+            self.translation_entry.clear()
+            self.show_suggestions([])
+            self.prefetcher.settle()
+            return
+
+        self.query_keystroke = self.last_keystroke
+        if self.last_keystroke is not None:
+            # Son tuştan aramaya kadar geçen süre (debounce beklemesi)
+            metrics.record("translate.debounce_wait", time.perf_counter() - self.last_keystroke)
+            self.last_keystroke = None
+
+        if is_arabic_text(self.english_entry.text()):
+            self.prefetcher.settle()
+            self.show_reverse_lookup(self.english_entry.text())
+            return
+
+        english_word = capitalize_word(self.english_entry.text(), self.language)
+        self.prefetcher.settle(english_word, self.language)
+
+        # Önce kayıtlı kelimelere, sonra çeviri önbelleğine bak; yalnızca ikisinde de yoksa ağa çık
+        with metrics.timer("translate.local"):
+            meaning, source = self.lookup_service.lookup_local(english_word, self.language)
+        with metrics.timer("translate.suggest"):
+            if source == 'dictionary':
+                self.show_suggestions([])
+            else:
+                self.show_suggestions(self.lookup_service.suggest(english_word, self.language))
+        if meaning is not None:
+            self.translation_service.cancel()
+            self.translation_entry.setText(meaning)
+            self.show_pivot(english_word if source == 'dictionary' else None)
+            self.record_result_latency()
+            return
+
+        self.show_pivot(None)
+        self.translation_service.request(english_word, self.language)
+
+    def show_reverse_lookup(self, arabic):
+        """Arapça girişte kayıtlı EN/TR karşılıkları ağa çıkmadan göster"""
+        self.translation_service.cancel()
+        self.show_suggestions([])
+        self.show_pivot(None)
+        with metrics.timer("translate.reverse"):
+            results = self.lookup_service.reverse_lookup(arabic)
+        self.translation_entry.setText(" | ".join(f"{language.upper()}: {', '.join(words)}"
+                                                  for language, words in results.items() if words))
+
+    def show_pivot(self, word):
+        """Kayıtlı kelimenin diğer dildeki karşılıklarını anlam kutusunun ipucunda göster"""
+        if word is None:
+            self.translation_entry.setToolTip("")
+            return
+        other = "tr" if self.language == "en" else "en"
+        matches = self.lookup_service.pivot(word, self.language, other)
+        self.translation_entry.setToolTip(f"{other.upper()}: {', '.join(matches)}" if matches else "")
+
+    def show_suggestions(self, suggestions):
+        """Kayıtlı benzer kelimeleri giriş kutusunun altında göster (boşsa gizle)"""
+        self.suggestion_list.clear()
+        words = [word for word, distance in suggestions if distance > 0]
+        if not words:
+            self.suggestion_list.hide()
+            return
+        self.suggestion_list.addItems(words)
+        self.suggestion_list.setFixedHeight(self.suggestion_list.sizeHintForRow(0) * len(words) + 4)
+        self.suggestion_list.show()
+
+    def set_input(self, text):
+        """Giriş kutusunu programdan değiştir; yazma temposuna ve zamanlayıcılara yansımaz"""
+        blocked = self.english_entry.blockSignals(True)
+        self.english_entry.setText(text)
+        self.english_entry.blockSignals(blocked)
+        self.timer.stop()
+        self.speculation_timer.stop()
+        self.last_keystroke = None  # Tuşa basılmadı; bekleme süresi ölçülmez
+        self.cadence.interrupt()
+
+    def apply_suggestion(self, item):
+        """Seçilen öneriyi giriş kutusuna yaz ve hemen ara"""
+        self.set_input(item.text())
+        self.translate_word()
+        self.english_entry.setFocus()
+
+    def near_duplicates(self, word):
+        """Kaydedilecek yeni kelimeye çok benzeyen kayıtlı kelimeler (ör. School / Schools)"""
+        if len(word) < 4:
+            return []
+        dictionary = self.local_dictionary(self.language)
+        max_distance = 1 if len(word) < 8 else 2
+        return [w for w, distance in dictionary.suggest(word, k=3, max_distance=max_distance) if distance > 0]
+
+    def on_translation_ready(self, word, arabic_word):
+        """Arka plandaki çeviri bittiğinde sonucu göster"""
+        if word != capitalize_word(self.english_entry.text(), self.language):
+            return  # Giriş bu arada değişti; eski kelimenin çevirisini gösterme
+        self.translation_entry.setText(arabic_word)
+        self.record_result_latency()
+
+    def record_result_latency(self):
+        """Son tuştan anlamın ekranda görünmesine kadar geçen süre"""
+        if self.query_keystroke is not None:
+            metrics.record("translate.result_latency", time.perf_counter() - self.query_keystroke)
+            self.query_keystroke = None
+
+    def on_translation_failed(self, word, error):
+        """Çeviri başarısız oldu: hatayı anlam kutusunda göster (giriş değiştiyse yok say)"""
+        if word != capitalize_word(self.english_entry.text(), self.language):
+            return
+        self.translation_entry.clear()
+        self.show_error(f"Çeviri hatası: {error}")
+
+    def show_error(self, message):
+        """Hatayı anlam kutusunun yer tutucusunda göster; bir sonraki tuşta kalkar"""
+        self.translation_entry.setPlaceholderText(message)
+        self.translation_entry.setToolTip(message)
+
+    def local_dictionary(self, language):
+        """Dilin sözlüğünü döndür (dil başına bir kez yüklenir, dosyaları izlenir)"""
+        store = self.lookup_service.dictionary(language)
+        self.dictionary_watcher.watch(store)
+        return store
+
+    def flush_dictionaries(self):
+        """Sözlük günlüklerini kanonik JSON dosyalarına işle, tekrar cevaplarını ve yazma temposunu kaydet (çıkışta çağrılır)"""
+        self.prefetcher.shutdown()
+        for scheduler in self.review_schedulers.values():
+            try:
+                scheduler.close()  # Kuyruktaki tekrar cevaplarını yaz
+            except Exception as e:
+                print(f"Tekrar durumu kaydedilemedi: {e}")
+        self.lookup_service.flush()
+        try:
+            self.cadence.save(data_path("typing_cadence.json"))
+        except OSError as e:
+            print(f"Yazma temposu kaydedilemedi: {e}")
+
+    def toggle_language_mode(self):
+        """Dil modunu değiştir ve buton görünümünü güncelle"""
+        if self.language == "en":
+            self.language = "tr"
+            self.mode_button.setText("TR")
+            self.mode_button.setStyleSheet("""
+                background-color: #B74135;
+                border-radius: 5px;
+                font-size: 12pt;
+                padding: 5px;
+                width: 30px;
+                height: 21px;
+            """)
+        else:
+            self.language = "en"
+            self.mode_button.setText("EN")
+            self.mode_button.setStyleSheet("""
+                background-color: #FB9901;
+                border-radius: 5px;
+                font-size: 12pt;
+                padding: 5px;
+                width: 30px;
+                height: 21px;
+            """)
+        self.translate_word()
+
+    def toggle_title_bar(self):
+        if self.always_on_top:
+            self.setWindowFlags(Qt.Window)
+            self.setAttribute(Qt.WA_TranslucentBackground, False)
+            self.setMask(QRegion())
+            self.always_on_top = False
+            self.content_widget.setStyleSheet("""
+            background-color: #2E2E2E;  /* Koyu gri */
+            border-radius: 7px;
+        """)
+        else:
+            self.move(self.x(), self.y() + 30)
+            self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
+            self.setAttribute(Qt.WA_TranslucentBackground, True)
+            self.always_on_top = True
+            self.apply_rounded_mask()  # Şekli kırparak uygula
+
+        self.setGeometry(self.x(), self.y(), self.width(), self.height())
+        self.show()
+
+    def apply_rounded_mask(self):
+        radius = 8
+        rect = self.rect()
+
+        path = QPainterPath()
+        path.addRoundedRect(rect, radius, radius)
+
+        region = QRegion(path.toFillPolygon().toPolygon())
+        self.setMask(region)
+
+    def save_to_json(self):
+        """Çevirilen kelimeyi JSON dosyasına kaydet"""
+        if self.english_entry.text() == "" or is_arabic_text(self.english_entry.text()):
+            return  # Arapça giriş ters aramadır, kaydedilecek kelime yok
+
+        english_word = capitalize_word(self.english_entry.text(), self.language)
+        arabic_word = self.translation_entry.text().strip()
+
+        with metrics.timer("save.read"):
+            exists = self.local_dictionary(self.language).lookup(english_word) is not None
+        with metrics.timer("save.scan"):
+            # Mevcut kelimenin güncellenmesinde benzer kelime uyarısı gösterilmez
+            similar = [] if exists else self.near_duplicates(english_word)
+        if similar:
+            answer = QMessageBox.question(
+                self, "Benzer kelime",
+                f"'{english_word}' kayıtlı kelimelere çok benziyor: {', '.join(similar)}.\nYine de kaydedilsin mi?")
+            if answer != QMessageBox.Yes:
+                return
+
+        try:
+            # Günlüğe tek satır eklenir; aynı kelime varsa güncellenir
+            with metrics.timer("save.write"):
+                self.local_dictionary(self.language).upsert(english_word, arabic_word)
+        except Exception as e:
+            # Girişler temizlenmez; kullanıcı sorunu giderip yeniden kaydedebilir
+            QMessageBox.critical(self, "Hata", f"Kelime kaydedilemedi: {e}")
+            return
+
+        # Girişleri temizle
+        self.set_input("")
+        self.english_entry.setFocus()
+        self.translation_entry.clear()
+        self.show_suggestions([])
+
+    def open_table_editor(self):
+        """Tablo editör penceresini aç"""
+        if self.table_window is None or not self.table_window.isVisible():
+            self.table_window = TableEditorWindow(self, self.language)
+            self.table_window.show()
+        else:
+            self.table_window.raise_()
+            self.table_window.activateWindow()
+
+    def open_review_window(self):
+        """Seçili dilin kelime tekrarı penceresini aç"""
+        if (self.review_window is None or not self.review_window.isVisible()
+                or self.review_window.language != self.language):
+            if self.review_window is not None:
+                self.review_window.close()
+            self.review_window = ReviewWindow(self, self.language)
+            self.review_window.show()
+        else:
+            self.review_window.raise_()
+            self.review_window.activateWindow()
+
+    def open_performance_window(self):
+        """Performans panelini aç"""
+        if self.performance_window is None:
+            self.performance_window = PerformanceWindow(self.prefetcher)
+        self.performance_window.show()
+        self.performance_window.raise_()
+        self.performance_window.activateWindow()
+
+    def closeEvent(self, event):
+        """Override the close event to hide the window instead of quitting the application"""
+        event.accept()  # Do not let the window close
+        self.hide()  # Hide the window
+
+if __name__ == "__main__":
+    # Uygulama başlatma (süreç havuzu işçileri bu modülü içe aktarırken pencere açılmaz)
+    startup = StartupTimer(_STARTUP_T0) if StartupTimer.enabled() else None
+    if startup is not None:
+        startup.mark("imports", _STARTUP_IMPORTS_DONE)
+
+    app = QApplication(sys.argv)
+    window = DictionaryApp()
+    app.aboutToQuit.connect(window.flush_dictionaries)
+    if startup is not None:
+        startup.mark("window created")
+        startup.watch_first_paint(window)
+
+    # Start the application
+    window.show()
+    QTimer.singleShot(0, lambda: threading.Thread(target=warm_up, args=(window, startup), daemon=True).start())
+    sys.exit(app.exec())
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from dictionary_core import LocalDictionary
+from dictionary_core.bulk import export_rows, import_rows, iter_file, plan_import
+
+
+def make_store(tmp_path, entries):
+    path = tmp_path / "dict_en.json"
+    path.write_text(json.dumps([{'word': w, 'meaning': m} for w, m in entries], ensure_ascii=False),
+                    encoding='utf-8')
+    store = LocalDictionary('en', str(path))
+    store.load()
+    return store
+
+
+def test_dictionary_conflict_keeps_newest_file_value(tmp_path):
+    store = make_store(tmp_path, [("Apple", "تفاحة")])
+    upserts, report = plan_import(store, [("apple", "تفاح"), ("APPLE", "ثمرة"), ("apple", "ثمرة")])
+    assert upserts == []
+    assert [(c.word, c.current, c.incoming, c.source) for c in report.conflicts] == \
+        [("Apple", "تفاحة", "ثمرة", 'dictionary')]
+    assert report.skipped == 1
+    assert report.accept_conflicts() == [("Apple", "ثمرة")]
+    assert (report.updated, report.unchanged, report.duplicates, report.skipped) == (1, 0, 1, 0)
+
+
+def test_replace_back_to_saved_meaning_leaves_no_conflict(tmp_path):
+    store = make_store(tmp_path, [("Apple", "تفاحة")])
+    upserts, report = plan_import(store, [("apple", "تفاح"), ("apple", "تفاحة")], on_conflict='replace')
+    assert upserts == [] and report.conflicts == []
+    assert (report.unchanged, report.skipped) == (1, 0)
+
+
+def test_file_conflicts_only_for_words_not_in_dictionary(tmp_path):
+    store = make_store(tmp_path, [("Apple", "تفاحة")])
+    upserts, report = plan_import(store, [("Pen", "قلم"), ("pen", "مرسم"), ("Apple", "تفاحة")])
+    assert upserts == [("Pen", "قلم")]
+    assert [(c.word, c.source) for c in report.conflicts] == [("pen", 'file')]
+
+    upserts, report = plan_import(store, [("Pen", "قلم"), ("pen", "مرسم"), ("Apple", "ثمرة")],
+                                  on_conflict='replace')
+    assert sorted(upserts) == [("Apple", "ثمرة"), ("Pen", "مرسم")]
+
+
+def test_import_is_one_journal_line_and_round_trips(tmp_path):
+    store = make_store(tmp_path, [("Apple", "تفاحة"), ("Empty", "")])
+    report = import_rows(store, [("Book", "كتاب"), ("empty", "فارغ"), ("Cat", "")])
+    assert (report.added, report.updated) == (2, 1)
+    with open(store.journal_file, encoding='utf-8') as f:
+        assert len(f.readlines()) == 1
+
+    out = tmp_path / "out.txt"
+    assert export_rows(store.iter_rows(), str(out), 'anki') == 4
+    assert list(iter_file(str(out))) == [("Apple", "تفاحة"), ("Empty", "فارغ"), ("Book", "كتاب"), ("Cat", "")]
+
+
+def test_malformed_anki_header_is_a_row_error(tmp_path):
+    path = tmp_path / "deck.txt"
+    path.write_text("#separator:tab\n#tags column:last\nApple\tتفاحة\n", encoding='utf-8')
+    with pytest.raises(ValueError, match="deck.txt:2: geçersiz başlık"):
+        list(iter_file(str(path)))
@@ -0,0 +1,71 @@
+import threading
+import time
+
+from dictionary_core import TranslationCache
+
+
+def test_hits_and_misses_are_counted(tmp_path):
+    cache = TranslationCache(str(tmp_path / "cache.sqlite3"))
+    cache.put("Apple", "تفاحة", src='en')
+    assert cache.get("apple", src='en') == "تفاحة"
+    assert cache.get("Pen", src='en') is None
+    assert cache.get("Apple", src='tr') is None
+    assert cache.peek("Apple", src='en') == "تفاحة"
+    assert cache.stats() == {'hits': 1, 'misses': 2, 'entries': 1, 'error': None}
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, monkeypatch):
+    monkeypatch.setattr(TranslationCache, 'EVICT_EVERY', 1)
+    cache = TranslationCache(str(tmp_path / "cache.sqlite3"), max_entries=2)
+    now = [1000.0]
+    monkeypatch.setattr(time, 'time', lambda: now[0])
+    for word in ("One", "Two"):
+        now[0] += 1
+        cache.put(word, word.lower(), src='en')
+    now[0] += 1
+    cache.get("One", src='en')  # "Two" artık en eski kullanılan
+    now[0] += 1
+    cache.put("Three", "three", src='en')
+    assert [cache.peek(word, src='en') for word in ("One", "Two", "Three")] == ["one", None, "three"]
+
+
+def test_expired_entries_are_ignored(tmp_path, monkeypatch):
+    cache = TranslationCache(str(tmp_path / "cache.sqlite3"), ttl=60)
+    now = [1000.0]
+    monkeypatch.setattr(time, 'time', lambda: now[0])
+    cache.put("Apple", "تفاحة", src='en')
+    now[0] += 30
+    assert cache.get("Apple", src='en') == "تفاحة"
+    now[0] += 60
+    assert cache.get("Apple", src='en') is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_counters_are_exact_under_threads(tmp_path):
+    cache = TranslationCache(str(tmp_path / "cache.sqlite3"))
+    cache.put("Apple", "تفاحة", src='en')
+
+    def work():
+        for i in range(200):
+            cache.get("Apple" if i % 2 else "Pen", src='en')
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert (cache.hits, cache.misses) == (400, 400)
+
+
+def test_database_error_disables_cache_only_for_a_while(tmp_path):
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    cache = TranslationCache(str(blocker / "cache.sqlite3"))  # Klasör yerine dosya: bağlanılamaz
+    assert cache.get("Apple", src='en') is None
+    assert cache.stats()['error'] is not None
+    cache.path = str(tmp_path / "cache.sqlite3")
+    cache.put("Apple", "تفاحة", src='en')
+    assert cache.peek("Apple", src='en') is None  # Hâlâ bekleme süresinde
+    cache._disabled_until = 0.0  # Bekleme süresi doldu
+    cache.put("Apple", "تفاحة", src='en')
+    assert cache.peek("Apple", src='en') == "تفاحة"
@@ -0,0 +1,13 @@
+from dictionary_core.cadence import TypingCadence
+
+
+def test_interrupt_keeps_the_gap_out_of_the_average():
+    cadence = TypingCadence()
+    for now in (0.0, 0.1, 0.2):
+        cadence.keystroke(now)
+    mean, samples = cadence.mean, cadence.samples
+    cadence.interrupt()
+    cadence.keystroke(0.9)  # Duraklama eşiğinin altında, ama yazım dizisi kesildi
+    assert (cadence.mean, cadence.samples) == (mean, samples)
+    cadence.keystroke(1.0)
+    assert cadence.samples == samples + 1
@@ -0,0 +1,28 @@
+from dictionary_core import FuzzyIndex, edit_distance
+
+
+def test_edit_distance_counts_transpositions_and_caps_at_limit():
+    assert edit_distance("school", "scohol", 2) == 1
+    assert edit_distance("school", "schol", 2) == 1
+    assert edit_distance("school", "pen", 2) == 3
+
+
+def test_suggestions_use_turkish_folding():
+    index = FuzzyIndex('tr')
+    for word in ("İstanbul", "Işık", "Ilık", "Kitap", "Kitaplar"):
+        index.add(word)
+    assert index.suggest("istanbul") == [("İstanbul", 0)]
+    assert index.suggest("istanbl") == [("İstanbul", 1)]
+    assert index.suggest("ışik")[0] == ("Işık", 1)
+    assert index.suggest("kitaplaar", k=1) == [("Kitaplar", 1)]
+    assert index.suggest("IŞIK", max_distance=0) == [("Işık", 0)]  # I -> ı
+
+
+def test_nearest_first_and_removal():
+    index = FuzzyIndex('en')
+    for word in ("School", "Schools", "Scholar"):
+        index.add(word)
+    assert index.suggest("schooll") == [("Schools", 1), ("School", 1)]  # Eşit uzaklıkta boyu yakın olan önce
+    index.remove("Schools")
+    assert index.suggest("schooll") == [("School", 1)]
+    assert len(index) == 2
@@ -0,0 +1,33 @@
+from dictionary_core import FakeTranslatorBackend, LookupService, arabic_terms
+
+
+def make_service(tmp_path):
+    service = LookupService(str(tmp_path), backend=FakeTranslatorBackend())
+    service.dictionary('en').apply([("School", "مَدْرَسَة"), ("Pen", "قلم، مرسم"), ("Book", "كتاب")])
+    service.dictionary('tr').apply([("Okul", "مدرسة"), ("Kalem", "قلم")])
+    return service
+
+
+def test_arabic_terms_split_and_normalize():
+    assert arabic_terms("قلمٌ، مرسم") == ("قلم، مرسم", "قلم", "مرسم")
+    assert arabic_terms("  ") == ()
+
+
+def test_reverse_lookup_ignores_harakat_and_matches_parts(tmp_path):
+    lexicon = make_service(tmp_path).lexicon
+    assert lexicon.reverse("مدرسة") == {'en': ["School"], 'tr': ["Okul"]}
+    assert lexicon.reverse("مرسم") == {'en': ["Pen"], 'tr': []}
+    assert lexicon.reverse("سيارة") == {'en': [], 'tr': []}
+
+
+def test_pivot_and_entry_follow_later_edits(tmp_path):
+    service = make_service(tmp_path)
+    lexicon = service.lexicon
+    assert lexicon.pivot("school", 'en', 'tr') == ["Okul"]
+    assert lexicon.pivot("Pen", 'en', 'tr') == ["Kalem"]
+    assert lexicon.pivot("Book", 'en', 'tr') == []
+    service.dictionary('tr').upsert("Kitap", "كتاب")
+    service.dictionary('tr').delete("Okul")
+    assert lexicon.entry("book", 'en') == {'ar': "كتاب", 'en': ["Book"], 'tr': ["Kitap"]}
+    assert lexicon.pivot("School", 'en', 'tr') == []
+    assert lexicon.entry("Car", 'en') is None
@@ -0,0 +1,22 @@
+from dictionary_core import FakeTranslatorBackend, LookupService
+
+
+def make_service(tmp_path):
+    service = LookupService(str(tmp_path), backend=FakeTranslatorBackend({"Pen": "قلم"}))
+    service.dictionary('en').upsert("Apple", "تفاحة")
+    return service
+
+
+def test_saved_words_never_reach_the_backend(tmp_path):
+    service = make_service(tmp_path)
+    assert service.lookup("apple", 'en') == ("تفاحة", 'dictionary')
+    assert service.lookup_local("APPLE", 'en') == ("تفاحة", 'dictionary')
+    assert service.backend.calls == 0
+
+
+def test_remote_answers_are_cached_for_the_next_lookup(tmp_path):
+    service = make_service(tmp_path)
+    assert service.lookup_local("Pen", 'en') == (None, None)
+    assert service.lookup("Pen", 'en') == ("قلم", 'remote')
+    assert service.lookup("pen", 'en') == ("قلم", 'cache')
+    assert service.backend.calls == 1
@@ -0,0 +1,24 @@
+import pytest
+
+from dictionary_core.pdf_export import REPORTLAB_AVAILABLE, ExportCancelled, build_dictionary_pdf
+
+pytestmark = pytest.mark.skipif(not REPORTLAB_AVAILABLE, reason="reportlab/arabic-reshaper/python-bidi yok")
+
+ROWS = [(f"Word{i}", "كلمة") for i in range(300)]
+
+
+def test_export_writes_a_pdf(tmp_path):
+    path = tmp_path / "out.pdf"
+    done = []
+    build_dictionary_pdf(str(path), 'en', iter(ROWS), progress=done.append)
+    assert path.read_bytes().startswith(b"%PDF") and done[-1] == len(ROWS)
+    assert [p.name for p in tmp_path.iterdir()] == ["out.pdf"]
+
+
+def test_cancel_keeps_the_existing_file(tmp_path):
+    path = tmp_path / "out.pdf"
+    path.write_bytes(b"previous export")
+    with pytest.raises(ExportCancelled):
+        build_dictionary_pdf(str(path), 'en', iter(ROWS), progress=lambda done: None, is_cancelled=lambda: True)
+    assert path.read_bytes() == b"previous export"
+    assert [p.name for p in tmp_path.iterdir()] == ["out.pdf"]  # Geçici dosya kalmadı
@@ -0,0 +1,40 @@
+from dictionary_core import FakeTranslatorBackend, LookupService, SpeculativePrefetcher
+
+
+def make_prefetcher(tmp_path, **kwargs):
+    service = LookupService(str(tmp_path), backend=FakeTranslatorBackend(latency=0.01))
+    service.dictionary('en').upsert("Apple", "تفاحة")
+    return SpeculativePrefetcher(service, enabled=True, **kwargs)
+
+
+def test_speculation_fetches_once_without_touching_cache_counters(tmp_path):
+    prefetcher = make_prefetcher(tmp_path)
+    cache = prefetcher.service.cache
+    prefetcher.speculate("school", 'en').result()
+    prefetcher._executor.shutdown(wait=True)  # Aday seçiminin başlattığı çeviriyi bekle
+    assert prefetcher.service.backend.calls == 1
+    assert cache.peek("School", src='en') == "ar:School"
+    assert (cache.hits, cache.misses) == (0, 0)
+    assert prefetcher.stats()['requested'] == 1
+
+
+def test_known_words_and_prefixes_are_not_fetched(tmp_path):
+    prefetcher = make_prefetcher(tmp_path)
+    cache = prefetcher.service.cache
+    cache.put("Schoolbag", "حقيبة", src='en')
+    assert prefetcher.candidate("apple", 'en') is None  # Sözlükte kayıtlı
+    assert prefetcher.candidate("App", 'en') is None  # Kayıtlı kelimenin öneki
+    assert prefetcher.candidate("school", 'en') is None  # Geçmişteki kelimenin öneki
+    assert prefetcher.candidate("pe", 'en') is None  # Çok kısa
+    assert prefetcher.candidate("pencil", 'en') == "Pencil"
+    assert (cache.hits, cache.misses) == (0, 0)
+    prefetcher.shutdown()
+
+
+def test_settle_discards_planning_from_previous_burst(tmp_path):
+    prefetcher = make_prefetcher(tmp_path)
+    prefetcher._generation += 1  # settle, aday seçimi sırada beklerken çağrılmış gibi
+    prefetcher._plan("school", 'en', 0)
+    assert prefetcher.pending("School", 'en') is None
+    assert prefetcher.service.backend.calls == 0
+    prefetcher.shutdown()
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from dictionary_core import LocalDictionary, ReviewScheduler, ReviewState, ReviewStore, sm2
+from dictionary_core.review import DAY, MIN_EASE, RELEARN_DELAY
+
+NOW = 1_000_000.0
+
+
+def make_scheduler(tmp_path, words, new_per_session=20):
+    path = tmp_path / "dict_en.json"
+    path.write_text(json.dumps([{'word': w, 'meaning': f"m{i}"} for i, w in enumerate(words)]), encoding='utf-8')
+    store = LocalDictionary('en', str(path))
+    store.load()
+    return ReviewScheduler(store, ReviewStore('en', str(tmp_path / "review_en.sqlite3")), new_per_session)
+
+
+def test_sm2_intervals_grow_and_reset_on_failure():
+    state = sm2(None, 4, NOW)
+    assert (state.repetitions, state.interval, state.due) == (1, 1.0, NOW + DAY)
+    state = sm2(state, 4, NOW)
+    assert (state.repetitions, state.interval) == (2, 6.0)
+    state = sm2(state, 5, NOW)
+    assert state.interval == round(6.0 * state.ease, 2) and state.ease == pytest.approx(2.6)
+    failed = sm2(state, 1, NOW)
+    assert (failed.repetitions, failed.interval, failed.due) == (0, 0.0, NOW + RELEARN_DELAY)
+    assert sm2(ReviewState(3, 10.0, MIN_EASE, NOW), 0, NOW).ease == MIN_EASE
+
+
+def test_due_cards_come_first_then_new_cards_up_to_the_limit(tmp_path):
+    scheduler = make_scheduler(tmp_path, ["Apple", "Book", "Car", "Door"], new_per_session=2)
+    first = scheduler.next_card(NOW)
+    assert (first.word, first.new) == ("Apple", True)
+    scheduler.answer(first, 1, NOW)  # RELEARN_DELAY sonra yeniden sorulur
+    assert scheduler.next_card(NOW).word == "Book"
+    scheduler.answer(scheduler.next_card(NOW), 5, NOW)
+    assert scheduler.next_card(NOW) is None  # Yeni kart hakkı bitti
+    assert scheduler.next_due() == NOW + RELEARN_DELAY
+    later = NOW + RELEARN_DELAY
+    assert scheduler.due_count(later) == 1
+    again = scheduler.next_card(later)
+    assert (again.word, again.new) == ("Apple", False)
+    scheduler.close()
+
+
+def test_start_session_renews_new_card_limit(tmp_path):
+    scheduler = make_scheduler(tmp_path, ["Apple", "Book", "Car"], new_per_session=1)
+    scheduler.answer(scheduler.next_card(NOW), 4, NOW)
+    assert scheduler.next_card(NOW) is None
+    scheduler.start_session()
+    assert scheduler.next_card(NOW).word == "Book"
+    scheduler.close()
+
+
+def test_answers_persist_across_schedulers(tmp_path):
+    scheduler = make_scheduler(tmp_path, ["Apple", "Book"])
+    state = scheduler.answer(scheduler.next_card(NOW), 4, NOW)
+    scheduler.close()
+    reopened = make_scheduler(tmp_path, ["Apple", "Book"])
+    assert reopened.states == {"apple": ReviewState(1, 1.0, state.ease, int(state.due))}
+    assert reopened.next_card(NOW).word == "Book"
+    reopened.close()
@@ -0,0 +1,33 @@
+from dictionary_core import SearchIndex
+
+
+def make_index():
+    index = SearchIndex('en')
+    for slot, (word, meaning) in enumerate([("School", "مَدْرَسَة"), ("Schoolbag", "حقيبة"), ("Pen", "قلم")]):
+        index.add(slot, word, meaning)
+    return index
+
+
+def test_trigram_search_matches_substrings_in_both_columns():
+    index = make_index()
+    assert index.search("hoo") == {0, 1}
+    assert index.search("OOLB") == {1}
+    assert index.search("مدرسة") == {0}  # Harekeler yok sayılır
+    assert index.search("xyz") == set()
+
+
+def test_short_queries_match_word_prefixes():
+    index = make_index()
+    assert index.search("s") == {0, 1}
+    assert index.search("pe") == {2}
+    assert index.search("ch") == set()  # Önek değil
+    assert index.matches(2, "p") and not index.matches(0, "p")
+
+
+def test_updates_and_removals_are_incremental():
+    index = make_index()
+    index.update(2, "Pencil", "قلم رصاص")
+    assert index.search("ncil") == {2} and index.search("رصاص") == {2}
+    index.remove(0)
+    assert index.search("school") == {1}
+    assert not index.matches(0, "school")
@@ -0,0 +1,107 @@
+import asyncio
+import json
+
+import pytest
+
+from dictionary_core import FakeTranslatorBackend, LookupService
+from dictionary_core.server import HttpError, LookupServer
+
+
+class ShortBatchBackend(FakeTranslatorBackend):
+    """Toplu çağrıda son kelimenin sonucunu düşüren arka uç"""
+
+    def translate_batch(self, texts, src, dest='ar'):
+        return super().translate_batch(texts, src, dest)[:-1]
+
+
+def run(server, coroutine):
+    async def main():
+        try:
+            return await asyncio.wait_for(coroutine, timeout=5)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+def make_server(tmp_path, backend):
+    service = LookupService(str(tmp_path), backend=backend)
+    return LookupServer(service, port=0)
+
+
+def test_concurrent_lookups_share_one_upstream_call(tmp_path):
+    backend = FakeTranslatorBackend({"Apple": "تفاحة"}, latency=0.05)
+    server = make_server(tmp_path, backend)
+
+    async def lookups():
+        return await asyncio.gather(*(server.lookup_many(["Apple"], 'en') for _ in range(5)))
+
+    results = run(server, lookups())
+    assert [r[0]['meaning'] for r in results] == ["تفاحة"] * 5
+    assert backend.calls == 1
+    assert server.coalesced == 4 and not server._in_flight
+    assert server.service.lookup_local("Apple", 'en') == ("تفاحة", 'cache')
+
+
+@pytest.mark.parametrize("body", [b"[]", b'"apple"', b"not json"])
+def test_batch_rejects_non_object_body(tmp_path, body):
+    server = make_server(tmp_path, FakeTranslatorBackend())
+    with pytest.raises(HttpError) as error:
+        run(server, server._dispatch("POST", "/lookup/batch", {}, body))
+    assert error.value.status == 400
+
+
+def test_short_batch_reply_fails_instead_of_hanging(tmp_path):
+    server = make_server(tmp_path, ShortBatchBackend())
+    body = json.dumps({'words': ["Apple", "Pen"], 'lang': 'en'}).encode()
+    payload = run(server, server._dispatch("POST", "/lookup/batch", {}, body))
+    assert all(result['meaning'] is None and 'error' in result for result in payload['results'])
+    assert server.upstream_errors == 1 and not server._in_flight
+    assert server.service.lookup_local("Apple", 'en') == (None, None)
+
+
+def test_upstream_failure_is_reported_as_bad_gateway(tmp_path):
+    server = make_server(tmp_path, FakeTranslatorBackend(fail_first=1))
+    with pytest.raises(HttpError) as error:
+        run(server, server._dispatch("GET", "/lookup", {'word': "apple"}, b""))
+    assert error.value.status == 502 and not server._in_flight
+
+
+@pytest.mark.parametrize("field, value", [('dest', ["ar"]), ('dest', {}), ('offline', "false"), ('offline', 1)])
+def test_batch_rejects_bad_dest_and_offline(tmp_path, field, value):
+    server = make_server(tmp_path, FakeTranslatorBackend())
+    body = json.dumps({'words': ["Apple"], field: value}).encode()
+    with pytest.raises(HttpError) as error:
+        run(server, server._dispatch("POST", "/lookup/batch", {}, body))
+    assert error.value.status == 400 and server.service.backend.calls == 0
+
+
+def test_upstream_tasks_are_tracked_until_done(tmp_path):
+    server = make_server(tmp_path, FakeTranslatorBackend(latency=0.02))
+
+    async def lookup():
+        pending = asyncio.ensure_future(server.lookup_many(["Apple"], 'en'))
+        await asyncio.sleep(0.01)
+        assert len(server._upstream_tasks) == 1
+        await pending
+        await asyncio.sleep(0)
+        return server.stats(await server._run_local(server.service.cache.stats))
+
+    stats = run(server, lookup())
+    assert not server._upstream_tasks
+    assert stats['upstream']['calls'] == 1 and stats['cache']['entries'] == 1
+
+
+def test_overlong_request_line_gets_an_error_response(tmp_path):
+    server = make_server(tmp_path, FakeTranslatorBackend())
+
+    async def request():
+        await server.start()
+        reader, writer = await asyncio.open_connection(server.host, server.port)
+        writer.write(b"GET /lookup?word=" + b"a" * (1 << 17) + b" HTTP/1.1\r\n\r\n")
+        await writer.drain()
+        status = await reader.readline()
+        writer.close()
+        return status
+
+    assert run(server, request()).startswith(b"HTTP/1.1 400")
@@ -0,0 +1,45 @@
+import json
+
+import pytest
+
+from dictionary_core import SSTable, SSTableError, json_to_sstable, sstable_to_json, write_sstable
+
+ENTRIES = [
+    {'word': "Pen", 'meaning': "قلم"},
+    {'word': "Apple", 'meaning': "تفاحة", 'tags': ["fruit"]},
+    {'word': "apple", 'meaning': "ثمرة"},  # Aynı anahtar: ilk kayıt geçerli
+    {'word': "Empty", 'meaning': " "},
+    {'word': "Applet", 'meaning': "بريمج"},
+]
+
+
+def test_lookup_and_missing_keys(tmp_path):
+    path = str(tmp_path / "dict_en.sst")
+    assert write_sstable(path, ENTRIES, 'en') == 5
+    with SSTable(path) as table:
+        assert (len(table), table.language) == (5, 'en')
+        assert table.lookup("APPLE") == "تفاحة"
+        assert table.get("apple") == {'word': "Apple", 'meaning': "تفاحة", 'tags': ["fruit"]}
+        assert table.lookup("Empty") is None
+        assert table.get("Banana") is None and table.get("") is None and table.get("Zzz") is None
+        assert [entry['word'] for entry in table.iter_prefix("app")] == ["Apple", "apple", "Applet"]
+
+
+def test_json_round_trip_keeps_order_and_extra_fields(tmp_path):
+    source, table, back = (str(tmp_path / name) for name in ("dict_en.json", "dict_en.sst", "back.json"))
+    with open(source, 'w', encoding='utf-8') as f:
+        json.dump(ENTRIES, f, ensure_ascii=False)
+    assert json_to_sstable(source, table, 'en') == 5
+    assert sstable_to_json(table, back) == 5
+    with open(back, encoding='utf-8') as f:
+        assert json.load(f) == ENTRIES
+
+
+def test_rejects_files_that_are_not_sstables(tmp_path):
+    path = tmp_path / "dict_en.json"
+    path.write_text(json.dumps(ENTRIES))
+    with pytest.raises(SSTableError):
+        SSTable(str(path))
+    (tmp_path / "empty.sst").write_bytes(b"")
+    with pytest.raises(SSTableError):
+        SSTable(str(tmp_path / "empty.sst"))
@@ -0,0 +1,109 @@
+import json
+import os
+
+import pytest
+
+from dictionary_core import LocalDictionary
+
+
+def make_store(tmp_path, entries=()):
+    path = tmp_path / "dict_en.json"
+    path.write_text(json.dumps([{'word': w, 'meaning': m} for w, m in entries], ensure_ascii=False),
+                    encoding='utf-8')
+    store = LocalDictionary('en', str(path))
+    store.load()
+    return store
+
+
+def reopen(store):
+    other = LocalDictionary(store.language, store.json_file)
+    other.load()
+    return other
+
+
+def journal_lines(store):
+    if not os.path.exists(store.journal_file):
+        return []
+    with open(store.journal_file, 'rb') as f:
+        return f.read().splitlines()
+
+
+def test_saves_go_to_journal_and_replay_on_load(tmp_path):
+    store = make_store(tmp_path, [("Apple", "تفاحة"), ("Pen", "قلم")])
+    canonical = (tmp_path / "dict_en.json").read_bytes()
+    store.upsert("School", "مدرسة")
+    store.upsert("apple", "تفاح")
+    store.delete("Pen")
+    assert (tmp_path / "dict_en.json").read_bytes() == canonical
+    assert len(journal_lines(store)) == 3
+    reloaded = reopen(store)
+    assert reloaded.entries() == [{'word': "apple", 'meaning': "تفاح"}, {'word': "School", 'meaning': "مدرسة"}]
+
+
+def test_torn_tail_line_is_dropped(tmp_path):
+    store = make_store(tmp_path, [("Apple", "تفاحة")])
+    store.apply([("Pen", "قلم"), ("Book", "كتاب")])
+    assert len(journal_lines(store)) == 1  # Grup tek satırda
+    with open(store.journal_file, 'ab') as f:
+        f.write(b'{"op": "batch", "ops": [{"op": "put", "word": "Half", "mea')
+    reloaded = reopen(store)
+    assert reloaded.lookup("Book") == "كتاب" and reloaded.lookup("Half") is None
+    reloaded.upsert("Car", "سيارة")
+    assert [json.loads(line)['word'] for line in journal_lines(reloaded)[1:]] == ["Car"]
+    assert reopen(store).lookup("Car") == "سيارة"
+
+
+def test_compact_folds_journal_into_canonical_file(tmp_path):
+    store = make_store(tmp_path, [("Apple", "تفاحة"), ("Pen", "قلم")])
+    store.upsert("School", "مدرسة")
+    store.delete("Apple")
+    store.compact()
+    assert journal_lines(store) == []
+    with open(store.json_file, encoding='utf-8') as f:
+        assert json.load(f) == [{'word': "Pen", 'meaning': "قلم"}, {'word': "School", 'meaning': "مدرسة"}]
+    assert reopen(store).entries() == store.entries()
+
+
+def test_instances_see_each_others_writes_and_compaction(tmp_path):
+    first = make_store(tmp_path, [("Apple", "تفاحة")])
+    second = reopen(first)
+    seen = []
+    second.add_listener(seen.append)
+
+    first.upsert("Pen", "قلم")
+    assert second.refresh() == [("Pen", "قلم")] and seen == [[("Pen", "قلم")]]
+
+    first.compact()
+    second.upsert("Book", "كتاب")  # Sıkıştırmayı fark edip dosyaları yeniden okur
+    assert seen[-2] is None
+    assert first.refresh() == [("Book", "كتاب")]
+    assert first.entries() == second.entries() == reopen(first).entries()
+
+
+def test_compact_without_file_or_journal_writes_nothing(tmp_path):
+    store = LocalDictionary('tr', str(tmp_path / "dict_tr.json"))
+    assert store.lookup("Okul") is None
+    store.compact()
+    assert not os.path.exists(store.json_file)
+    store.compact(create=True)
+    with open(store.json_file, encoding='utf-8') as f:
+        assert json.load(f) == []
+
+
+def test_invalid_entries_are_skipped(tmp_path, capsys):
+    path = tmp_path / "dict_en.json"
+    path.write_text(json.dumps([{'word': "Apple", 'meaning': "تفاحة"}, "Pen", None, {'word': 3}]), encoding='utf-8')
+    store = LocalDictionary('en', str(path))
+    store.load()
+    assert store.entries() == [{'word': "Apple", 'meaning': "تفاحة"}]
+    assert "3 geçersiz kayıt" in capsys.readouterr().out
+
+
+def test_non_list_file_is_a_load_error_and_is_not_overwritten(tmp_path):
+    path = tmp_path / "dict_en.json"
+    path.write_text('{"Apple": "تفاحة"}', encoding='utf-8')
+    store = LocalDictionary('en', str(path))
+    with pytest.raises(ValueError):
+        store.load()
+    store.compact()
+    assert path.read_text(encoding='utf-8') == '{"Apple": "تفاحة"}'
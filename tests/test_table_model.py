@@ -0,0 +1,87 @@
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+
+from final import DictionaryTableModel  # noqa: E402
+
+ENTRIES = [{'word': "Apple", 'meaning': "تفاحة"}, {'word': "Book", 'meaning': "كتاب"},
+           {'word': "Pen", 'meaning': "قلم"}]
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def model(app):
+    model = DictionaryTableModel(["Word", "Meaning"], 'en')
+    model.load(ENTRIES)
+    return model
+
+
+def test_edits_are_tracked_per_slot(model):
+    model.setData(model.index(0, 1), "ثمرة")
+    model.append_row("Car", "سيارة")
+    model.remove_row(2)
+    assert list(model.rows()) == [("Apple", "ثمرة"), ("Book", "كتاب"), ("Car", "سيارة")]
+    assert model.pending_changes() == ([("Apple", "ثمرة"), ("Car", "سيارة")], ["Pen"])
+
+
+def test_filter_hides_rows_without_losing_edits(model):
+    model.set_filter("ook")
+    assert list(model.rows()) == [("Book", "كتاب")]
+    model.setData(model.index(0, 1), "دفتر")
+    model.set_filter("")
+    assert model.rowCount() == 3
+    assert model.pending_changes() == ([("Book", "دفتر")], [])
+
+
+def test_merge_external_updates_clean_rows_and_flags_conflicts(model):
+    model.setData(model.index(1, 1), "دفتر")
+    model.merge_external([("Apple", "تفاح"), ("Book", "مجلد"), ("Pen", None), ("Car", "سيارة")])
+    assert list(model.rows()) == [("Apple", "تفاح"), ("Book", "دفتر"), ("Car", "سيارة")]
+    assert model.conflicts == {"book": "Book"}
+    assert model.pending_changes() == ([("Book", "دفتر")], [])  # Dışarıdan gelenler kirli sayılmaz
+
+
+def test_merge_external_matching_local_edit_is_not_a_conflict(model):
+    model.setData(model.index(0, 1), "ثمرة")
+    model.merge_external([("Apple", "ثمرة")])
+    assert model.conflicts == {}
+
+
+def test_mark_saved_keeps_rows_edited_during_the_write(model):
+    model.setData(model.index(0, 0), "Apples")  # Yeniden adlandırma
+    model.setData(model.index(1, 1), "دفتر")
+    upserts, deletes, state = model.snapshot_changes()
+    assert (upserts, deletes) == ([("Apples", "تفاحة"), ("Book", "دفتر")], ["Apple"])
+    model.setData(model.index(1, 1), "مجلد")  # Yazma sürerken yeniden düzenlendi
+    model.mark_saved(state)
+    assert model.pending_changes() == ([("Book", "مجلد")], [])
+    model.setData(model.index(0, 0), "Apple")  # Diskteki ad artık "Apples"
+    assert model.pending_changes()[1] == ["Apples"]
+
+
+def test_snapshot_skips_words_and_echo_of_own_write_is_not_a_conflict(model):
+    model.setData(model.index(0, 1), "ثمرة")
+    model.setData(model.index(1, 1), "دفتر")
+    upserts, deletes, state = model.snapshot_changes(skip={"book"})
+    assert (upserts, deletes) == ([("Apple", "ثمرة")], [])
+    model.setData(model.index(0, 1), "تفاح")
+    model.merge_external([("Apple", "ثمرة")])  # Kendi yazmamızın bildirimi
+    assert model.conflicts == {}
+    model.mark_saved(state)
+    assert model.is_dirty()
+    assert model.pending_changes() == ([("Apple", "تفاح"), ("Book", "دفتر")], [])
+
+
+def test_row_deleted_during_the_write_deletes_the_new_disk_word(model):
+    model.setData(model.index(2, 0), "Pencil")
+    upserts, deletes, state = model.snapshot_changes()
+    model.remove_row(2)
+    model.mark_saved(state)
+    assert model.pending_changes() == ([], ["Pencil"])
@@ -0,0 +1,36 @@
+import threading
+
+import pytest
+
+from dictionary_core import BatchCancelled, BatchTranslator, FakeTranslatorBackend
+
+
+def test_translate_all_uses_backend_and_dedupes():
+    backend = FakeTranslatorBackend({"Apple": "تفاحة"})
+    translator = BatchTranslator(backend, batch_size=2, rate=1000)
+    results, failures = translator.translate_all(["Apple", "apple", "Pen"], "en")
+    assert results == {"Apple": "تفاحة", "apple": "تفاحة", "Pen": "ar:Pen"}
+    assert failures == {}
+
+
+def test_translate_all_retries_failed_batch():
+    backend = FakeTranslatorBackend(fail_first=1)
+    translator = BatchTranslator(backend, max_workers=1, rate=1000, retries=1, backoff=0)
+    results, failures = translator.translate_all(["Pen"], "en")
+    assert results == {"Pen": "ar:Pen"} and failures == {}
+    assert backend.calls == 2
+
+
+def test_cancel_raises_instead_of_returning_partial_results():
+    backend = FakeTranslatorBackend(latency=0.02)
+    translator = BatchTranslator(backend, batch_size=1, max_workers=2, rate=1000)
+    cancelled = threading.Event()
+
+    def progress(done, total):
+        if done >= 2:
+            cancelled.set()
+
+    with pytest.raises(BatchCancelled):
+        translator.translate_all([f"Word{i}" for i in range(20)], "en", progress=progress,
+                                 is_cancelled=cancelled.is_set)
+    assert backend.calls < 20